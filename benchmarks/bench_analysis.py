@@ -0,0 +1,31 @@
+"""
+Benchmarks of the transforms of :py:mod:`yodel.analysis`.
+"""
+
+import yodel.analysis
+
+
+def bench_dft(samplerate, blocksize):
+    if blocksize > 1024:
+        return None
+    dft = yodel.analysis.DFT(blocksize)
+    imag = [0.0] * blocksize
+
+    def process(input_signal, output_signal):
+        dft.forward(input_signal, output_signal, imag)
+    return process
+
+
+def bench_fft(samplerate, blocksize):
+    fft = yodel.analysis.FFT(blocksize)
+    imag = [0.0] * blocksize
+
+    def process(input_signal, output_signal):
+        fft.forward(input_signal, output_signal, imag)
+    return process
+
+
+def bench_window(samplerate, blocksize):
+    win = yodel.analysis.Window(blocksize)
+    win.hanning(blocksize)
+    return win
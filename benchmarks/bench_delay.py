@@ -0,0 +1,13 @@
+"""
+Benchmarks of the delaylines of :py:mod:`yodel.delay`.
+"""
+
+import yodel.delay
+
+
+def bench_delayline(samplerate, blocksize):
+    return yodel.delay.DelayLine(samplerate, 100, 10.5)
+
+
+def bench_delayline_lagrange(samplerate, blocksize):
+    return yodel.delay.DelayLine(samplerate, 100, 10.5, 'lagrange')
@@ -0,0 +1,67 @@
+"""
+Benchmarks of the filters of :py:mod:`yodel.filter`.
+"""
+
+import math
+import yodel.filter
+
+
+def bench_single_pole(samplerate, blocksize):
+    flt = yodel.filter.SinglePole()
+    flt.low_pass(samplerate, 1000)
+    return flt
+
+
+def bench_biquad(samplerate, blocksize):
+    flt = yodel.filter.Biquad()
+    flt.low_pass(samplerate, 1000, 1.0 / math.sqrt(2.0))
+    return flt
+
+
+def bench_state_variable(samplerate, blocksize):
+    flt = yodel.filter.StateVariable()
+    flt.set(samplerate, 1000, 1.0)
+    others = [[0.0] * blocksize for i in range(0, 3)]
+
+    def process(input_signal, output_signal):
+        flt.process(input_signal, others[0], others[1], output_signal,
+                    others[2])
+    return process
+
+
+def bench_parametric_eq(samplerate, blocksize):
+    flt = yodel.filter.ParametricEQ(samplerate, 4)
+    flt.set_band(0, 100, 0.7, 3.0)
+    flt.set_band(1, 500, 1.0, -2.0)
+    flt.set_band(2, 2000, 1.0, 2.0)
+    flt.set_band(3, 8000, 0.7, -1.5)
+    return flt
+
+
+def bench_comb(samplerate, blocksize):
+    flt = yodel.filter.Comb(samplerate, 10.0, 0.5)
+    flt.feedback(10.0, 0.5)
+    return flt
+
+
+def bench_convolution(samplerate, blocksize):
+    return yodel.filter.Convolution(blocksize, [1.0 / (i + 1)
+                                                for i in range(0, 32)])
+
+
+def bench_fast_convolution(samplerate, blocksize):
+    return yodel.filter.FastConvolution(blocksize, [1.0 / (i + 1)
+                                                    for i in range(0, 512)])
+
+
+def bench_windowed_sinc(samplerate, blocksize):
+    flt = yodel.filter.WindowedSinc(samplerate, blocksize)
+    flt.low_pass(1000, 500)
+    return flt
+
+
+def bench_custom(samplerate, blocksize):
+    flt = yodel.filter.Custom(samplerate, blocksize)
+    size = blocksize // 2 + 1
+    flt.design([-12.0 * i / size for i in range(0, size)])
+    return flt
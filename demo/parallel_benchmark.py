@@ -0,0 +1,64 @@
+import yodel.filter
+import yodel.graph
+import yodel.parallel
+import array
+import math
+import multiprocessing
+import time
+
+
+samplerate = 48000
+block_size = 4096
+channels = 8
+blocks = 10
+
+
+def make_chain(channel):
+    pipeline = yodel.graph.Pipeline()
+    for band in range(0, 4):
+        flt = yodel.filter.Biquad()
+        flt.peak(samplerate, 200 * (band + 1) + channel, 1.0, 3.0)
+        pipeline.add(flt)
+    pipeline.add(yodel.filter.FastConvolution(block_size, [1.0, 0.5, 0.25]))
+    return pipeline
+
+
+def measure(process):
+    inputs = [array.array('d', [math.sin(2.0 * math.pi * 100.0 * (c + 1) *
+                                         i / samplerate)
+                                for i in range(0, block_size)])
+              for c in range(0, channels)]
+    outputs = [array.array('d', [0.0]) * block_size
+               for c in range(0, channels)]
+    start = time.perf_counter()
+    for block in range(0, blocks):
+        process(inputs, outputs)
+    return time.perf_counter() - start
+
+
+def serial(chains):
+    def process(inputs, outputs):
+        for (chain, input_signal, output_signal) in zip(chains, inputs,
+                                                        outputs):
+            chain.process(input_signal, output_signal)
+    return process
+
+
+if __name__ == '__main__':
+    print('cpus: %d, channels: %d, blocks: %d x %d samples' % (
+        multiprocessing.cpu_count(), channels, blocks, block_size))
+    reference = measure(serial([make_chain(c)
+                                 for c in range(0, channels)]))
+    print('%-10s %8s %8.3f s' % ('serial', '-', reference))
+    for workers in [2, 4, 8]:
+        chains = [make_chain(c) for c in range(0, channels)]
+        with yodel.parallel.ThreadedPipeline(chains, workers) as pipeline:
+            elapsed = measure(pipeline.process)
+        print('%-10s %8d %8.3f s  x%.2f' % (
+            'threads', workers, elapsed, reference / elapsed))
+        chains = [make_chain(c) for c in range(0, channels)]
+        with yodel.parallel.ProcessExecutor(chains, block_size,
+                                            workers) as executor:
+            elapsed = measure(executor.process)
+        print('%-10s %8d %8.3f s  x%.2f' % (
+            'processes', workers, elapsed, reference / elapsed))
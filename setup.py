@@ -41,6 +41,7 @@ setup(
     author_email='contact@romainclement.com',
     url='https://github.com/rclement/yodel',
     packages=['yodel'],
+    python_requires='>=3.8',
     tests_require=['tox'],
     cmdclass={'test': Tox},
     platforms='any',
@@ -0,0 +1,92 @@
+import unittest
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import yodel.bench
+
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+
+
+class TestBench(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load(self):
+        names = [name for (name, benchmark) in yodel.bench.load_benchmarks(BENCHMARKS)]
+        for name in ['single_pole', 'biquad', 'state_variable', 'parametric_eq', 'comb',
+                     'convolution', 'fast_convolution', 'windowed_sinc', 'custom',
+                     'delayline', 'dft', 'fft', 'window']:
+            self.assertTrue(name in names)
+
+    def test_run(self):
+        results = yodel.bench.run(yodel.bench.load_benchmarks(BENCHMARKS), 48000, [64, 2048], [1, 2], 0.0)
+        self.assertEqual(48000, results['samplerate'])
+        self.assertTrue('biquad/64/2' in results['results'])
+        self.assertFalse('dft/2048/1' in results['results'])
+        result = results['results']['fft/2048/1']
+        self.assertEqual('fft', result['name'])
+        self.assertEqual(1, result['blocks'])
+        self.assertAlmostEqual(result['samples_per_second'] / 48000.0, result['realtime_factor'])
+
+    def test_compare(self):
+        baseline = {'results': {'a/64/1': {'samples_per_second': 100.0},
+                                'b/64/1': {'samples_per_second': 100.0}}}
+        results = {'results': {'a/64/1': {'samples_per_second': 95.0},
+                               'b/64/1': {'samples_per_second': 80.0},
+                               'c/64/1': {'samples_per_second': 80.0}}}
+        self.assertEqual([('a/64/1', 0.95, False), ('b/64/1', 0.8, True)],
+                         yodel.bench.compare(results, baseline, 0.1))
+
+    def test_main(self):
+        output = os.path.join(self.directory, 'results.json')
+        args = ['-d', BENCHMARKS, '-k', 'biquad', '-b', '64', '-c', '1', '-t', '0']
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            self.assertEqual(0, yodel.bench.main(args + ['-o', output]))
+            with open(output) as f:
+                results = json.load(f)
+            self.assertEqual(['biquad/64/1'], list(results['results'].keys()))
+
+            results['results']['biquad/64/1']['samples_per_second'] *= 1000.0
+            with open(output, 'w') as f:
+                json.dump(results, f)
+            self.assertEqual(1, yodel.bench.main(args + ['--compare', output]))
+            self.assertTrue('REGRESSION' in sys.stdout.getvalue())
+        finally:
+            sys.stdout = stdout
+
+    def test_default_directory(self):
+        self.assertEqual(os.path.abspath(BENCHMARKS), yodel.bench.BENCHMARKS)
+        cwd = os.getcwd()
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            os.chdir(self.directory)
+            self.assertEqual(0, yodel.bench.main(['-k', 'biquad', '-b', '64', '-c', '1', '-t', '0']))
+            self.assertTrue('biquad/64/1' in sys.stdout.getvalue())
+        finally:
+            os.chdir(cwd)
+            sys.stdout = stdout
+
+    def test_missing_directory(self):
+        stderr = sys.stderr
+        sys.stderr = io.StringIO()
+        try:
+            with self.assertRaises(SystemExit) as context:
+                yodel.bench.main(['-d', os.path.join(self.directory, 'missing')])
+        finally:
+            sys.stderr = stderr
+        self.assertEqual(2, context.exception.code)
+
+
+if __name__ == '__main__':
+    unittest.main()
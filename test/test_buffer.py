@@ -0,0 +1,230 @@
+import unittest
+import array
+import math
+import yodel.buffer
+import yodel.analysis
+import yodel.delay
+import yodel.filter
+import yodel.reverb
+
+
+class TestToList(unittest.TestCase):
+
+    def test_list(self):
+        signal = [1.0, 2.0, 3.0]
+        self.assertTrue(yodel.buffer.to_list(signal) is signal)
+
+    def test_array(self):
+        signal = array.array('d', [1.0, 2.0, 3.0])
+        self.assertEqual([1.0, 2.0, 3.0], yodel.buffer.to_list(signal))
+
+    def test_memoryview(self):
+        signal = memoryview(array.array('f', [1.0, 2.0, 3.0]))
+        self.assertEqual([1.0, 2.0, 3.0], yodel.buffer.to_list(signal))
+
+    def test_tuple(self):
+        self.assertEqual([1.0, 2.0], yodel.buffer.to_list((1.0, 2.0)))
+
+
+class TestAssign(unittest.TestCase):
+
+    def test_list(self):
+        signal = [0] * 4
+        yodel.buffer.assign([1.0, 2.0, 3.0], signal)
+        self.assertEqual([1.0, 2.0, 3.0, 0], signal)
+
+    def test_array(self):
+        signal = array.array('f', [0.0] * 4)
+        yodel.buffer.assign([1.0, 2.0, 3.0], signal)
+        self.assertEqual(array.array('f', [1.0, 2.0, 3.0, 0.0]), signal)
+
+    def test_memoryview(self):
+        data = array.array('d', [0.0] * 4)
+        yodel.buffer.assign([1.0, 2.0, 3.0], memoryview(data))
+        self.assertEqual(array.array('d', [1.0, 2.0, 3.0, 0.0]), data)
+
+    def test_too_many_samples(self):
+        for signal in [[0] * 2, array.array('d', [0.0] * 2), memoryview(array.array('d', [0.0] * 2))]:
+            self.assertRaises(ValueError, yodel.buffer.assign, [1.0, 2.0, 3.0], signal)
+            self.assertEqual(2, len(signal))
+            self.assertEqual([0.0, 0.0], list(signal))
+
+
+class TestTypecode(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 256
+        self.signal = array.array('f', [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, self.block_size)])
+
+    def test_default(self):
+        self.assertEqual(array.array('d', [0.0, 0.0]), yodel.buffer.zeros(2))
+        self.assertEqual(array.array('f', [0.0, 0.0]), yodel.buffer.zeros(2, 'f'))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, yodel.buffer.zeros, 2, 'i')
+        self.assertRaises(ValueError, yodel.delay.DelayLine, self.samplerate, 10, 1.0, 'linear', 'i')
+
+    def compare(self, make, buffers):
+        expected = array.array('f', [0.0]) * self.block_size
+        make('d').process(self.signal, expected)
+
+        flt = make('f')
+        other = make('d')
+        for name in buffers:
+            self.assertEqual('f', getattr(flt, name).typecode)
+            self.assertEqual('d', getattr(other, name).typecode)
+        output = array.array('f', self.signal)
+        flt.process(output, output)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(expected[i], output[i], places=5)
+
+    def test_delayline(self):
+        self.compare(lambda typecode: yodel.delay.DelayLine(self.samplerate, 10, 1.0, typecode=typecode), ['delayline'])
+        self.compare(lambda typecode: yodel.delay.MultiTapDelay(self.samplerate, 10, typecode=typecode).delayline, ['delayline'])
+
+    def test_convolution(self):
+        ir = [1.0, 0.5, -0.25, 0.125]
+        self.compare(lambda typecode: yodel.filter.Convolution(self.block_size, ir, typecode), ['conv', 'olap'])
+        self.compare(lambda typecode: yodel.filter.FastConvolution(self.block_size, ir, typecode), ['ir', 'ir_real', 'ir_imag', 'olap'])
+
+    def test_filters(self):
+        def windowed_sinc(typecode):
+            flt = yodel.filter.WindowedSinc(self.samplerate, self.block_size, typecode)
+            flt.low_pass(1000, 4000)
+            return flt
+        self.compare(windowed_sinc, [])
+        self.assertEqual('f', windowed_sinc('f').conv.ir.typecode)
+        self.assertEqual('f', yodel.filter.Custom(self.samplerate, self.block_size, 'f').fir.ir.typecode)
+
+    def test_reverb(self):
+        self.compare(lambda typecode: yodel.reverb.FDN(self.samplerate, 4, typecode=typecode), ['buffer'])
+
+
+class TestBufferProcessing(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 256
+        self.signal = [math.sin(2.0*math.pi*100.0*i/self.samplerate) + 0.1*math.cos(2.0*math.pi*5000.0*i/self.samplerate) for i in range(0, self.block_size)]
+
+    def compare(self, make, process):
+        expected = [0] * self.block_size
+        process(make(), self.signal, expected)
+
+        buf = array.array('d', self.signal)
+        process(make(), buf, buf)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(expected[i], buf[i])
+
+        data = array.array('d', self.signal)
+        view = memoryview(data)
+        process(make(), view, view)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(expected[i], data[i])
+
+        inplace = list(self.signal)
+        process(make(), inplace, inplace)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(expected[i], inplace[i])
+
+    def process(self, flt, input_signal, output_signal):
+        flt.process(input_signal, output_signal)
+
+    def test_single_pole(self):
+        def make():
+            flt = yodel.filter.SinglePole()
+            flt.low_pass(self.samplerate, 1000)
+            return flt
+        self.compare(make, self.process)
+
+    def test_biquad(self):
+        def make():
+            flt = yodel.filter.Biquad()
+            flt.low_pass(self.samplerate, 1000, 1.0 / math.sqrt(2.0))
+            return flt
+        self.compare(make, self.process)
+
+    def test_biquad_cascade(self):
+        def make():
+            return yodel.filter.BiquadCascade(yodel.filter.butterworth(self.samplerate, 1000, 4))
+        self.compare(make, self.process)
+
+    def test_state_variable(self):
+        def make():
+            flt = yodel.filter.StateVariable()
+            flt.set(self.samplerate, 1000, 1.0)
+            return flt
+
+        def process(flt, input_signal, output_signal):
+            others = [[0] * self.block_size for i in range(0, 3)]
+            flt.process(input_signal, others[0], others[1], output_signal, others[2])
+        self.compare(make, process)
+
+    def test_parametric_eq(self):
+        def make():
+            flt = yodel.filter.ParametricEQ(self.samplerate, 3)
+            flt.set_band(0, 200, 1.0, 6.0)
+            flt.set_band(1, 1000, 1.0, -6.0)
+            flt.set_band(2, 5000, 1.0, 3.0)
+            return flt
+        self.compare(make, self.process)
+
+    def test_comb(self):
+        for mode in ['feedforward', 'feedback', 'allpass']:
+            def make():
+                flt = yodel.filter.Comb(self.samplerate, 1.0, 0.5)
+                getattr(flt, mode)(1.0, 0.5)
+                return flt
+            self.compare(make, self.process)
+
+    def test_convolution(self):
+        ir = [1.0, 0.5, -0.25, 0.125]
+        self.compare(lambda: yodel.filter.Convolution(self.block_size, ir), self.process)
+        self.compare(lambda: yodel.filter.FastConvolution(self.block_size, ir), self.process)
+
+    def test_windowed_sinc(self):
+        def make():
+            flt = yodel.filter.WindowedSinc(self.samplerate, self.block_size)
+            flt.low_pass(1000, 500)
+            return flt
+        self.compare(make, self.process)
+
+    def test_delayline(self):
+        self.compare(lambda: yodel.delay.DelayLine(self.samplerate, 10, 0.5), self.process)
+
+    def test_multitap_delay(self):
+        def make():
+            dly = yodel.delay.MultiTapDelay(self.samplerate, 10)
+            dly.add_tap(0.5, 0.5)
+            dly.add_tap(2.0, 0.25)
+            return dly
+        self.compare(make, self.process)
+
+    def test_window(self):
+        def make():
+            win = yodel.analysis.Window(self.block_size)
+            win.hanning(self.block_size)
+            return win
+        self.compare(make, self.process)
+
+    def test_fft(self):
+        fft = yodel.analysis.FFT(self.block_size)
+        real = [0] * self.block_size
+        imag = [0] * self.block_size
+        fft.forward(self.signal, real, imag)
+
+        buf = array.array('d', self.signal)
+        imag_buf = array.array('d', [0.0]) * self.block_size
+        fft.forward(buf, buf, imag_buf)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(real[i], buf[i])
+            self.assertAlmostEqual(imag[i], imag_buf[i])
+
+        fft.inverse(buf, imag_buf, buf)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(self.signal[i], buf[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -43,3 +43,39 @@ class TestPhase(unittest.TestCase):
 
     def test_pi_on_six(self):
         self.assertAlmostEqual(dc.phase(math.sqrt(3) / 2.0, 1.0 / 2.0), math.pi / 6.0)
+
+
+class TestSignal(unittest.TestCase):
+
+    def setUp(self):
+        self.real = [0.0, 1.0, 0.0, 1.0, -0.5, -2.0, 3.0]
+        self.imag = [0.0, 0.0, 1.0, 1.0, math.sqrt(3) / 2.0, -1.0, -4.0]
+        self.size = len(self.real)
+
+    def test_magnitude(self):
+        output = [0] * self.size
+        dc.magnitude(self.real, self.imag, output)
+        for i in range(0, self.size):
+            self.assertAlmostEqual(dc.modulus(self.real[i], self.imag[i]), output[i])
+
+    def test_magnitude_squared(self):
+        output = [0] * self.size
+        dc.magnitude_squared(self.real, self.imag, output)
+        for i in range(0, self.size):
+            self.assertAlmostEqual(dc.modulus(self.real[i], self.imag[i]) ** 2, output[i])
+
+    def test_phase(self):
+        output = [0] * self.size
+        dc.phase_signal(self.real, self.imag, output)
+        for i in range(0, self.size):
+            self.assertEqual(dc.phase(self.real[i], self.imag[i]), output[i])
+
+    def test_polar_round_trip(self):
+        real = list(self.real)
+        imag = list(self.imag)
+        dc.to_polar(real, imag, real, imag)
+        self.assertAlmostEqual(5.0, real[-1])
+        dc.from_polar(real, imag, real, imag)
+        for i in range(0, self.size):
+            self.assertAlmostEqual(self.real[i], real[i])
+            self.assertAlmostEqual(self.imag[i], imag[i])
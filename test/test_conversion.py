@@ -1,4 +1,5 @@
 import unittest
+import array
 import yodel.conversion as dc
 
 
@@ -22,3 +23,29 @@ class TestDb2Lin(unittest.TestCase):
     def test_minus_inf(self):
         self.assertEqual(dc.db2lin(-100), 1.0e-5)
 
+
+
+class TestSignalConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.linvals = [0, 1e-10, 1e-5, 0.001, 0.5, 1.0, 2.0, 1000.0]
+        self.dbvals = [-120.0, -100.0, -60.0, -6.0, 0.0, 3.0, 20.0]
+
+    def test_lin2db_signal(self):
+        output = [0] * len(self.linvals)
+        dc.lin2db_signal(self.linvals, output)
+        for (linval, dbval) in zip(self.linvals, output):
+            self.assertEqual(dc.lin2db(linval), dbval)
+
+    def test_db2lin_signal(self):
+        output = [0] * len(self.dbvals)
+        dc.db2lin_signal(self.dbvals, output)
+        for (dbval, linval) in zip(self.dbvals, output):
+            self.assertEqual(dc.db2lin(dbval), linval)
+
+    def test_in_place(self):
+        signal = array.array('d', self.dbvals)
+        dc.db2lin_signal(signal, signal)
+        dc.lin2db_signal(signal, signal)
+        for (expected, dbval) in zip(self.dbvals, signal):
+            self.assertAlmostEqual(max(expected, -100.0), dbval)
@@ -48,12 +48,22 @@ class TestDelayLine(unittest.TestCase):
 
         self.dly.process(inbuffer, outbuffer)
 
-        for i in range(0, delaysmp-1):
+        for i in range(0, delaysmp):
             self.assertEqual(outbuffer[i], 0)
-        for i in range(delaysmp-1, delaysmp):
-            self.assertEqual(outbuffer[i], frac * inbuffer[0])
-        for i in range(delaysmp, self.block_size):
-            self.assertEqual(outbuffer[i], (1-frac) * inbuffer[i-(delaysmp)] + frac * inbuffer[i-(delaysmp-1)])
+        for i in range(delaysmp, delaysmp+1):
+            self.assertAlmostEqual(outbuffer[i], (1-frac) * inbuffer[0])
+        for i in range(delaysmp+1, self.block_size):
+            self.assertAlmostEqual(outbuffer[i], (1-frac) * inbuffer[i-delaysmp] + frac * inbuffer[i-(delaysmp+1)])
+
+    def test_frac_delay_impulse(self):
+        self.dly.set_delay(10.3 * 1000 / self.samplerate)
+        inbuffer = [1.0] + [0.0] * 31
+        outbuffer = [0] * 32
+
+        self.dly.process(inbuffer, outbuffer)
+
+        taps = [(i, round(x, 9)) for (i, x) in enumerate(outbuffer) if x != 0]
+        self.assertEqual([(10, 0.7), (11, 0.3)], taps)
 
     def test_max_delay(self):
         delay = 2000
@@ -93,6 +103,186 @@ class TestDelayLine(unittest.TestCase):
         for i in range(0, self.block_size):
             self.assertEqual(self.dly.delayline[i], 0)
 
+    def test_read_write(self):
+        inbuffer = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(1, self.block_size+1)]
+        reference = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0)
+        for delay in [self.maxdelay / 2.0, 3.5 * 1000.0 / self.samplerate]:
+            self.dly.set_delay(delay)
+            reference.set_delay(delay)
+            size = self.dly.max_read_size()
+            self.assertRaises(ValueError, self.dly.read, [0] * (size + 1))
+            for start in range(0, self.block_size, size):
+                block = inbuffer[start:start+size]
+                outbuffer = [0] * len(block)
+                refbuffer = [0] * len(block)
+                self.dly.read(outbuffer)
+                self.dly.write(block)
+                reference.process(block, refbuffer)
+                for i in range(0, len(block)):
+                    self.assertAlmostEqual(refbuffer[i], outbuffer[i])
+
+    def test_typed_storage(self):
+        self.assertEqual(self.dly.delayline.typecode, 'd')
+        self.assertEqual(len(self.dly.delayline), self.dly.length)
+        self.dly.process([1] * self.block_size, [0] * self.block_size)
+        self.assertEqual(self.dly.delayline.typecode, 'd')
+
+    def test_block_matches_samples(self):
+        delays = [0, 3.0 * 1000.0 / self.samplerate, 23.125 * 1000.0 / self.samplerate, 0.5 * 1000.0 / self.samplerate, self.maxdelay]
+        dly = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0)
+        for delay in delays:
+            self.dly.set_delay(delay)
+            dly.set_delay(delay)
+            for size in [1, 100, self.block_size, 3 * self.block_size, 20 * self.block_size]:
+                inbuffer = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, size)]
+                outbuffer = [0] * size
+
+                self.dly.process(inbuffer, outbuffer)
+
+                for i in range(0, size):
+                    self.assertAlmostEqual(dly.process_sample(inbuffer[i]), outbuffer[i])
+                self.assertEqual(dly.writepos, self.dly.writepos)
+                self.assertAlmostEqual(dly.readpos, self.dly.readpos)
+
+
+class TestDelayLineInterpolation(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 2048
+        self.maxdelay = 100
+        self.frequency = 5000.0
+        self.inbuffer = [math.sin(2.0*math.pi*self.frequency*i/self.samplerate) for i in range(0, self.block_size)]
+
+    def common_test_sine(self, interpolation, delta):
+        delaysmp = 10.25
+        dly = yodel.delay.DelayLine(self.samplerate, self.maxdelay, delaysmp * 1000.0 / self.samplerate, interpolation)
+        outbuffer = [0] * self.block_size
+
+        dly.process(self.inbuffer, outbuffer)
+
+        position = delaysmp
+        for i in range(100, self.block_size):
+            expected = math.sin(2.0*math.pi*self.frequency*(i-position)/self.samplerate)
+            self.assertAlmostEqual(expected, outbuffer[i], delta=delta)
+
+    def common_test_int_delay(self, interpolation):
+        dly = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 10 * 1000.0 / self.samplerate, interpolation)
+        outbuffer = [0] * self.block_size
+
+        dly.process(self.inbuffer, outbuffer)
+
+        for i in range(10, self.block_size):
+            self.assertAlmostEqual(self.inbuffer[i-10], outbuffer[i])
+
+    def common_test_block_matches_samples(self, interpolation):
+        dly1 = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0, interpolation)
+        dly2 = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0, interpolation)
+        for delaysmp in [0, 2.5, 3.75, 100.125]:
+            dly1.set_delay(delaysmp * 1000.0 / self.samplerate)
+            dly2.set_delay(delaysmp * 1000.0 / self.samplerate)
+            outbuffer = [0] * self.block_size
+
+            dly1.process(self.inbuffer, outbuffer)
+
+            for i in range(0, self.block_size):
+                self.assertAlmostEqual(dly2.process_sample(self.inbuffer[i]), outbuffer[i])
+
+    def test_linear(self):
+        self.common_test_sine('linear', 5e-2)
+        self.common_test_int_delay('linear')
+
+    def test_hermite(self):
+        self.common_test_sine('hermite', 1e-2)
+        self.common_test_int_delay('hermite')
+        self.common_test_block_matches_samples('hermite')
+
+    def test_lagrange(self):
+        self.common_test_sine('lagrange', 5e-3)
+        self.common_test_int_delay('lagrange')
+        self.common_test_block_matches_samples('lagrange')
+
+    def test_allpass(self):
+        self.common_test_sine('allpass', 2e-2)
+        self.common_test_int_delay('allpass')
+        self.common_test_block_matches_samples('allpass')
+
+    def test_sinc(self):
+        self.common_test_sine('sinc', 1e-3)
+        self.common_test_int_delay('sinc')
+        self.common_test_block_matches_samples('sinc')
+
+    def test_minimum_delay(self):
+        dly = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0, 'sinc')
+        self.assertEqual(4, dly.sampledelay)
+
+        dly.set_interpolation('hermite')
+        self.assertEqual(2, dly.sampledelay)
+
+        dly.set_interpolation('linear')
+        self.assertEqual(0, dly.sampledelay)
+
+    def test_invalid_interpolation(self):
+        self.assertRaises(ValueError, yodel.delay.DelayLine, self.samplerate, self.maxdelay, 0, 'spline')
+
+
+class TestDelayLineModulation(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 512
+        self.maxdelay = 20
+        self.inbuffer = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, self.block_size)]
+        self.delays = [5.0 + 2.0 * math.sin(2.0*math.pi*i/self.block_size) for i in range(0, self.block_size)]
+
+    def common_test_matches_set_delay(self, interpolation):
+        dly1 = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0, interpolation)
+        dly2 = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0, interpolation)
+        outbuffer = [0] * self.block_size
+
+        for block in range(0, 3):
+            dly1.process_modulated(self.inbuffer, self.delays, outbuffer)
+
+            for i in range(0, self.block_size):
+                dly2.set_delay(self.delays[i])
+                self.assertAlmostEqual(dly2.process_sample(self.inbuffer[i]), outbuffer[i])
+
+        self.assertEqual(self.delays[-1], dly1.delay)
+        self.assertAlmostEqual(dly2.readpos, dly1.readpos)
+
+    def test_linear(self):
+        self.common_test_matches_set_delay('linear')
+
+    def test_hermite(self):
+        self.common_test_matches_set_delay('hermite')
+
+    def test_allpass(self):
+        self.common_test_matches_set_delay('allpass')
+
+    def test_sinc(self):
+        self.common_test_matches_set_delay('sinc')
+
+    def test_constant_delay(self):
+        dly1 = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0)
+        dly2 = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0.5)
+        outbuffer1 = [0] * self.block_size
+        outbuffer2 = [0] * self.block_size
+
+        dly1.process_modulated(self.inbuffer, [0.5] * self.block_size, outbuffer1)
+        dly2.process(self.inbuffer, outbuffer2)
+
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(outbuffer2[i], outbuffer1[i])
+
+    def test_clamped_delay(self):
+        dly = yodel.delay.DelayLine(self.samplerate, self.maxdelay, 0)
+        outbuffer = [0] * self.block_size
+
+        dly.process_modulated(self.inbuffer, [-10.0] * self.block_size, outbuffer)
+
+        for i in range(0, self.block_size):
+            self.assertEqual(self.inbuffer[i], outbuffer[i])
+
 
 if __name__ == '__main__':
     unittest.main()
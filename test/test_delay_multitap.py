@@ -0,0 +1,160 @@
+import unittest
+import yodel.delay
+import math
+
+
+class TestMultiTapDelay(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 512
+        self.maxdelay = 100
+        self.dly = yodel.delay.MultiTapDelay(self.samplerate, self.maxdelay)
+        self.inbuffer = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(1, self.block_size+1)]
+
+    def ms(self, samples):
+        return samples * 1000.0 / self.samplerate
+
+    def test_no_tap(self):
+        outbuffer = [1] * self.block_size
+
+        self.dly.process(self.inbuffer, outbuffer)
+
+        for i in range(0, self.block_size):
+            self.assertEqual(0, outbuffer[i])
+
+    def test_int_taps(self):
+        self.dly.add_tap(0, 1.0)
+        self.dly.add_tap(self.ms(10), 0.5)
+        self.dly.add_tap(self.ms(100), -0.25)
+        outbuffer = [0] * self.block_size
+
+        self.dly.process(self.inbuffer, outbuffer)
+
+        for i in range(0, self.block_size):
+            expected = self.inbuffer[i]
+            if i >= 10:
+                expected += 0.5 * self.inbuffer[i-10]
+            if i >= 100:
+                expected += -0.25 * self.inbuffer[i-100]
+            self.assertAlmostEqual(expected, outbuffer[i])
+
+    def test_frac_tap(self):
+        self.dly.add_tap(self.ms(23.25), 1.0)
+        outbuffer = [0] * self.block_size
+
+        self.dly.process(self.inbuffer, outbuffer)
+
+        for i in range(0, 23):
+            self.assertEqual(0, outbuffer[i])
+        for i in range(24, self.block_size):
+            expected = 0.75 * self.inbuffer[i-23] + 0.25 * self.inbuffer[i-24]
+            self.assertAlmostEqual(expected, outbuffer[i])
+
+    def test_tap_signals(self):
+        self.dly.add_tap(self.ms(5), 0.5)
+        self.dly.add_tap(self.ms(7.5), 0.25)
+        outbuffer = [0] * self.block_size
+        taps = [[0] * self.block_size, [0] * self.block_size]
+
+        self.dly.process(self.inbuffer, outbuffer, taps)
+
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(outbuffer[i], taps[0][i] + taps[1][i])
+        for i in range(5, self.block_size):
+            self.assertAlmostEqual(0.5 * self.inbuffer[i-5], taps[0][i])
+
+    def test_remove_tap(self):
+        self.dly.add_tap(self.ms(5), 0.5)
+        self.dly.add_tap(self.ms(10), 1.0)
+        self.dly.remove_tap(0)
+        outbuffer = [0] * self.block_size
+
+        self.dly.process(self.inbuffer, outbuffer)
+
+        self.assertEqual([10 * 1000.0 / self.samplerate], self.dly.delays)
+        for i in range(10, self.block_size):
+            self.assertAlmostEqual(self.inbuffer[i-10], outbuffer[i])
+
+    def test_block_matches_samples(self):
+        dly = yodel.delay.MultiTapDelay(self.samplerate, self.maxdelay)
+        for (delay, gain) in [(0, 1.0), (self.ms(0.5), 0.5), (self.ms(300.75), 0.3), (self.maxdelay, -0.2)]:
+            self.dly.add_tap(delay, gain)
+            dly.add_tap(delay, gain)
+
+        for size in [1, 100, self.block_size, 20 * self.block_size]:
+            inbuffer = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, size)]
+            outbuffer = [0] * size
+
+            self.dly.process(inbuffer, outbuffer)
+
+            for i in range(0, size):
+                self.assertAlmostEqual(dly.process_sample(inbuffer[i]), outbuffer[i])
+
+    def test_frac_tap_impulse(self):
+        self.dly.add_tap(self.ms(10.3), 1.0)
+        line = yodel.delay.DelayLine(self.samplerate, self.maxdelay, self.ms(10.3))
+        inbuffer = [1.0] + [0.0] * 31
+        outbuffer = [0] * 32
+        refbuffer = [0] * 32
+
+        self.dly.process(inbuffer, outbuffer)
+        line.process(inbuffer, refbuffer)
+
+        taps = [(i, round(x, 9)) for (i, x) in enumerate(outbuffer) if x != 0]
+        self.assertEqual([(10, 0.7), (11, 0.3)], taps)
+        self.assertEqual(refbuffer, outbuffer)
+
+    def test_matches_delayline(self):
+        delays = [self.ms(0.5), self.ms(10.3), self.ms(23.75), self.ms(300.125)]
+        for interpolation in ['linear', 'hermite', 'lagrange', 'allpass', 'sinc']:
+            dly = yodel.delay.MultiTapDelay(self.samplerate, self.maxdelay, interpolation)
+            lines = []
+            for delay in delays:
+                dly.add_tap(delay, 1.0)
+                lines.append(yodel.delay.DelayLine(self.samplerate, self.maxdelay, delay, interpolation))
+            outbuffer = [0] * self.block_size
+            taps = [[0] * self.block_size for delay in delays]
+            refbuffer = [0] * self.block_size
+
+            for block in range(0, 3):
+                dly.process(self.inbuffer, outbuffer, taps)
+
+                for (line, tap) in zip(lines, taps):
+                    line.process(self.inbuffer, refbuffer)
+                    for i in range(0, self.block_size):
+                        self.assertAlmostEqual(refbuffer[i], tap[i])
+
+    def test_set_interpolation(self):
+        self.dly.add_tap(0, 1.0)
+        self.dly.add_tap(self.ms(10.3), 0.5)
+        self.dly.set_interpolation('sinc')
+        line = yodel.delay.DelayLine(self.samplerate, self.maxdelay, self.ms(10.3), 'sinc')
+        outbuffer = [0] * self.block_size
+        taps = [[0] * self.block_size, [0] * self.block_size]
+        refbuffer = [0] * self.block_size
+
+        self.dly.process(self.inbuffer, outbuffer, taps)
+        line.process(self.inbuffer, refbuffer)
+
+        self.assertEqual(4, self.dly._sampledelays[0])
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(0.5 * refbuffer[i], taps[1][i])
+
+    def test_invalid_interpolation(self):
+        self.assertRaises(ValueError, yodel.delay.MultiTapDelay, self.samplerate, self.maxdelay, 'spline')
+
+    def test_clear(self):
+        self.dly.add_tap(self.ms(10), 1.0)
+        outbuffer = [0] * self.block_size
+        self.dly.process(self.inbuffer, outbuffer)
+
+        self.dly.clear()
+        self.dly.process([0] * self.block_size, outbuffer)
+
+        for i in range(0, self.block_size):
+            self.assertEqual(0, outbuffer[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
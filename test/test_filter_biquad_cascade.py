@@ -0,0 +1,162 @@
+import unittest
+import math
+import yodel.filter
+import yodel.analysis
+import yodel.conversion
+import yodel.complex
+
+
+def impulse_response(flt, size):
+    impulse = [0] * size
+    impulse[0] = 1
+    response = [0] * size
+    flt.process(impulse, response)
+    return response
+
+
+def frequency_response(response):
+    size = len(response)
+    freq_response_real = [0] * size
+    freq_response_imag = [0] * size
+    fft = yodel.analysis.FFT(size)
+    fft.forward(response, freq_response_real, freq_response_imag)
+    return freq_response_real, freq_response_imag
+
+
+def amplitude_response(spec_real, spec_imag, db=False):
+    size = len(spec_real)
+    amp = [0] * size
+    for i in range(0, size):
+        amp[i] = yodel.complex.modulus(spec_real[i], spec_imag[i])
+        if db:
+            amp[i] = yodel.conversion.lin2db(amp[i])
+    return amp
+
+
+class CommonCascadeTest:
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 4096
+        self.fc = 1500
+        self.fcbin = int(self.fc * self.block_size / self.samplerate)
+
+    def response(self, sections):
+        cascade = yodel.filter.BiquadCascade(sections)
+        ir = impulse_response(cascade, self.block_size)
+        fr_real, fr_imag = frequency_response(ir)
+        return amplitude_response(fr_real, fr_imag, True)
+
+
+class TestButterworth(CommonCascadeTest, unittest.TestCase):
+
+    def test_sections(self):
+        self.assertEqual(2, len(yodel.filter.butterworth(self.samplerate, self.fc, 4)))
+        self.assertEqual(3, len(yodel.filter.butterworth(self.samplerate, self.fc, 5)))
+
+    def test_low_pass(self):
+        for order in [1, 2, 3, 4]:
+            amp = self.response(yodel.filter.butterworth(self.samplerate, self.fc, order))
+
+            self.assertAlmostEqual(0.0, amp[1], delta=0.1)
+            self.assertAlmostEqual(-3.0, amp[self.fcbin], delta=0.1)
+            self.assertAlmostEqual(-6.0 * order, amp[4*self.fcbin] - amp[2*self.fcbin], delta=0.5*order)
+
+    def test_high_pass(self):
+        for order in [1, 2, 3, 4, 8]:
+            amp = self.response(yodel.filter.butterworth(self.samplerate, self.fc, order, 'high_pass'))
+
+            self.assertAlmostEqual(0.0, amp[int(self.block_size/2)], delta=0.1)
+            self.assertAlmostEqual(-3.0, amp[self.fcbin], delta=0.1)
+
+    def test_invalid_kind(self):
+        self.assertRaises(ValueError, yodel.filter.butterworth, self.samplerate, self.fc, 2, 'band_pass')
+
+
+class TestChebyshev1(CommonCascadeTest, unittest.TestCase):
+
+    def test_low_pass(self):
+        for order in [2, 3, 4, 5]:
+            amp = self.response(yodel.filter.chebyshev1(self.samplerate, self.fc, order, 1.0))
+
+            for i in range(1, self.fcbin):
+                self.assertTrue(-1.01 <= amp[i] <= 0.01)
+            self.assertAlmostEqual(-1.0, amp[self.fcbin], delta=0.01)
+
+    def test_high_pass(self):
+        amp = self.response(yodel.filter.chebyshev1(self.samplerate, self.fc, 5, 0.5, 'high_pass'))
+
+        for i in range(self.fcbin, int(self.block_size/2)):
+            self.assertTrue(-0.51 <= amp[i] <= 0.01)
+        self.assertTrue(amp[int(self.fcbin/2)] < -40)
+
+
+class TestChebyshev2(CommonCascadeTest, unittest.TestCase):
+
+    def test_low_pass(self):
+        for order in [2, 3, 4, 5]:
+            amp = self.response(yodel.filter.chebyshev2(self.samplerate, self.fc, order, 60.0))
+
+            self.assertAlmostEqual(0.0, amp[1], delta=0.01)
+            self.assertAlmostEqual(-60.0, amp[self.fcbin], delta=0.1)
+            for i in range(self.fcbin, int(self.block_size/2)):
+                self.assertTrue(amp[i] <= -59.9)
+
+
+class TestLinkwitzRiley(CommonCascadeTest, unittest.TestCase):
+
+    def test_crossover(self):
+        for order in [2, 4, 8]:
+            lp = yodel.filter.BiquadCascade(yodel.filter.linkwitz_riley(self.samplerate, self.fc, order))
+            hp = yodel.filter.BiquadCascade(yodel.filter.linkwitz_riley(self.samplerate, self.fc, order, 'high_pass'))
+            lpir = impulse_response(lp, self.block_size)
+            hpir = impulse_response(hp, self.block_size)
+            if order % 4 == 2:
+                hpir = [-s for s in hpir]
+            lpamp = self.response(yodel.filter.linkwitz_riley(self.samplerate, self.fc, order))
+            sumreal, sumimag = frequency_response([lpir[i] + hpir[i] for i in range(0, self.block_size)])
+            sumamp = amplitude_response(sumreal, sumimag, True)
+
+            self.assertAlmostEqual(-6.0, lpamp[self.fcbin], delta=0.1)
+            for i in range(0, int(self.block_size/2)):
+                self.assertAlmostEqual(0.0, sumamp[i], delta=0.01)
+
+    def test_odd_order(self):
+        self.assertRaises(ValueError, yodel.filter.linkwitz_riley, self.samplerate, self.fc, 3)
+
+
+class TestBiquadCascade(unittest.TestCase):
+
+    def test_flat(self):
+        cascade = yodel.filter.BiquadCascade()
+        insignal = [math.sin(2.0*math.pi*100.0*i/48000.0) for i in range(0, 64)]
+        outsignal = [0] * 64
+
+        cascade.process(insignal, outsignal)
+
+        self.assertEqual(insignal, outsignal)
+
+    def test_process_sample(self):
+        sections = yodel.filter.butterworth(48000, 1000, 6)
+        cascade = yodel.filter.BiquadCascade(sections)
+        insignal = [math.sin(2.0*math.pi*3000.0*i/48000.0) for i in range(0, 64)]
+        outsignal = [0] * 64
+        cascade.process(insignal, outsignal)
+
+        cascade.reset()
+        for i in range(0, 64):
+            self.assertAlmostEqual(outsignal[i], cascade.process_sample(insignal[i]))
+
+    def test_set_sections(self):
+        cascade = yodel.filter.BiquadCascade(yodel.filter.butterworth(48000, 1000, 4))
+        first = cascade.filters[0]
+
+        cascade.set_sections(yodel.filter.butterworth(48000, 2000, 4))
+        self.assertTrue(first is cascade.filters[0])
+
+        cascade.set_sections(yodel.filter.butterworth(48000, 2000, 2))
+        self.assertEqual(1, len(cascade.filters))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -102,5 +102,57 @@ class TestAllpassCombFilter(unittest.TestCase):
             self.assertAlmostEqual(self._amplitude_response[i], 1.0)
 
 
+class TestCombFilterBlock(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000.0
+        self.block_size = 512
+        self.gain = 0.5
+        self.inbuffer = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, 2 * self.block_size)]
+
+    def compare(self, mode, delay):
+        block = yodel.filter.Comb(self.samplerate, delay, self.gain)
+        sample = yodel.filter.Comb(self.samplerate, delay, self.gain)
+        getattr(block, mode)(delay, self.gain)
+        getattr(sample, mode)(delay, self.gain)
+        outbuffer = [0] * self.block_size
+
+        for start in range(0, len(self.inbuffer), self.block_size):
+            block.process(self.inbuffer[start:start+self.block_size], outbuffer)
+            for i in range(0, self.block_size):
+                x = self.inbuffer[start+i]
+                y = sample.process_sample(x)
+                sample.x1 = x
+                sample.y1 = y
+                self.assertAlmostEqual(y, outbuffer[i])
+
+    def test_feedforward(self):
+        for delay in [0, 0.25, 0.2604, 20]:
+            self.compare('feedforward', delay)
+
+    def test_feedback(self):
+        for delay in [1000.0 / self.samplerate, 0.1, 0.25, 0.2604, 20]:
+            self.compare('feedback', delay)
+
+    def test_allpass(self):
+        self.compare('allpass', 0.25)
+
+    def test_feedback_delay_read(self):
+        delaysmp = 700
+        comb = yodel.filter.Comb(self.samplerate, 1000.0 * delaysmp / self.samplerate, self.gain)
+        comb.feedback(1000.0 * delaysmp / self.samplerate, self.gain)
+        impulse = [0] * (3 * delaysmp)
+        impulse[0] = 1
+        response = [0] * len(impulse)
+
+        comb.process(impulse, response)
+
+        for i in range(0, len(impulse)):
+            if i % delaysmp == 0:
+                self.assertAlmostEqual(self.gain ** (i // delaysmp), response[i])
+            else:
+                self.assertAlmostEqual(0, response[i])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -199,5 +199,94 @@ class TestFastConvolutionFilter(unittest.TestCase, CommonConvolutionTest):
         return yodel.filter.FastConvolution(framesize, ir)
 
 
+class TestFastConvolutionImpulseResponse(unittest.TestCase):
+
+    def setUp(self):
+        self.signal_length = 4
+        self.signal = [1.0, 0.5, 0.25, 0.125]
+        self.fir = yodel.filter.FastConvolution(self.signal_length, [1.0, 0.0, 0.5])
+
+    def test_reuse_buffers(self):
+        fft = self.fir.fft
+        signal = self.fir.signal
+
+        self.fir.set_impulse_response([0.5, 0.25, 0.0])
+
+        self.assertTrue(fft is self.fir.fft)
+        self.assertTrue(signal is self.fir.signal)
+
+    def test_reuse_work_buffers(self):
+        output = [0] * self.signal_length
+        self.fir.process(self.signal, output)
+        buffers = [self.fir.signal, self.fir.signal_real, self.fir.signal_imag, self.fir.olap]
+
+        for i in range(0, 3):
+            self.fir.process(self.signal, output)
+            self.fir.set_impulse_response([0.5, 0.25, 0.0], True)
+
+        for (before, after) in zip(buffers, [self.fir.signal, self.fir.signal_real, self.fir.signal_imag, self.fir.olap]):
+            self.assertTrue(before is after)
+
+    def test_reuse_spectra(self):
+        spectra = [(self.fir.ir_real, self.fir.ir_imag)]
+        self.fir.set_impulse_response([0.5, 0.25, 0.0], crossfade=True)
+        spectra.append((self.fir.ir_real, self.fir.ir_imag))
+        self.fir.set_impulse_response([0.25, 0.0, 0.5], crossfade=True)
+        spectra.append((self.fir.ir_real, self.fir.ir_imag))
+        self.fir.set_impulse_response([1.0, 0.0, 0.0])
+
+        self.assertFalse(spectra[0][0] is spectra[1][0])
+        self.assertTrue(spectra[0][0] is spectra[2][0])
+        self.assertTrue(spectra[0][1] is spectra[2][1])
+        self.assertTrue(spectra[0][0] is self.fir.ir_real)
+
+    def test_keep_tail(self):
+        output = [0] * self.signal_length
+        self.fir.process(self.signal, output)
+
+        self.fir.set_impulse_response([1.0])
+        self.fir.process([0] * self.signal_length, output)
+
+        self.assertAlmostEqual(0.5 * self.signal[2], output[0])
+        self.assertAlmostEqual(0.5 * self.signal[3], output[1])
+        self.assertAlmostEqual(0.0, output[2])
+        self.assertAlmostEqual(0.0, output[3])
+
+    def test_shorter_fft(self):
+        output = [0] * self.signal_length
+        self.fir.set_impulse_response([0.0] * 7 + [1.0])
+        self.fir.process(self.signal, output)
+
+        self.fir.set_impulse_response([1.0])
+        self.assertEqual(4, self.fir.fftsize)
+
+        self.fir.process([0] * self.signal_length, output)
+        for i in range(0, self.signal_length - 1):
+            self.assertAlmostEqual(0.0, output[i])
+        self.assertAlmostEqual(self.signal[0], output[3])
+
+        self.fir.process([0] * self.signal_length, output)
+        for i in range(1, self.signal_length):
+            self.assertAlmostEqual(self.signal[i], output[i - 1])
+        self.assertAlmostEqual(0.0, output[3])
+
+    def test_crossfade(self):
+        ones = [1.0] * self.signal_length
+        output = [0] * self.signal_length
+        self.fir.set_impulse_response([1.0])
+        self.fir.process(ones, output)
+
+        self.fir.set_impulse_response([-1.0], crossfade=True)
+        self.fir.process(ones, output)
+
+        for i in range(0, self.signal_length):
+            alpha = (i + 1.0) / self.signal_length
+            self.assertAlmostEqual(1.0 - 2.0 * alpha, output[i])
+
+        self.fir.process(ones, output)
+        for i in range(0, self.signal_length):
+            self.assertAlmostEqual(-1.0, output[i])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -108,5 +108,69 @@ class TestCustomFilter(unittest.TestCase):
             self.assertAlmostEqual(0, outsignal[i])
 
 
+    def test_minimum_phase_flat(self):
+        insignal = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, self.framesize)]
+        outsignal = [0] * self.framesize
+        flatresp = [1] * int((self.framesize/2)+1)
+
+        self.flt.design(flatresp, db=False, phase='minimum')
+        self.flt.process(insignal, outsignal)
+
+        self.assertEqual(0, self.flt.latency)
+        self.assertEqual(1, len(self.flt.ir))
+        for i in range(0, self.framesize):
+            self.assertAlmostEqual(insignal[i], outsignal[i])
+
+    def test_minimum_phase_response(self):
+        size = int((self.framesize/2)+1)
+        resp = [6.0 * math.sin(i / 40.0) for i in range(0, size)]
+
+        self.flt.design(resp, db=True, phase='minimum')
+
+        self.assertEqual(0, self.flt.latency)
+        self.assertTrue(len(self.flt.ir) < self.framesize / 2)
+
+        ir = self.flt.ir + [0] * (self.framesize - len(self.flt.ir))
+        fr_real, fr_imag = frequency_response(ir)
+        ampl = amplitude_response(fr_real, fr_imag, db=True)
+
+        for i in range(0, size):
+            self.assertAlmostEqual(resp[i], ampl[i], delta=0.25)
+
+    def test_invalid_phase(self):
+        flatresp = [1] * int((self.framesize/2)+1)
+
+        self.assertRaises(ValueError, self.flt.design, flatresp, False, 'mixed')
+
+
+    def test_redesign_reuse(self):
+        flatresp = [0] * int((self.framesize/2)+1)
+        fft = self.flt.fft
+        fir = self.flt.fir
+        buffers = [self.flt.fr_real, self.flt.fr_imag, self.flt.shifted_ir, self.flt.ir]
+
+        self.flt.design(flatresp, db=True)
+        self.flt.design([-6.0] * len(flatresp), db=True, crossfade=True)
+
+        self.assertTrue(fft is self.flt.fft)
+        self.assertTrue(fir is self.flt.fir)
+        for (before, after) in zip(buffers, [self.flt.fr_real, self.flt.fr_imag, self.flt.shifted_ir, self.flt.ir]):
+            self.assertTrue(before is after)
+
+    def test_redesign_crossfade(self):
+        insignal = [1.0] * self.framesize
+        outsignal = [0] * self.framesize
+        size = int((self.framesize/2)+1)
+
+        self.flt.design([1] * size, db=False, phase='minimum')
+        self.flt.process(insignal, outsignal)
+        self.flt.design([0.5] * size, db=False, phase='minimum', crossfade=True)
+        self.flt.process(insignal, outsignal)
+
+        for i in range(0, self.framesize):
+            alpha = (i + 1.0) / self.framesize
+            self.assertAlmostEqual(1.0 - 0.5 * alpha, outsignal[i])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import math
+import yodel.filter
+
+
+def sine(frequency, samplerate, size):
+    return [math.sin(2.0*math.pi*frequency*i/samplerate) for i in range(0, size)]
+
+
+class TestDecimator(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000.0
+        self.size = 2400
+
+    def test_identity_taps(self):
+        dec = yodel.filter.Decimator(4, [1.0])
+        insignal = sine(100.0, self.samplerate, self.size)
+        outsignal = [0] * dec.max_output_size(self.size)
+
+        count = dec.process(insignal, outsignal)
+
+        self.assertEqual(self.size / 4, count)
+        for i in range(0, count):
+            self.assertEqual(insignal[4*i], outsignal[i])
+
+    def test_custom_taps(self):
+        dec = yodel.filter.Decimator(2, [0.5, 0.5])
+        insignal = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        outsignal = [0] * dec.max_output_size(len(insignal))
+
+        count = dec.process(insignal, outsignal)
+
+        self.assertEqual(3, count)
+        self.assertEqual([0.5, 2.5, 4.5], outsignal)
+
+    def test_multistage(self):
+        dec = yodel.filter.Decimator(8)
+
+        self.assertEqual(3, len(dec.stages))
+        for stage in dec.stages:
+            self.assertEqual(2, stage.factor)
+
+    def test_passband(self):
+        for factor in [2, 3, 4, 6, 8]:
+            dec = yodel.filter.Decimator(factor)
+            insignal = sine(500.0, self.samplerate, self.size)
+            outsignal = [0] * dec.max_output_size(self.size)
+
+            count = dec.process(insignal, outsignal)
+
+            peak = max([abs(s) for s in outsignal[int(count/2):count]])
+            self.assertAlmostEqual(1.0, peak, delta=1e-2)
+
+    def test_stopband(self):
+        for factor in [2, 3, 4, 6, 8]:
+            dec = yodel.filter.Decimator(factor)
+            frequency = 1.25 * self.samplerate / (2.0 * factor)
+            insignal = sine(frequency, self.samplerate, self.size)
+            outsignal = [0] * dec.max_output_size(self.size)
+
+            count = dec.process(insignal, outsignal)
+
+            peak = max([abs(s) for s in outsignal[int(count/2):count]])
+            self.assertAlmostEqual(0.0, peak, delta=1e-2)
+
+    def test_streaming(self):
+        insignal = sine(500.0, self.samplerate, self.size)
+        dec = yodel.filter.Decimator(6)
+        outsignal = [0] * dec.max_output_size(self.size)
+        count = dec.process(insignal, outsignal)
+
+        dec.reset()
+        streamed = []
+        for i in range(0, self.size, 100):
+            block = insignal[i:i+100]
+            outblock = [0] * dec.max_output_size(len(block))
+            blockcount = dec.process(block, outblock)
+            streamed += outblock[0:blockcount]
+
+        self.assertEqual(count, len(streamed))
+        for i in range(0, count):
+            self.assertAlmostEqual(outsignal[i], streamed[i])
+
+    def test_streaming_odd_blocks(self):
+        insignal = sine(500.0, 3000, 3000)
+        for factor in [4, 6, 8]:
+            dec = yodel.filter.Decimator(factor)
+            outsignal = [0] * dec.max_output_size(len(insignal))
+            count = dec.process(insignal, outsignal)
+            self.assertEqual(3000 // factor, count)
+
+            dec.reset()
+            streamed = []
+            sizes = [7, 13, 1, 100, 33, 5]
+            i = 0
+            while i < len(insignal):
+                block = insignal[i:i+sizes[0]]
+                i += len(block)
+                sizes = sizes[1:] + sizes[0:1]
+                outblock = [0] * dec.max_output_size(len(block))
+                blockcount = dec.process(block, outblock)
+                streamed += outblock[0:blockcount]
+
+            self.assertEqual(count, len(streamed))
+            for j in range(0, count):
+                self.assertAlmostEqual(outsignal[j], streamed[j])
+
+
+if __name__ == '__main__':
+    unittest.main()
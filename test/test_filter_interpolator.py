@@ -0,0 +1,66 @@
+import unittest
+import math
+import yodel.filter
+
+
+def sine(frequency, samplerate, size):
+    return [math.sin(2.0*math.pi*frequency*i/samplerate) for i in range(0, size)]
+
+
+class TestInterpolator(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 12000.0
+        self.size = 600
+
+    def test_linear_taps(self):
+        itp = yodel.filter.Interpolator(2, [0.25, 0.5, 0.25])
+        insignal = [2.0, 4.0, 6.0]
+        outsignal = [0] * itp.max_output_size(len(insignal))
+
+        count = itp.process(insignal, outsignal)
+
+        self.assertEqual(6, count)
+        self.assertEqual([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], outsignal)
+
+    def test_multistage(self):
+        itp = yodel.filter.Interpolator(12)
+
+        self.assertEqual(3, len(itp.stages))
+        self.assertEqual(3, itp.stages[0].factor)
+        self.assertEqual(2, itp.stages[1].factor)
+        self.assertEqual(2, itp.stages[2].factor)
+
+    def test_sine(self):
+        for factor in [2, 3, 4, 6, 8]:
+            itp = yodel.filter.Interpolator(factor)
+            insignal = sine(500.0, self.samplerate, self.size)
+            outsignal = [0] * itp.max_output_size(self.size)
+
+            count = itp.process(insignal, outsignal)
+
+            self.assertEqual(factor * self.size, count)
+            peak = max([abs(s) for s in outsignal[int(count/2):count]])
+            self.assertAlmostEqual(1.0, peak, delta=1e-2)
+
+    def test_streaming(self):
+        insignal = sine(500.0, self.samplerate, self.size)
+        itp = yodel.filter.Interpolator(4)
+        outsignal = [0] * itp.max_output_size(self.size)
+        itp.process(insignal, outsignal)
+
+        itp.reset()
+        streamed = []
+        for i in range(0, self.size, 64):
+            block = insignal[i:i+64]
+            outblock = [0] * itp.max_output_size(len(block))
+            itp.process(block, outblock)
+            streamed += outblock
+
+        self.assertEqual(len(outsignal), len(streamed))
+        for i in range(0, len(outsignal)):
+            self.assertAlmostEqual(outsignal[i], streamed[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
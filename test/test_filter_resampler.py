@@ -0,0 +1,94 @@
+import unittest
+import math
+import yodel.filter
+
+
+def sine(frequency, samplerate, size):
+    return [math.sin(2.0*math.pi*frequency*i/samplerate) for i in range(0, size)]
+
+
+class CommonResamplerTest:
+
+    def setUp(self):
+        self.frequency = 1000.0
+        self.size = 2048
+        self.rsp = yodel.filter.Resampler(self.in_rate, self.out_rate)
+
+    def test_output_size(self):
+        insignal = [0] * self.size
+        outsignal = [0] * self.rsp.max_output_size(self.size)
+
+        count = self.rsp.process(insignal, outsignal)
+
+        expected = self.size * float(self.out_rate) / float(self.in_rate)
+        self.assertAlmostEqual(expected, count, delta=1)
+
+    def test_sine(self):
+        insignal = sine(self.frequency, self.in_rate, self.size)
+        outsignal = [0] * self.rsp.max_output_size(self.size)
+
+        count = self.rsp.process(insignal, outsignal)
+
+        start = int(2 * self.rsp.latency)
+        for i in range(start, count):
+            t = (i - self.rsp.latency) / float(self.out_rate)
+            expected = math.sin(2.0*math.pi*self.frequency*t)
+            self.assertAlmostEqual(expected, outsignal[i], delta=1e-3)
+
+    def test_streaming(self):
+        insignal = sine(self.frequency, self.in_rate, self.size)
+        outsignal = [0] * self.rsp.max_output_size(self.size)
+        count = self.rsp.process(insignal, outsignal)
+
+        rsp = yodel.filter.Resampler(self.in_rate, self.out_rate)
+        blocksize = 100
+        streamed = []
+        for i in range(0, self.size, blocksize):
+            block = insignal[i:i+blocksize]
+            outblock = [0] * rsp.max_output_size(len(block))
+            blockcount = rsp.process(block, outblock)
+            streamed += outblock[0:blockcount]
+
+        self.assertEqual(count, len(streamed))
+        for i in range(0, count):
+            self.assertAlmostEqual(outsignal[i], streamed[i])
+
+    def test_shared_tables(self):
+        rsp = yodel.filter.Resampler(self.in_rate, self.out_rate)
+
+        self.assertTrue(rsp.branches is self.rsp.branches)
+
+
+class TestUpsampler(CommonResamplerTest, unittest.TestCase):
+
+    in_rate = 44100
+    out_rate = 48000
+
+    def test_rational(self):
+        self.assertTrue(self.rsp.rational)
+        self.assertEqual(160, self.rsp.up)
+        self.assertEqual(147, self.rsp.down)
+
+
+class TestDownsampler(CommonResamplerTest, unittest.TestCase):
+
+    in_rate = 96000
+    out_rate = 44100
+
+    def test_rational(self):
+        self.assertTrue(self.rsp.rational)
+        self.assertEqual(147, self.rsp.up)
+        self.assertEqual(320, self.rsp.down)
+
+
+class TestArbitraryResampler(CommonResamplerTest, unittest.TestCase):
+
+    in_rate = 44100
+    out_rate = 48000.5
+
+    def test_rational(self):
+        self.assertFalse(self.rsp.rational)
+
+
+if __name__ == '__main__':
+    unittest.main()
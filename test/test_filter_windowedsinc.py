@@ -119,5 +119,63 @@ class TestWindowedSincFilter(unittest.TestCase):
         self.assertAlmostEqual(0.5, idxtopalpha * bpamp[int(idxtop)] + idxtopbeta * bpamp[int(idxtop+1)], delta=1e-3)
 
 
+    def test_process(self):
+        insignal = [0] * self.framesize
+        insignal[0] = 1
+        outsignal = [0] * self.framesize
+
+        self.flt.low_pass(0.04 * self.samplerate, 1280)
+        self.flt.process(insignal, outsignal)
+
+        for i in range(0, self.flt.kernelsize):
+            self.assertAlmostEqual(self.flt.kernel[i], outsignal[i])
+
+    def test_redesign_crossfade(self):
+        insignal = [1.0] * self.framesize
+        outsignal = [0] * self.framesize
+        lpsignal = [0] * self.framesize
+        hpsignal = [0] * self.framesize
+
+        lpf = yodel.filter.WindowedSinc(self.samplerate, self.framesize)
+        lpf.low_pass(0.04 * self.samplerate, 1280)
+        lpf.process(insignal, lpsignal)
+        hpf = yodel.filter.WindowedSinc(self.samplerate, self.framesize)
+        hpf.high_pass(0.04 * self.samplerate, 1280)
+        hpf.process(insignal, hpsignal)
+
+        self.flt.low_pass(0.04 * self.samplerate, 1280)
+        fft = self.flt.conv.fft
+        self.flt.process(insignal, outsignal)
+        self.flt.high_pass(0.04 * self.samplerate, 1280, crossfade=True)
+        self.flt.process(insignal, outsignal)
+
+        self.assertTrue(fft is self.flt.conv.fft)
+        self.assertAlmostEqual(1.0, outsignal[0], delta=1e-2)
+        for i in range(self.flt.kernelsize, self.framesize):
+            alpha = (i + 1.0) / self.framesize
+            expected = lpsignal[i] + alpha * (hpsignal[i] - lpsignal[i])
+            self.assertAlmostEqual(expected, outsignal[i])
+    def test_redesign_reuse(self):
+        self.flt.low_pass(0.04 * self.samplerate, 1280)
+        kernel = self.flt.kernel
+        lowpass = self.flt._lowpass
+        ir = self.flt.conv.ir
+
+        for (design, frequency, bandwidth) in [('high_pass', 0.05, 1280), ('band_reject', 0.1, 2560),
+                                               ('band_pass', 0.2, 2560), ('low_pass', 0.01, 1280)]:
+            getattr(self.flt, design)(frequency * self.samplerate, bandwidth, crossfade=True)
+            self.assertTrue(kernel is self.flt.kernel)
+            self.assertTrue(lowpass is self.flt._lowpass)
+            self.assertTrue(ir is self.flt.conv.ir)
+
+            reference = yodel.filter.WindowedSinc(self.samplerate, self.framesize)
+            getattr(reference, design)(frequency * self.samplerate, bandwidth)
+            self.assertEqual(reference.kernel, self.flt.kernel)
+
+        self.flt.low_pass(0.04 * self.samplerate, 640)
+        self.assertEqual(301, len(self.flt.kernel))
+        self.assertEqual(301, len(self.flt._lowpass))
+
+
 if __name__ == '__main__':
     unittest.main()
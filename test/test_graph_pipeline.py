@@ -0,0 +1,116 @@
+import unittest
+import array
+import math
+import yodel.graph
+import yodel.filter
+import yodel.delay
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 256
+        self.pipeline = yodel.graph.Pipeline()
+        self.signal = [math.sin(2.0*math.pi*100.0*i/self.samplerate) + 0.1*math.cos(2.0*math.pi*5000.0*i/self.samplerate) for i in range(0, self.block_size)]
+
+    def biquad(self, kind, cutoff):
+        flt = yodel.filter.Biquad()
+        getattr(flt, kind)(self.samplerate, cutoff, 1.0 / math.sqrt(2.0))
+        return flt
+
+    def test_empty(self):
+        output = array.array('d', [0.0]) * self.block_size
+        self.pipeline.process(self.signal, output)
+        self.assertEqual(self.signal, output.tolist())
+
+    def test_chain(self):
+        def make():
+            return [self.biquad('low_pass', 5000), self.biquad('high_pass', 50),
+                    yodel.delay.DelayLine(self.samplerate, 10, 1.0),
+                    yodel.filter.FastConvolution(self.block_size, [1.0, 0.5, 0.25])]
+        stages = make()
+        for stage in make():
+            self.pipeline.add(stage)
+        expected = list(self.signal)
+        output = [0] * self.block_size
+
+        for block in range(0, 3):
+            for stage in stages:
+                stage.process(expected, expected)
+            self.pipeline.process(self.signal, output)
+            for i in range(0, self.block_size):
+                self.assertAlmostEqual(expected[i], output[i])
+            expected = list(self.signal)
+
+        self.assertEqual(1, self.pipeline.num_buffers)
+
+    def test_fan_out_fan_in(self):
+        low = self.pipeline.add(self.biquad('low_pass', 1000))
+        high = self.pipeline.add(self.biquad('high_pass', 1000), [yodel.graph.Pipeline.INPUT])
+        delayed = self.pipeline.add(yodel.delay.DelayLine(self.samplerate, 10, 0.5), [high])
+        self.pipeline.add(None, [low, delayed])
+        output = [0] * self.block_size
+
+        self.pipeline.process(self.signal, output)
+
+        lows = [0] * self.block_size
+        highs = [0] * self.block_size
+        self.biquad('low_pass', 1000).process(self.signal, lows)
+        self.biquad('high_pass', 1000).process(self.signal, highs)
+        yodel.delay.DelayLine(self.samplerate, 10, 0.5).process(highs, highs)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(lows[i] + highs[i], output[i])
+        self.assertEqual(2, self.pipeline.num_buffers)
+
+    def test_width(self):
+        sources = []
+        for k in range(0, 3):
+            stage = self.pipeline.add(lambda x, y: y.__setitem__(slice(0, len(x)), [2.0 * v for v in x]), [yodel.graph.Pipeline.INPUT])
+            for j in range(0, 5):
+                stage = self.pipeline.add(lambda x, y: y.__setitem__(slice(0, len(x)), [v + 1.0 for v in x]), [stage])
+            sources.append(stage)
+        self.pipeline.add(None, sources)
+        output = [0] * self.block_size
+
+        self.pipeline.process(self.signal, output)
+
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(3 * (2.0 * self.signal[i] + 5.0), output[i])
+        self.assertEqual(3, self.pipeline.num_buffers)
+
+    def test_not_in_place(self):
+        def process(x, y):
+            self.assertFalse(x is y)
+            y[0:len(x)] = [-v for v in x]
+        self.pipeline.add(process, in_place=False)
+        self.pipeline.add(process, in_place=False)
+        self.pipeline.add(process, [1, yodel.graph.Pipeline.INPUT], in_place=False)
+        output = [0] * self.block_size
+
+        self.pipeline.process(self.signal, output)
+
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(-2.0 * self.signal[i], output[i])
+
+    def test_set_output(self):
+        first = self.pipeline.add(self.biquad('low_pass', 1000))
+        self.pipeline.add(self.biquad('high_pass', 1000))
+        self.pipeline.set_output(first)
+        output = [0] * self.block_size
+        expected = [0] * self.block_size
+
+        self.pipeline.process(self.signal, output)
+
+        self.biquad('low_pass', 1000).process(self.signal, expected)
+        for i in range(0, self.block_size):
+            self.assertAlmostEqual(expected[i], output[i])
+
+    def test_invalid_inputs(self):
+        self.assertRaises(ValueError, self.pipeline.add, None, [])
+        self.assertRaises(ValueError, self.pipeline.add, None, [0])
+        self.assertRaises(ValueError, self.pipeline.set_output, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import math
+import yodel.instrument
+import yodel.filter
+import yodel.graph
+import yodel.delay
+import yodel.parallel
+
+
+class TestInstrument(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 256
+        self.signal = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, self.block_size)]
+        yodel.instrument.reset()
+
+    def tearDown(self):
+        yodel.instrument.disable()
+        yodel.instrument.reset()
+
+    def biquad(self):
+        flt = yodel.filter.Biquad()
+        flt.low_pass(self.samplerate, 1000, 1.0 / math.sqrt(2.0))
+        return flt
+
+    def test_disabled(self):
+        process = yodel.filter.Biquad.process
+        with yodel.instrument.profiling():
+            self.assertTrue(yodel.instrument.is_enabled())
+            self.assertFalse(yodel.filter.Biquad.process is process)
+        self.assertFalse(yodel.instrument.is_enabled())
+        self.assertTrue(yodel.filter.Biquad.process is process)
+
+        output = [0] * self.block_size
+        self.biquad().process(self.signal, output)
+        self.assertEqual({}, yodel.instrument.stats())
+
+    def test_pipeline(self):
+        pipeline = yodel.graph.Pipeline()
+        low = self.biquad()
+        high = self.biquad()
+        yodel.instrument.label(high, 'second')
+        pipeline.add(low)
+        pipeline.add(high)
+        pipeline.add(yodel.delay.DelayLine(self.samplerate, 10, 1.0))
+        output = [0] * self.block_size
+        expected = [0] * self.block_size
+        self.biquad().process(self.signal, expected)
+        self.biquad().process(expected, expected)
+        pipeline.process(self.signal, expected)
+
+        with yodel.instrument.profiling():
+            for block in range(0, 3):
+                pipeline.process(self.signal, output)
+        stats = yodel.instrument.stats()
+
+        self.assertEqual(set(['Pipeline', 'Biquad', 'second', 'DelayLine']), set(stats.keys()))
+        for name in stats:
+            self.assertEqual(3, stats[name]['calls'])
+            self.assertEqual(3 * self.block_size, stats[name]['samples'])
+            self.assertTrue(stats[name]['max_time'] <= stats[name]['total_time'])
+            self.assertAlmostEqual(stats[name]['total_time'] / 3.0, stats[name]['mean_time'])
+            self.assertFalse('max_memory' in stats[name])
+        self.assertTrue(stats['Pipeline']['total_time'] >= stats['Biquad']['total_time'] + stats['second']['total_time'])
+
+    def test_keyword_arguments(self):
+        dly = yodel.delay.MultiTapDelay(self.samplerate, 10)
+        dly.add_tap(1.0, 0.5)
+        output = [0] * self.block_size
+        taps = [[0] * self.block_size]
+        with yodel.instrument.profiling():
+            dly.process(self.signal, output, tap_signals=taps)
+        self.assertEqual(output, taps[0])
+        self.assertEqual(1, yodel.instrument.stats()['MultiTapDelay']['calls'])
+
+    def test_threads(self):
+        channels = 8
+        processors = []
+        for channel in range(0, channels):
+            pipeline = yodel.graph.Pipeline()
+            pipeline.add(self.biquad())
+            pipeline.add(yodel.delay.DelayLine(self.samplerate, 10, 1.0))
+            processors.append(pipeline)
+        outputs = [[0] * self.block_size for channel in range(0, channels)]
+        with yodel.parallel.ThreadedPipeline(processors, 4) as threaded:
+            with yodel.instrument.profiling(memory=True):
+                for block in range(0, 20):
+                    threaded.process([self.signal] * channels, outputs)
+        stats = yodel.instrument.stats()
+        for name in ['Pipeline', 'Biquad', 'DelayLine']:
+            self.assertEqual(20 * channels, stats[name]['calls'])
+            self.assertEqual(20 * channels * self.block_size, stats[name]['samples'])
+            self.assertTrue(stats[name]['max_memory'] >= 0)
+
+    def test_memory(self):
+        flt = yodel.filter.FastConvolution(self.block_size, [1.0, 0.5])
+        output = [0] * self.block_size
+        with yodel.instrument.profiling(memory=True):
+            flt.process(self.signal, output)
+        stats = yodel.instrument.stats()
+        self.assertTrue(stats['FastConvolution']['max_memory'] > 8 * self.block_size)
+
+    def test_reset(self):
+        yodel.instrument.enable()
+        self.biquad().process(self.signal, [0] * self.block_size)
+        snapshot = yodel.instrument.stats()
+        self.assertEqual(1, snapshot['Biquad']['calls'])
+        yodel.instrument.reset()
+        self.assertEqual({}, yodel.instrument.stats())
+        self.assertEqual(1, snapshot['Biquad']['calls'])
+
+
+if __name__ == '__main__':
+    unittest.main()
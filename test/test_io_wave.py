@@ -0,0 +1,123 @@
+import unittest
+import array
+import math
+import os
+import shutil
+import struct
+import tempfile
+import wave
+import yodel.io
+import yodel.filter
+
+
+class TestWave(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.frames = 1000
+        self.channels = 2
+        self.signals = [[0.9 * math.sin(2.0*math.pi*(100.0 + 200.0*c)*i/self.samplerate) for i in range(0, self.frames)] for c in range(0, self.channels)]
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'test.wav')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, sample_format, block_size=300):
+        with yodel.io.WaveWriter(self.filename, self.samplerate, self.channels, sample_format) as writer:
+            for start in range(0, self.frames, block_size):
+                writer.write([signal[start:start + block_size] for signal in self.signals])
+            self.assertEqual(self.frames, writer.frames)
+
+    def read(self, block_size=256):
+        output = [[], []]
+        with yodel.io.WaveReader(self.filename) as reader:
+            self.assertEqual(self.samplerate, reader.samplerate)
+            self.assertEqual(self.channels, reader.channels)
+            self.assertEqual(self.frames, reader.frames)
+            for block in reader.blocks(block_size):
+                for c in range(0, self.channels):
+                    output[c].extend(block[c])
+        return output
+
+    def compare(self, sample_format, places):
+        self.write(sample_format)
+        output = self.read()
+        for c in range(0, self.channels):
+            self.assertEqual(self.frames, len(output[c]))
+            for i in range(0, self.frames):
+                self.assertAlmostEqual(self.signals[c][i], output[c][i], places=places)
+
+    def test_pcm16(self):
+        self.compare('pcm16', 4)
+
+    def test_pcm24(self):
+        self.compare('pcm24', 6)
+
+    def test_pcm32(self):
+        self.compare('pcm32', 8)
+
+    def test_float32(self):
+        self.compare('float32', 6)
+
+    def test_standard_reader(self):
+        self.write('pcm16')
+        with wave.open(self.filename, 'rb') as reader:
+            self.assertEqual(self.channels, reader.getnchannels())
+            self.assertEqual(self.samplerate, reader.getframerate())
+            self.assertEqual(2, reader.getsampwidth())
+            samples = struct.unpack('<%dh' % (self.frames * self.channels), reader.readframes(self.frames))
+        for c in range(0, self.channels):
+            for i in range(0, self.frames):
+                self.assertAlmostEqual(self.signals[c][i], samples[i * self.channels + c] / 32768.0, places=4)
+
+    def test_standard_writer(self):
+        with wave.open(self.filename, 'wb') as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(3)
+            writer.setframerate(self.samplerate)
+            writer.writeframes(b''.join(struct.pack('<i', int(v * 8388607.0))[0:3] for v in self.signals[0]))
+        with yodel.io.WaveReader(self.filename) as reader:
+            self.assertEqual('pcm24', reader.sample_format)
+            output = array.array('d', [0.0]) * self.frames
+            self.assertEqual(self.frames, reader.read([output]))
+        for i in range(0, self.frames):
+            self.assertAlmostEqual(self.signals[0][i], output[i], places=6)
+
+    def test_clipping(self):
+        self.signals = [[2.0, -2.0, 1.0], [0.0, 0.5, -1.0]]
+        self.frames = 3
+        self.write('pcm16')
+        output = self.read()
+        self.assertEqual([32767.0 / 32768.0, -1.0, 32767.0 / 32768.0], output[0])
+        self.assertEqual([0.0, 0.5, -1.0], output[1])
+
+    def test_seek_and_process(self):
+        self.write('float32')
+        output = [[0.0] * 100, [0.0] * 100]
+        with yodel.io.WaveReader(self.filename) as reader:
+            reader.seek(self.frames - 50)
+            self.assertEqual(50, reader.read(output))
+            self.assertEqual(0, reader.read(output))
+            self.assertRaises(ValueError, reader.seek, self.frames + 1)
+            reader.seek(0)
+            flt = yodel.filter.Biquad()
+            flt.low_pass(self.samplerate, 1000, 1.0)
+            reader.read(output)
+            flt.process(output[0], output[0])
+        expected = [0.0] * 100
+        flt = yodel.filter.Biquad()
+        flt.low_pass(self.samplerate, 1000, 1.0)
+        flt.process(array.array('f', self.signals[0][0:100]).tolist(), expected)
+        for i in range(0, 100):
+            self.assertAlmostEqual(expected[i], output[0][i])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, yodel.io.WaveWriter, self.filename, self.samplerate, 1, 'pcm8')
+        with open(self.filename, 'wb') as f:
+            f.write(b'RIFX' + b'\0' * 40)
+        self.assertRaises(ValueError, yodel.io.WaveReader, self.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
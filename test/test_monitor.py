@@ -0,0 +1,91 @@
+import unittest
+import math
+import time
+import yodel.monitor
+import yodel.filter
+import yodel.graph
+
+
+class TestDeadlineMonitor(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 480
+        self.signal = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, self.block_size)]
+
+    def sleeper(self, durations):
+        durations = list(durations)
+
+        def process(x, y):
+            time.sleep(durations.pop(0))
+            y[0:len(x)] = x
+        return process
+
+    def biquad(self):
+        flt = yodel.filter.Biquad()
+        flt.low_pass(self.samplerate, 1000, 1.0)
+        return flt
+
+    def test_transparent(self):
+        expected = [0] * self.block_size
+        self.biquad().process(self.signal, expected)
+
+        monitor = yodel.monitor.DeadlineMonitor(self.biquad(), self.samplerate, self.block_size)
+        pipeline = yodel.graph.Pipeline()
+        pipeline.add(monitor)
+        output = [0] * self.block_size
+        pipeline.process(self.signal, output)
+
+        self.assertEqual(expected, output)
+        self.assertEqual(1, monitor.blocks)
+        self.assertAlmostEqual(0.01, monitor.deadline)
+        self.assertEqual(1, sum(monitor.histogram))
+
+    def test_overruns(self):
+        overruns = []
+        monitor = yodel.monitor.DeadlineMonitor(self.sleeper([0.0, 0.02, 0.0, 0.03]), self.samplerate, self.block_size,
+                                                window=2, on_overrun=lambda m, elapsed, deadline: overruns.append((elapsed, deadline)))
+        output = [0] * self.block_size
+        for block in range(0, 4):
+            monitor.process(self.signal, output)
+
+        self.assertEqual(4, monitor.blocks)
+        self.assertEqual(2, monitor.overruns)
+        self.assertEqual(2, len(overruns))
+        self.assertTrue(overruns[1][0] >= 0.03)
+        self.assertAlmostEqual(0.01, overruns[1][1])
+        self.assertTrue(monitor.max_load >= 3.0)
+        self.assertTrue(monitor.load >= 3.0)
+        self.assertTrue(monitor.cpu_load() >= 150.0)
+        self.assertEqual(2, monitor.histogram[-1])
+        self.assertEqual(4, sum(monitor.histogram))
+
+        monitor.reset()
+        self.assertEqual(0, monitor.blocks)
+        self.assertEqual(0, monitor.overruns)
+        self.assertEqual(0.0, monitor.cpu_load())
+        self.assertEqual(0, sum(monitor.histogram))
+
+    def test_budget(self):
+        monitor = yodel.monitor.DeadlineMonitor(self.sleeper([0.006, 0.006]), self.samplerate, self.block_size, budget=0.5)
+        output = [0] * self.block_size
+        monitor.process(self.signal, output)
+        self.assertEqual(1, monitor.overruns)
+        monitor.process(self.signal + self.signal, output + output)
+        self.assertEqual(1, monitor.overruns)
+        self.assertRaises(ValueError, yodel.monitor.DeadlineMonitor, None, self.samplerate, self.block_size, budget=0.0)
+        self.assertRaises(ValueError, yodel.monitor.DeadlineMonitor, None, self.samplerate, self.block_size, window=0)
+
+    def test_result(self):
+        decimator = yodel.filter.Decimator(4)
+        monitor = yodel.monitor.DeadlineMonitor(yodel.filter.Decimator(4), self.samplerate, self.block_size)
+        for size in [self.block_size, 7, 13]:
+            output = [0] * monitor.processor.max_output_size(size)
+            expected = [0] * decimator.max_output_size(size)
+            count = monitor.process(self.signal[0:size], output)
+            self.assertEqual(decimator.process(self.signal[0:size], expected), count)
+            self.assertEqual(expected[0:count], output[0:count])
+
+
+if __name__ == '__main__':
+    unittest.main()
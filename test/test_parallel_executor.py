@@ -0,0 +1,57 @@
+import unittest
+import array
+import math
+import yodel.parallel
+import yodel.graph
+import yodel.filter
+import yodel.delay
+
+
+class TestProcessExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 256
+        self.channels = 3
+        self.signals = [[math.sin(2.0*math.pi*(100.0 + 50.0*c)*i/self.samplerate) for i in range(0, self.block_size)] for c in range(0, self.channels)]
+
+    def make(self, channel):
+        pipeline = yodel.graph.Pipeline()
+        flt = yodel.filter.Biquad()
+        flt.low_pass(self.samplerate, 1000 + 500 * channel, 1.0 / math.sqrt(2.0))
+        pipeline.add(flt)
+        pipeline.add(yodel.delay.DelayLine(self.samplerate, 10, 0.5 + channel))
+        return pipeline
+
+    def test_process(self):
+        serial = [self.make(c) for c in range(0, self.channels)]
+        expected = [[0] * self.block_size for c in range(0, self.channels)]
+        outputs = [array.array('d', [0.0]) * self.block_size for c in range(0, self.channels)]
+
+        with yodel.parallel.ProcessExecutor([self.make(c) for c in range(0, self.channels)], self.block_size, 2) as executor:
+            self.assertEqual(2, executor.workers)
+            for block in range(0, 3):
+                for c in range(0, self.channels):
+                    serial[c].process(self.signals[c], expected[c])
+                executor.process(self.signals, outputs)
+                for c in range(0, self.channels):
+                    for i in range(0, self.block_size):
+                        self.assertAlmostEqual(expected[c][i], outputs[c][i])
+
+    def test_short_block(self):
+        size = self.block_size // 4
+        expected = [0] * size
+        output = [0] * size
+        self.make(0).process(self.signals[0][0:size], expected)
+
+        with yodel.parallel.ProcessExecutor([self.make(0)], self.block_size) as executor:
+            self.assertEqual(1, executor.workers)
+            executor.process([self.signals[0][0:size]], [output])
+            self.assertRaises(ValueError, executor.process, [[0.0] * (self.block_size + 1)], [output])
+
+        for i in range(0, size):
+            self.assertAlmostEqual(expected[i], output[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
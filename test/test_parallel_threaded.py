@@ -0,0 +1,56 @@
+import unittest
+import array
+import math
+import yodel.parallel
+import yodel.filter
+
+
+class TestThreadedPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 256
+        self.channels = 4
+        self.signals = [[math.sin(2.0*math.pi*(100.0 + 50.0*c)*i/self.samplerate) for i in range(0, self.block_size)] for c in range(0, self.channels)]
+
+    def make(self, channel):
+        flt = yodel.filter.Biquad()
+        flt.low_pass(self.samplerate, 1000 + 500 * channel, 1.0 / math.sqrt(2.0))
+        return flt
+
+    def test_process(self):
+        serial = [self.make(c) for c in range(0, self.channels)]
+        expected = [[0] * self.block_size for c in range(0, self.channels)]
+        outputs = [array.array('d', [0.0]) * self.block_size for c in range(0, self.channels)]
+
+        with yodel.parallel.ThreadedPipeline([self.make(c) for c in range(0, self.channels)], 2) as pipeline:
+            self.assertEqual(2, pipeline.workers)
+            for block in range(0, 3):
+                for c in range(0, self.channels):
+                    serial[c].process(self.signals[c], expected[c])
+                pipeline.process(self.signals, outputs)
+                for c in range(0, self.channels):
+                    for i in range(0, self.block_size):
+                        self.assertAlmostEqual(expected[c][i], outputs[c][i])
+
+    def test_callable(self):
+        def negate(x, y):
+            y[0:len(x)] = [-v for v in x]
+        output = [0] * self.block_size
+
+        with yodel.parallel.ThreadedPipeline([negate]) as pipeline:
+            pipeline.process([self.signals[0]], [output])
+
+        for i in range(0, self.block_size):
+            self.assertEqual(-self.signals[0][i], output[i])
+
+    def test_error(self):
+        def fail(x, y):
+            raise ValueError('failure')
+
+        with yodel.parallel.ThreadedPipeline([fail, fail]) as pipeline:
+            self.assertRaises(ValueError, pipeline.process, self.signals[0:2], self.signals[0:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
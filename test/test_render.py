@@ -0,0 +1,152 @@
+import unittest
+import io
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import yodel.render
+import yodel.io
+import yodel.filter
+import yodel.delay
+
+
+class TestRender(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.frames = 2500
+        self.tail = 2 + 48
+        self.signal = [0.5 * math.sin(2.0*math.pi*100.0*i/self.samplerate) + 0.1*math.cos(2.0*math.pi*9000.0*i/self.samplerate) for i in range(0, self.frames)]
+        self.directory = tempfile.mkdtemp()
+        self.spec = {
+            'blocksize': 512,
+            'sample_format': 'float32',
+            'chain': [
+                {'type': 'parametric_eq', 'bands': [
+                    {'frequency': 100, 'q': 0.7, 'gain': 3.0},
+                    {'frequency': 1000, 'q': 1.0, 'gain': -2.0},
+                    {'frequency': 8000, 'q': 0.7, 'gain': 1.5}]},
+                {'type': 'biquad', 'mode': 'low_pass', 'frequency': 5000, 'q': 0.707},
+                {'type': 'fast_convolution', 'impulse_response': [0.5, 0.25, 0.125]},
+                {'type': 'delay', 'delay': 1.0},
+                {'type': 'gain', 'gain': -6.0},
+            ],
+        }
+        for name in ['a.wav', 'b.wav']:
+            with yodel.io.WaveWriter(os.path.join(self.directory, name), self.samplerate, 2, 'float32') as writer:
+                writer.write([self.signal, [-v for v in self.signal]])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def expected(self, signal):
+        eq = yodel.filter.ParametricEQ(self.samplerate, 3)
+        eq.set_band(0, 100, 0.7, 3.0)
+        eq.set_band(1, 1000, 1.0, -2.0)
+        eq.set_band(2, 8000, 0.7, 1.5)
+        lp = yodel.filter.Biquad()
+        lp.low_pass(self.samplerate, 5000, 0.707)
+        conv = yodel.filter.FastConvolution(512, [0.5, 0.25, 0.125])
+        dly = yodel.delay.DelayLine(self.samplerate, 1.0, 1.0)
+        gain = 10.0 ** (-6.0 / 20.0)
+        output = []
+        for start in range(0, self.frames + self.tail, 512):
+            block = signal[start:start + 512]
+            block = block + [0.0] * (512 - len(block))
+            for stage in [eq, lp, conv, dly]:
+                stage.process(block, block)
+            output.extend([gain * v for v in block])
+        return output[0:self.frames + self.tail]
+
+    def check(self, filename):
+        with yodel.io.WaveReader(filename) as reader:
+            self.assertEqual('float32', reader.sample_format)
+            self.assertEqual(self.frames + self.tail, reader.frames)
+            channels = [[0.0] * reader.frames, [0.0] * reader.frames]
+            reader.read(channels)
+        expected = self.expected(self.signal)
+        for i in range(0, self.frames + self.tail):
+            self.assertAlmostEqual(expected[i], channels[0][i], places=5)
+            self.assertAlmostEqual(-expected[i], channels[1][i], places=5)
+
+    def test_render_file(self):
+        output = os.path.join(self.directory, 'out.wav')
+        (frames, samplerate, elapsed) = yodel.render.render_file(self.spec, os.path.join(self.directory, 'a.wav'), output)
+        self.assertEqual(self.frames + self.tail, frames)
+        self.assertEqual(self.samplerate, samplerate)
+        self.check(output)
+
+    def test_tail(self):
+        impulse_response = [0.5 ** (i / 100.0) for i in range(0, 1000)]
+        spec = {'blocksize': 256, 'sample_format': 'float32', 'tail': 0.01,
+                'chain': [{'type': 'fast_convolution', 'impulse_response': impulse_response},
+                          {'type': 'delay', 'delay': 2.0}]}
+        filename = os.path.join(self.directory, 'impulse.wav')
+        with yodel.io.WaveWriter(filename, self.samplerate, 1, 'float32') as writer:
+            writer.write([[1.0] + [0.0] * 99])
+        output = os.path.join(self.directory, 'out.wav')
+
+        (frames, samplerate, elapsed) = yodel.render.render_file(spec, filename, output)
+
+        self.assertEqual(100 + 999 + 96 + 480, frames)
+        with yodel.io.WaveReader(output) as reader:
+            self.assertEqual(frames, reader.frames)
+            signal = [0.0] * frames
+            reader.read([signal])
+        for i in range(0, 96):
+            self.assertEqual(0.0, signal[i])
+        for i in range(0, 1000):
+            self.assertAlmostEqual(impulse_response[i], signal[96 + i], places=5)
+        for i in range(96 + 1000, frames):
+            self.assertAlmostEqual(0.0, signal[i], places=5)
+
+    def test_main(self):
+        spec = os.path.join(self.directory, 'chain.json')
+        with open(spec, 'w') as f:
+            json.dump(self.spec, f)
+        output = os.path.join(self.directory, 'out')
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            status = yodel.render.main([spec, os.path.join(self.directory, '*.wav'), os.path.join(self.directory, 'a.wav'), '-o', output, '-j', '2'])
+            report = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+        self.assertEqual(0, status)
+        self.assertTrue('total: 2 files' in report)
+        self.assertTrue('realtime' in report)
+        for name in ['a.wav', 'b.wav']:
+            self.check(os.path.join(output, name))
+
+    def test_duplicate_names(self):
+        spec = os.path.join(self.directory, 'chain.json')
+        with open(spec, 'w') as f:
+            json.dump(self.spec, f)
+        inputs = []
+        for session in ['a', 'b']:
+            os.makedirs(os.path.join(self.directory, 'sessions', session))
+            inputs.append(os.path.join(self.directory, 'sessions', session, 'take1.wav'))
+            shutil.copy(os.path.join(self.directory, 'a.wav'), inputs[-1])
+        output = os.path.join(self.directory, 'out')
+        stderr = sys.stderr
+        sys.stderr = io.StringIO()
+        try:
+            with self.assertRaises(SystemExit) as context:
+                yodel.render.main([spec, os.path.join(self.directory, 'sessions', '*', '*.wav'), '-o', output])
+            message = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+        self.assertEqual(2, context.exception.code)
+        self.assertTrue(inputs[0] in message and inputs[1] in message)
+        self.assertFalse(os.path.exists(output))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, yodel.render.build_chain, {'chain': [{'type': 'unknown'}]}, self.samplerate)
+        filename = os.path.join(self.directory, 'a.wav')
+        self.assertRaises(ValueError, yodel.render.render_file, self.spec, filename, filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import yodel.reverb
+import math
+
+
+class TestFDN(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 8000
+        self.block_size = 512
+        self.rt60 = 0.5
+        self.fdn = yodel.reverb.FDN(self.samplerate, 4, rt60=self.rt60)
+
+    def tearDown(self):
+        pass
+
+    def impulse_response(self, size):
+        impulse = [0] * size
+        impulse[0] = 1
+        response = [0] * size
+        self.fdn.process(impulse, response)
+        return response
+
+    def energy(self, signal):
+        return sum([x * x for x in signal])
+
+    def test_default_delays(self):
+        self.assertEqual(4, len(self.fdn.delays))
+        for delay in self.fdn.delays:
+            self.assertTrue(30 <= delay <= 52)
+        self.assertEqual(min(self.fdn._sampledelays), self.fdn.min_delay)
+        self.assertEqual(sum(self.fdn._sampledelays), len(self.fdn.buffer))
+
+    def test_first_reflection(self):
+        response = self.impulse_response(self.block_size)
+
+        for i in range(0, self.fdn.min_delay):
+            self.assertEqual(0, response[i])
+        self.assertNotEqual(0, response[self.fdn.min_delay])
+
+    def test_block_matches_samples(self):
+        for matrix in ['householder', 'hadamard']:
+            inbuffer = [math.sin(2.0*math.pi*100.0*i/self.samplerate) for i in range(0, 4 * self.block_size)]
+            block = yodel.reverb.FDN(self.samplerate, 4, matrix=matrix)
+            sample = yodel.reverb.FDN(self.samplerate, 4, matrix=matrix)
+            outbuffer = [0] * len(inbuffer)
+
+            block.process(inbuffer, outbuffer)
+
+            for i in range(0, len(inbuffer)):
+                self.assertAlmostEqual(sample.process_sample(inbuffer[i]), outbuffer[i])
+
+    def test_decay(self):
+        for matrix in ['householder', 'hadamard']:
+            self.fdn.set_matrix(matrix)
+            self.fdn.reset()
+            window = int(self.rt60 * self.samplerate / 2)
+            response = self.impulse_response(4 * window)
+
+            early = self.energy(response[window:2*window])
+            late = self.energy(response[3*window:4*window])
+            decay = 10.0 * math.log10(late / early)
+
+            self.assertAlmostEqual(-60.0, decay, delta=6.0)
+
+    def test_lossless_matrix(self):
+        for matrix in ['householder', 'hadamard']:
+            fdn = yodel.reverb.FDN(self.samplerate, 8, [1, 1, 1, 1, 1, 1, 1, 1], 1e9, matrix)
+            fdn.buffer[0] = 1.0
+            fdn.process([0] * 10, [0] * 10)
+            self.assertAlmostEqual(1.0, self.energy(fdn.buffer), places=6)
+
+    def test_reset(self):
+        self.impulse_response(self.block_size)
+        self.fdn.reset()
+
+        self.assertEqual(0, self.energy(self.fdn.buffer))
+        self.assertEqual(0, self.energy(self.impulse_response(self.fdn.min_delay)))
+
+    def test_invalid_parameters(self):
+        self.assertRaises(ValueError, yodel.reverb.FDN, self.samplerate, 6, matrix='hadamard')
+        self.assertRaises(ValueError, yodel.reverb.FDN, self.samplerate, 4, matrix='unknown')
+        self.assertRaises(ValueError, yodel.reverb.FDN, self.samplerate, 4, [30, 40])
+
+
+if __name__ == '__main__':
+    unittest.main()
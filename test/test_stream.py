@@ -0,0 +1,104 @@
+import unittest
+import asyncio
+import concurrent.futures
+import math
+import threading
+import yodel.stream
+import yodel.filter
+
+
+class TestAsyncProcessor(unittest.TestCase):
+
+    def setUp(self):
+        self.samplerate = 48000
+        self.block_size = 256
+        self.blocks = [[math.sin(2.0*math.pi*100.0*(b*self.block_size + i)/self.samplerate) for i in range(0, self.block_size)] for b in range(0, 8)]
+
+    def biquad(self):
+        flt = yodel.filter.Biquad()
+        flt.low_pass(self.samplerate, 1000, 1.0 / math.sqrt(2.0))
+        return flt
+
+    def expected(self):
+        flt = self.biquad()
+        output = []
+        for block in self.blocks:
+            result = [0] * self.block_size
+            flt.process(block, result)
+            output.append(result)
+        return output
+
+    async def source(self, log=None):
+        for (index, block) in enumerate(self.blocks):
+            if log is not None:
+                log.append(('read', index))
+            await asyncio.sleep(0)
+            yield list(block)
+
+    def compare(self, expected, output):
+        self.assertEqual(len(expected), len(output))
+        for (block, result) in zip(expected, output):
+            for i in range(0, self.block_size):
+                self.assertAlmostEqual(block[i], result[i])
+
+    def test_stream(self):
+        async def run(executor):
+            processor = yodel.stream.AsyncProcessor(self.biquad(), executor)
+            return [block async for block in processor.stream(self.source())]
+
+        self.compare(self.expected(), asyncio.run(run(None)))
+        self.compare(self.expected(), asyncio.run(run(False)))
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            self.compare(self.expected(), asyncio.run(run(executor)))
+
+    def test_executor(self):
+        threads = set()
+
+        def process(x, y):
+            threads.add(threading.get_ident())
+            y[0:len(x)] = x
+
+        async def run():
+            processor = yodel.stream.AsyncProcessor(process)
+            return await processor.process(self.blocks[0])
+
+        self.assertEqual(self.blocks[0], asyncio.run(run()))
+        self.assertFalse(threading.get_ident() in threads)
+
+    def test_ordering(self):
+        async def run():
+            processor = yodel.stream.AsyncProcessor(self.biquad())
+            return await asyncio.gather(*[processor.process(block) for block in self.blocks])
+
+        self.compare(self.expected(), asyncio.run(run()))
+
+    def test_backpressure(self):
+        log = []
+
+        async def run():
+            processor = yodel.stream.AsyncProcessor(self.biquad(), False, queue_size=2)
+            async for block in processor.stream(self.source(log)):
+                log.append(('write', None))
+                await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        for position in range(0, len(log)):
+            reads = len([e for e in log[0:position] if e[0] == 'read'])
+            writes = len([e for e in log[0:position] if e[0] == 'write'])
+            self.assertTrue(reads - writes <= 4)
+
+    def test_errors(self):
+        async def failing():
+            yield self.blocks[0]
+            raise IOError('connection lost')
+
+        async def run():
+            processor = yodel.stream.AsyncProcessor(self.biquad())
+            return [block async for block in processor.stream(failing())]
+
+        self.assertRaises(IOError, asyncio.run, run())
+        self.assertRaises(ValueError, yodel.stream.AsyncProcessor, self.biquad(), None, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
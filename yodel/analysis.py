@@ -4,6 +4,8 @@ analysis.
 """
 
 import math
+import operator
+import yodel.buffer
 
 
 class DFT:
@@ -50,14 +52,16 @@ class DFT:
         :param real_spec: real-part of the output complex spectrum
         :param imag_spec: imaginary-part of the output complex spectrum
         """
-        for i in range(0, self.size):
-            real_spec[i] = 0
-            imag_spec[i] = 0
-
+        signal = yodel.buffer.to_list(real_signal)[0:self.size]
+        real = []
+        imag = []
         for k in range(0, self.size):
-            for i in range(0, self.size):
-                real_spec[k] += real_signal[i] * self.cos_table[k * i]
-                imag_spec[k] -= real_signal[i] * self.sin_table[k * i]
+            real.append(sum(map(operator.mul, signal,
+                                self._row(self.cos_table, k))))
+            imag.append(-sum(map(operator.mul, signal,
+                                 self._row(self.sin_table, k))))
+        yodel.buffer.assign(real, real_spec)
+        yodel.buffer.assign(imag, imag_spec)
 
     def inverse(self, real_spec, imag_spec, real_signal):
         """
@@ -67,17 +71,32 @@ class DFT:
         :param imag_spec: imaginary-part of the complex spectrum
         :param real_signal: real time-domain output signal
         """
+        real = [value / self.size
+                for value in yodel.buffer.to_list(real_spec)[0:self.size]]
+        imag = [- value / self.size
+                for value in yodel.buffer.to_list(imag_spec)[0:self.size]]
+        signal = []
         for i in range(0, self.size):
-            real_signal[i] = 0
-
-        for k in range(0, self.size):
-            real_spec[k] = real_spec[k] / self.size
-            imag_spec[k] = - imag_spec[k] / self.size
+            acc = 0
+            for (r, im, c, s) in zip(real, imag,
+                                     self._row(self.cos_table, i),
+                                     self._row(self.sin_table, i)):
+                acc += r * c
+                acc += im * s
+            signal.append(acc)
+        yodel.buffer.assign(signal, real_signal)
+
+    def _row(self, table, k):
+        """
+        Get the values of a lookup table for a given frequency index.
 
-        for k in range(0, self.size):
-            for i in range(0, self.size):
-                real_signal[i] += real_spec[k] * self.cos_table[k * i]
-                real_signal[i] += imag_spec[k] * self.sin_table[k * i]
+        :param table: lookup table
+        :param k: frequency index
+        :rtype: list of values, one per time index
+        """
+        if k == 0:
+            return [table[0]] * self.size
+        return table[0:k * (self.size - 1) + 1:k]
 
 
 class FFT:
@@ -119,11 +138,43 @@ class FFT:
         :param real_spec: real-part of the output complex spectrum
         :param imag_spec: imaginary-part of the output complex spectrum
         """
-        spec_len = int(self.size / 2)
+        (real, imag) = self._transform(yodel.buffer.to_list(real_signal))
+        yodel.buffer.assign(real, real_spec)
+        yodel.buffer.assign(imag, imag_spec)
+
+    def inverse(self, real_spec, imag_spec, real_signal):
+        """
+        Compute the real time-domain signal of a given complex spectrum
+
+        :param real_spec: real-part of the complex spectrum
+        :param imag_spec: imaginary-part of the complex spectrum
+        :param real_signal: real time-domain output signal
+        """
+        n = self.size
+        nspec = int(n / 2 + 1)
+
+        real = yodel.buffer.to_list(real_spec)[0:nspec]
+        imag = yodel.buffer.to_list(imag_spec)[0:nspec]
+        real += [real[n - k] for k in range(nspec, n)]
+        imag += [- imag[n - k] for k in range(nspec, n)]
+
+        (tmp_real, tmp_imag) = self._transform(
+            list(map(operator.add, real, imag)))
 
-        for i in range(0, spec_len):
-            real_spec[i] = real_signal[2 * i]
-            imag_spec[i] = real_signal[2 * i + 1]
+        signal = [(r + i) / n for (r, i) in zip(tmp_real, tmp_imag)]
+        yodel.buffer.assign(signal, real_signal)
+
+    def _transform(self, signal):
+        """
+        Compute the complex spectrum of a real signal given as a list.
+
+        :param signal: real time-domain signal
+        :rtype: tuple of lists (real-part, imaginary-part)
+        """
+        spec_len = int(self.size / 2)
+        padding = [0] * (self.size - spec_len)
+        real = signal[0:2 * spec_len:2] + padding
+        imag = signal[1:2 * spec_len:2] + padding
 
         n = spec_len
 
@@ -134,12 +185,12 @@ class FFT:
 
         for i in range(1, nm1):
             if i < j:
-                tr = real_spec[j]
-                ti = imag_spec[j]
-                real_spec[j] = real_spec[i]
-                imag_spec[j] = imag_spec[i]
-                real_spec[i] = tr
-                imag_spec[i] = ti
+                tr = real[j]
+                ti = imag[j]
+                real[j] = real[i]
+                imag[j] = imag[i]
+                real[i] = tr
+                imag[i] = ti
             k = nd2
             while k <= j:
                 j -= k
@@ -158,12 +209,12 @@ class FFT:
                 jm1 = j - 1
                 for i in range(int(jm1), int(nm1 + 1), int(le)):
                     ip = i + le2
-                    tr = real_spec[int(ip)] * ur - imag_spec[int(ip)] * ui
-                    ti = real_spec[int(ip)] * ui + imag_spec[int(ip)] * ur
-                    real_spec[int(ip)] = real_spec[i] - tr
-                    imag_spec[int(ip)] = imag_spec[i] - ti
-                    real_spec[i] += tr
-                    imag_spec[i] += ti
+                    tr = real[int(ip)] * ur - imag[int(ip)] * ui
+                    ti = real[int(ip)] * ui + imag[int(ip)] * ur
+                    real[int(ip)] = real[i] - tr
+                    imag[int(ip)] = imag[i] - ti
+                    real[i] += tr
+                    imag[i] += ti
                 tr = ur
                 ur = tr * sr - ui * si
                 ui = tr * si + ui * sr
@@ -178,21 +229,21 @@ class FFT:
             im = nd2 - i
             ip2 = i + nd2
             ipm = im + nd2
-            real_spec[ip2] = (imag_spec[i] + imag_spec[im]) / 2
-            real_spec[ipm] = real_spec[ip2]
-            imag_spec[ip2] = -(real_spec[i] - real_spec[im]) / 2
-            imag_spec[ipm] = -imag_spec[ip2]
-            real_spec[i] = (real_spec[i] + real_spec[im]) / 2
-            real_spec[im] = real_spec[i]
-            imag_spec[i] = (imag_spec[i] - imag_spec[im]) / 2
-            imag_spec[im] = -imag_spec[i]
-
-        real_spec[int(n * 3 / 4)] = imag_spec[int(n / 4)]
-        real_spec[nd2] = imag_spec[0]
-        imag_spec[int(n * 3 / 4)] = 0
-        imag_spec[nd2] = 0
-        imag_spec[int(n / 4)] = 0
-        imag_spec[0] = 0
+            real[ip2] = (imag[i] + imag[im]) / 2
+            real[ipm] = real[ip2]
+            imag[ip2] = -(real[i] - real[im]) / 2
+            imag[ipm] = -imag[ip2]
+            real[i] = (real[i] + real[im]) / 2
+            real[im] = real[i]
+            imag[i] = (imag[i] - imag[im]) / 2
+            imag[im] = -imag[i]
+
+        real[int(n * 3 / 4)] = imag[int(n / 4)]
+        real[nd2] = imag[0]
+        imag[int(n * 3 / 4)] = 0
+        imag[nd2] = 0
+        imag[int(n / 4)] = 0
+        imag[0] = 0
 
         l = round(math.log(n) / math.log(2))
         le = round(math.pow(2, l))
@@ -206,41 +257,17 @@ class FFT:
             jm1 = j - 1
             for i in range(jm1, nm1 + 1, int(le)):
                 ip = int(i + le2)
-                tr = real_spec[ip] * ur - imag_spec[ip] * ui
-                ti = real_spec[ip] * ui + imag_spec[ip] * ur
-                real_spec[ip] = real_spec[i] - tr
-                imag_spec[ip] = imag_spec[i] - ti
-                real_spec[i] += tr
-                imag_spec[i] += ti
+                tr = real[ip] * ur - imag[ip] * ui
+                ti = real[ip] * ui + imag[ip] * ur
+                real[ip] = real[i] - tr
+                imag[ip] = imag[i] - ti
+                real[i] += tr
+                imag[i] += ti
             tr = ur
             ur = tr * sr - ui * si
             ui = tr * si + ui * sr
 
-    def inverse(self, real_spec, imag_spec, real_signal):
-        """
-        Compute the real time-domain signal of a given complex spectrum
-
-        :param real_spec: real-part of the complex spectrum
-        :param imag_spec: imaginary-part of the complex spectrum
-        :param real_signal: real time-domain output signal
-        """
-        n = self.size
-        nspec = int(n / 2 + 1)
-
-        for k in range(nspec, n):
-            real_spec[k] = real_spec[n - k]
-            imag_spec[k] = - imag_spec[n - k]
-
-        for k in range(0, n):
-            real_spec[k] = real_spec[k] + imag_spec[k]
-
-        tmp_real = [0] * n
-        tmp_imag = [0] * n
-
-        self.forward(real_spec, tmp_real, tmp_imag)
-
-        for i in range(0, n):
-            real_signal[i] = (tmp_real[i] + tmp_imag[i]) / n
+        return (real, imag)
 
 
 class Window:
@@ -312,8 +339,10 @@ class Window:
         :param input_signal: input signal to be windowed
         :param output_signal: resulting windowed signal
         """
-        for i in range(0, self.size):
-            output_signal[i] = input_signal[i] * self.signal[i]
+        output = list(map(operator.mul,
+                          yodel.buffer.to_list(input_signal)[0:self.size],
+                          self.signal))
+        yodel.buffer.assign(output, output_signal)
 
     def _resize(self, size):
         """
@@ -0,0 +1,218 @@
+"""
+This module runs the benchmarks measuring the throughput of the processors.
+It can be run from the command line::
+
+    python -m yodel.bench -o results.json
+    python -m yodel.bench --compare results.json
+
+A benchmark is a function named ``bench_<name>(samplerate, blocksize)``,
+defined in a ``bench_*.py`` file of the benchmarks directory (by default,
+the ``benchmarks`` directory of the source distribution), which returns
+a processor (or a function with the same signature as its ``process``
+method) for one channel, or None when the block size does not apply. Every
+benchmark is measured for every block size and channel count, with one
+processor per channel, and reported in samples per second and realtime
+factor (seconds of signal processed per second).
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'benchmarks')
+
+
+def load_benchmarks(directory):
+    """
+    Load the benchmarks of a directory.
+
+    :param directory: directory containing ``bench_*.py`` files
+    :return: list of (name, function) pairs, sorted by name
+    """
+    benchmarks = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.startswith('bench_') or not filename.endswith('.py'):
+            continue
+        spec = importlib.util.spec_from_file_location(
+            'yodel_benchmarks_' + filename[0:-3],
+            os.path.join(directory, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name in dir(module):
+            if name.startswith('bench_') and callable(getattr(module, name)):
+                benchmarks.append((name[len('bench_'):], getattr(module,
+                                                                 name)))
+    return sorted(benchmarks)
+
+
+def measure(benchmark, samplerate, blocksize, channels, duration):
+    """
+    Measure the throughput of a benchmark.
+
+    :param benchmark: benchmark function
+    :param samplerate: sample-rate in Hz
+    :param blocksize: number of samples of a block
+    :param channels: number of channels
+    :param duration: minimum measurement time in s
+    :return: measurement, or None if the block size does not apply
+    """
+    processors = [benchmark(samplerate, blocksize)
+                  for channel in range(0, channels)]
+    if processors[0] is None:
+        return None
+    processors = [getattr(processor, 'process', processor)
+                  for processor in processors]
+    rand = random.Random(channels)
+    inputs = [[rand.uniform(-1.0, 1.0) for i in range(0, blocksize)]
+              for channel in range(0, channels)]
+    outputs = [[0.0] * blocksize for channel in range(0, channels)]
+
+    blocks = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while blocks == 0 or elapsed < duration:
+        for (process, input_signal, output_signal) in zip(processors, inputs,
+                                                          outputs):
+            process(input_signal, output_signal)
+        blocks += 1
+        elapsed = time.perf_counter() - start
+
+    samples = blocks * blocksize
+    return {
+        'blocksize': blocksize,
+        'channels': channels,
+        'blocks': blocks,
+        'samples_per_second': samples * channels / elapsed,
+        'realtime_factor': samples / float(samplerate) / elapsed,
+    }
+
+
+def run(benchmarks, samplerate, blocksizes, channel_counts, duration,
+        pattern=None):
+    """
+    Measure every benchmark for every block size and channel count.
+
+    :param benchmarks: list of (name, function) pairs
+    :param samplerate: sample-rate in Hz
+    :param blocksizes: list of block sizes
+    :param channel_counts: list of channel counts
+    :param duration: minimum measurement time in s, for each measurement
+    :param pattern: only run the benchmarks whose name contains it
+    :return: results
+    """
+    results = {}
+    for (name, benchmark) in benchmarks:
+        if pattern is not None and pattern not in name:
+            continue
+        for blocksize in blocksizes:
+            for channels in channel_counts:
+                result = measure(benchmark, samplerate, blocksize, channels,
+                                 duration)
+                if result is not None:
+                    result['name'] = name
+                    results['%s/%d/%d' % (name, blocksize, channels)] = result
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'samplerate': samplerate,
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compare results with baseline results.
+
+    :param results: new results
+    :param baseline: baseline results
+    :param threshold: relative throughput loss considered a regression
+    :return: list of (key, ratio, regression) tuples, where the ratio is
+             the throughput relative to the baseline
+    """
+    comparison = []
+    for key in sorted(results['results']):
+        if key not in baseline['results']:
+            continue
+        ratio = (results['results'][key]['samples_per_second'] /
+                 baseline['results'][key]['samples_per_second'])
+        comparison.append((key, ratio, ratio < 1.0 - threshold))
+    return comparison
+
+
+def main(argv=None):
+    """
+    Run the command line benchmarks.
+
+    :param argv: command line arguments (default: :py:data:`sys.argv`)
+    :return: exit status, 1 if a regression was found
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m yodel.bench',
+        description='Measure the throughput of the yodel processors.')
+    parser.add_argument('-d', '--directory', default=BENCHMARKS,
+                        help='benchmarks directory (default: benchmarks '
+                             'directory of the source distribution)')
+    parser.add_argument('-k', '--filter', default=None,
+                        help='only run benchmarks whose name contains it')
+    parser.add_argument('-b', '--blocksizes', type=int, nargs='+',
+                        default=[64, 512, 4096], help='block sizes')
+    parser.add_argument('-c', '--channels', type=int, nargs='+',
+                        default=[1, 2], help='channel counts')
+    parser.add_argument('-r', '--samplerate', type=int, default=48000,
+                        help='sample-rate in Hz (default: 48000)')
+    parser.add_argument('-t', '--duration', type=float, default=0.2,
+                        help='minimum time of a measurement in s')
+    parser.add_argument('-o', '--output', default=None,
+                        help='write the results to a JSON file')
+    parser.add_argument('--compare', default=None,
+                        help='compare with baseline results in a JSON file')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative throughput loss reported as a '
+                             'regression (default: 0.1)')
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.directory):
+        parser.error('benchmarks directory not found: %s' % args.directory)
+
+    results = run(load_benchmarks(args.directory), args.samplerate,
+                  args.blocksizes, args.channels, args.duration, args.filter)
+    if args.output is not None:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+
+    if args.compare is None:
+        if args.output is None:
+            json.dump(results, sys.stdout, indent=2, sort_keys=True)
+            sys.stdout.write('\n')
+        else:
+            for result in sorted(results['results'].values(),
+                                 key=lambda result: (result['name'],
+                                                     result['blocksize'],
+                                                     result['channels'])):
+                print('%-36s %14.0f samples/s %10.1fx realtime' % (
+                    '%s/%d/%d' % (result['name'], result['blocksize'],
+                                  result['channels']),
+                    result['samples_per_second'],
+                    result['realtime_factor']))
+        return 0
+
+    with open(args.compare) as baseline_file:
+        baseline = json.load(baseline_file)
+    status = 0
+    for (key, ratio, regression) in compare(results, baseline,
+                                            args.threshold):
+        print('%-36s %7.2fx%s' % (key, ratio,
+                                  '  REGRESSION' if regression else ''))
+        if regression:
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
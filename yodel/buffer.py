@@ -0,0 +1,67 @@
+"""
+This module provides utility functions for signal buffers. Signals can be
+given as lists or as any object supporting the buffer protocol, such as
+arrays, memoryviews or NumPy arrays.
+
+The processors storing signals (delaylines, convolution buffers) take a
+``typecode`` argument selecting the type of their stored samples: 'd' for
+double precision (default) or 'f' for single precision, which halves their
+memory. The computations, the filter states and the FFT lookup tables always
+keep double precision.
+"""
+
+import array
+
+
+def zeros(size, typecode='d'):
+    """
+    Create a typed buffer filled with zeros.
+
+    :param size: number of samples
+    :param typecode: type of the samples, 'd' (double precision) or 'f'
+                     (single precision)
+    :rtype: array of samples
+    """
+    if typecode not in ('d', 'f'):
+        raise ValueError('unsupported typecode: %s' % typecode)
+    return array.array(typecode, [0.0]) * size
+
+
+def to_list(signal):
+    """
+    Get the samples of a signal as a list. Typed buffers are converted at
+    once instead of creating a new float object at every indexing. Lists are
+    returned as they are, without any copy.
+
+    :param signal: input signal
+    :rtype: list of samples
+    """
+    if isinstance(signal, list):
+        return signal
+    tolist = getattr(signal, 'tolist', None)
+    if tolist is not None:
+        return tolist()
+    return list(signal)
+
+
+def assign(values, output_signal):
+    """
+    Write a list of samples to the beginning of an output signal at once.
+    The output signal may be the input signal the samples were computed
+    from. It keeps its length: it must be able to hold all the samples, and
+    its following samples are left unchanged.
+
+    :param values: list of samples
+    :param output_signal: output signal
+    """
+    size = len(values)
+    if size > len(output_signal):
+        raise ValueError('cannot write %d samples to a signal of %d samples'
+                         % (size, len(output_signal)))
+    if isinstance(output_signal, array.array):
+        output_signal[0:size] = array.array(output_signal.typecode, values)
+    elif isinstance(output_signal, memoryview):
+        typecode = output_signal.format.lstrip('@=<>!')
+        output_signal[0:size] = array.array(typecode, values)
+    else:
+        output_signal[0:size] = values
@@ -3,6 +3,8 @@ This module provides utility functions for complex numbers.
 """
 
 import math
+import operator
+import yodel.buffer
 
 
 def modulus(real, imag):
@@ -25,3 +27,72 @@ def phase(real, imag):
     :rtype: phase of complex number
     """
     return math.atan2(imag, real)
+
+
+def magnitude(real_signal, imag_signal, output_signal):
+    """
+    Compute the modulus of every complex number of a signal.
+
+    :param real_signal: real parts of the signal
+    :param imag_signal: imaginary parts of the signal
+    :param output_signal: modulus of every complex number
+    """
+    output = list(map(math.hypot, real_signal, imag_signal))
+    yodel.buffer.assign(output, output_signal)
+
+
+def magnitude_squared(real_signal, imag_signal, output_signal):
+    """
+    Compute the squared modulus of every complex number of a signal, which
+    avoids the square root for power spectra or comparisons.
+
+    :param real_signal: real parts of the signal
+    :param imag_signal: imaginary parts of the signal
+    :param output_signal: squared modulus of every complex number
+    """
+    output = [real * real + imag * imag
+              for (real, imag) in zip(yodel.buffer.to_list(real_signal),
+                                      yodel.buffer.to_list(imag_signal))]
+    yodel.buffer.assign(output, output_signal)
+
+
+def phase_signal(real_signal, imag_signal, output_signal):
+    """
+    Compute the phase of every complex number of a signal.
+
+    :param real_signal: real parts of the signal
+    :param imag_signal: imaginary parts of the signal
+    :param output_signal: phase of every complex number
+    """
+    output = list(map(math.atan2, imag_signal, real_signal))
+    yodel.buffer.assign(output, output_signal)
+
+
+def to_polar(real_signal, imag_signal, mag_signal, arg_signal):
+    """
+    Convert a signal of complex numbers from cartesian to polar form.
+
+    :param real_signal: real parts of the signal
+    :param imag_signal: imaginary parts of the signal
+    :param mag_signal: modulus of every complex number
+    :param arg_signal: phase (argument) of every complex number
+    """
+    mag = list(map(math.hypot, real_signal, imag_signal))
+    arg = list(map(math.atan2, imag_signal, real_signal))
+    yodel.buffer.assign(mag, mag_signal)
+    yodel.buffer.assign(arg, arg_signal)
+
+
+def from_polar(mag_signal, arg_signal, real_signal, imag_signal):
+    """
+    Convert a signal of complex numbers from polar to cartesian form.
+
+    :param mag_signal: modulus of every complex number
+    :param arg_signal: phase (argument) of every complex number
+    :param real_signal: real parts of the signal
+    :param imag_signal: imaginary parts of the signal
+    """
+    real = list(map(operator.mul, mag_signal, map(math.cos, arg_signal)))
+    imag = list(map(operator.mul, mag_signal, map(math.sin, arg_signal)))
+    yodel.buffer.assign(real, real_signal)
+    yodel.buffer.assign(imag, imag_signal)
@@ -3,6 +3,7 @@ This module provides utility functions for various math conversions.
 """
 
 import math
+import yodel.buffer
 
 
 def lin2db(linval):
@@ -26,3 +27,30 @@ def db2lin(dbval):
     :rtype: linear value
     """
     return math.pow(10, dbval / 20.0)
+
+
+def lin2db_signal(input_signal, output_signal):
+    """
+    Convert a signal of linear values to the decibel (dB) scale, as
+    :py:func:`lin2db` does for every value.
+
+    :param input_signal: linear values
+    :param output_signal: decibel values
+    """
+    log10 = math.log10
+    output = [20.0 * log10(linval) if linval > 1e-5 else -100.0
+              for linval in yodel.buffer.to_list(input_signal)]
+    yodel.buffer.assign(output, output_signal)
+
+
+def db2lin_signal(input_signal, output_signal):
+    """
+    Convert a signal of decibel (dB) values to the linear scale, as
+    :py:func:`db2lin` does for every value.
+
+    :param input_signal: decibel values
+    :param output_signal: linear values
+    """
+    output = [10.0 ** (dbval / 20.0)
+              for dbval in yodel.buffer.to_list(input_signal)]
+    yodel.buffer.assign(output, output_signal)
@@ -2,39 +2,68 @@
 This module provides classes for delaying signals.
 """
 
+import array
 import math
+import operator
+import yodel.buffer
 
 
 class DelayLine:
     """
     A delayline allows to delay a given signal by a certain amount of time or
     samples. Time-varying delay is allowed.
+
+    Fractional delays are interpolated with one of the following methods:
+
+    * 'linear': linear interpolation (default)
+    * 'hermite': 4-point cubic Hermite (Catmull-Rom) interpolation
+    * 'lagrange': 4-point third-order Lagrange interpolation
+    * 'allpass': first-order Thiran allpass interpolation
+    * 'sinc': 8-point Blackman-windowed sinc interpolation
+
+    Except for the linear interpolation, the coefficients are read from
+    tables precomputed for quantized fractions (1/1024 of a sample). Since
+    they need a few samples after the read position, these methods impose a
+    minimum delay of 2 samples (4 samples for 'sinc').
+
+    *Reference:*
+        "Splitting the Unit Delay", T. I. Laakso, V. Valimaki, M. Karjalainen
+        and U. K. Laine, IEEE Signal Processing Magazine, 1996
     """
 
-    def __init__(self, samplerate, maxdelay=1000, delay=0):
+    _resolution = 1024
+    _tables = {}
+
+    def __init__(self, samplerate, maxdelay=1000, delay=0,
+                 interpolation='linear', typecode='d'):
         """
         Create a delayline.
 
         :param samplerate: sample-rate in Hz
         :param maxdelay: maximum allowed delay in ms
         :param delay: initial delay in ms
+        :param interpolation: interpolation method of fractional delays
+        :param typecode: type of the stored samples, 'd' or 'f' (see
+                         :py:mod:`yodel.buffer`)
         """
         self.samplerate = samplerate
         self.maxdelay = maxdelay
         self.maxsampledelay = maxdelay * samplerate / 1000.0
-        self.length = 1 << int(math.ceil(math.log(self.maxsampledelay, 2)))
+        self.length = 1 << int(math.ceil(math.log(self.maxsampledelay + 4, 2)))
         self.mask = self.length - 1
-        self.delayline = [0] * self.length
+        self.typecode = typecode
+        self.delayline = yodel.buffer.zeros(self.length, self.typecode)
         self.writepos = 0
-        self.set_delay(delay)
+        self.delay = delay
+        self.set_interpolation(interpolation)
 
     def clear(self):
         """
         Clear the current samples in the delayline with zeros.
         Every other state is kept (current delay, max delay).
         """
-        for i in range(0, self.length):
-            self.delayline[i] = 0
+        self.delayline[0:self.length] = yodel.buffer.zeros(self.length,
+                                                           self.typecode)
 
     def process_sample(self, input_sample):
         """
@@ -46,10 +75,25 @@ class DelayLine:
         self.delayline[self.writepos] = input_sample
         self.writepos = (self.writepos + 1) & self.mask
         prev_idx = int(math.floor(self.readpos))
-        next_idx = (prev_idx + 1) & self.mask
         frac_pos = self.readpos - prev_idx
-        output_sample = ((1.0 - frac_pos) * self.delayline[prev_idx] +
-                         frac_pos * self.delayline[next_idx])
+        if self.interpolation == 'linear':
+            next_idx = (prev_idx + 1) & self.mask
+            output_sample = ((1.0 - frac_pos) * self.delayline[prev_idx] +
+                             frac_pos * self.delayline[next_idx])
+        elif self.interpolation == 'allpass':
+            (offset, coeff) = self._coefficients(frac_pos)
+            curr = self.delayline[(prev_idx + offset) & self.mask]
+            output_sample = (coeff * curr + self._allpass_x1 -
+                             coeff * self._allpass_y1)
+            self._allpass_x1 = curr
+            self._allpass_y1 = output_sample
+        else:
+            coeffs = self._coefficients(frac_pos)
+            first = prev_idx - self._lookahead + 1
+            output_sample = 0.0
+            for k in range(0, len(coeffs)):
+                output_sample += (coeffs[k] *
+                                  self.delayline[(first + k) & self.mask])
         self.readpos = ((prev_idx + 1) & self.mask) + frac_pos
         return output_sample
 
@@ -60,9 +104,240 @@ class DelayLine:
         :param input_signal: signal to be delayed
         :param output_signal: resulting delayed signal
         """
+        input_signal = yodel.buffer.to_list(input_signal)
+        output = self._interpolate(input_signal, len(input_signal))
+        self.write(input_signal)
+        yodel.buffer.assign(output, output_signal)
+
+    def read(self, output_signal):
+        """
+        Read the next delayed samples before writing the corresponding input
+        samples with :py:meth:`write`. This allows to compute a whole block
+        of a signal fed back into the delayline. The number of samples must
+        not exceed :py:meth:`max_read_size`.
+
+        :param output_signal: resulting delayed signal
+        """
+        output = self._interpolate(None, len(output_signal))
+        yodel.buffer.assign(output, output_signal)
+
+    def write(self, input_signal):
+        """
+        Write input samples in the delayline, after reading the corresponding
+        delayed samples with :py:meth:`read`.
+
+        :param input_signal: signal to be delayed
+        """
+        prev_idx = int(math.floor(self.readpos))
+        frac_pos = self.readpos - prev_idx
+        self._write(yodel.buffer.to_list(input_signal))
+        self.readpos = (((prev_idx + len(input_signal)) & self.mask) +
+                        frac_pos)
+
+    def max_read_size(self):
+        """
+        Get the maximum number of samples that can be read from the delayline
+        before writing new input samples, which depends on the current delay.
+
+        :return: maximum number of samples
+        """
+        (first, extra) = self._span()[0:2]
+        return max(((self.writepos - first) & self.mask) - extra, 0)
+
+    def _span(self, readpos=None):
+        """
+        Get the delayline samples needed to interpolate at a read position.
+
+        :param readpos: read position (default: current read position)
+        :return: position of the first sample, number of additional samples
+                 and interpolation parameters (fractional position, allpass
+                 coefficient or FIR coefficients)
+        """
+        if readpos is None:
+            readpos = self.readpos
+        prev_idx = int(math.floor(readpos))
+        frac_pos = readpos - prev_idx
+        if self.interpolation == 'linear':
+            return (prev_idx, 1 if frac_pos > 0 else 0, frac_pos)
+        elif self.interpolation == 'allpass':
+            (offset, coeff) = self._coefficients(frac_pos)
+            return (prev_idx + offset, 0, coeff)
+        coeffs = self._coefficients(frac_pos)
+        return (prev_idx - self._lookahead + 1, len(coeffs) - 1, coeffs)
+
+    def _interpolate(self, input_signal, size, readpos=None, state=None):
+        """
+        Compute delayed samples at a read position. The most recent samples
+        not yet in the delayline are taken from the input signal, if any.
+
+        :param input_signal: list of samples to be delayed or None
+        :param size: number of delayed samples
+        :param readpos: read position (default: current read position)
+        :param state: allpass state ``[x1, y1]`` of the read position,
+                      updated in place (default: state of the delayline)
+        :return: list of delayed samples
+        """
+        (first, extra, params) = self._span(readpos)
+        needed = size + extra
+        fromline = min((self.writepos - first) & self.mask, needed)
+        delayed = self._read(first & self.mask, fromline)
+        if fromline < needed:
+            if input_signal is None:
+                raise ValueError('cannot read %d samples with a delay of %d'
+                                 % (size, self.max_read_size()))
+            delayed += input_signal[0:needed - fromline]
+
+        if self.interpolation == 'linear':
+            frac_pos = params
+            if frac_pos > 0:
+                prev_pos = 1.0 - frac_pos
+                output = [prev_pos * prev + frac_pos * nxt
+                          for (prev, nxt) in zip(delayed, delayed[1:])]
+            else:
+                output = delayed
+        elif self.interpolation == 'allpass':
+            coeff = params
+            output = [0] * size
+            if state is None:
+                (x1, y1) = (self._allpass_x1, self._allpass_y1)
+            else:
+                (x1, y1) = state
+            for i in range(0, size):
+                curr = delayed[i]
+                y1 = coeff * curr + x1 - coeff * y1
+                x1 = curr
+                output[i] = y1
+            if state is None:
+                (self._allpass_x1, self._allpass_y1) = (x1, y1)
+            else:
+                state[0:2] = [x1, y1]
+        else:
+            coeffs = params
+            output = [coeffs[0] * curr for curr in delayed[0:size]]
+            for k in range(1, len(coeffs)):
+                coeff = coeffs[k]
+                output = [out + coeff * curr
+                          for (out, curr) in zip(output, delayed[k:k + size])]
+        return output
+
+    def process_modulated(self, input_signal, delays, output_signal):
+        """
+        Delay an input signal by a time-varying amount of delay, given for
+        every sample (for instance from a LFO table). The read positions and
+        the interpolations of the whole signal are computed at once.
+
+        The result is the same as calling :py:meth:`set_delay` before
+        processing each sample. The last delay value remains the current
+        delay.
+
+        :param input_signal: signal to be delayed
+        :param delays: delay values in ms, one per input sample
+        :param output_signal: resulting delayed signal
+        """
+        input_signal = yodel.buffer.to_list(input_signal)
+        size = len(input_signal)
+        if size == 0:
+            return
+
+        scale = self.samplerate / 1000.0
+        maxdelay = self.maxdelay
+        lookahead = self._lookahead
+        delays = yodel.buffer.to_list(delays)[0:size]
+        if min(delays) * scale >= lookahead and max(delays) <= maxdelay:
+            sampledelays = [delay * scale for delay in delays]
+        else:
+            sampledelays = [max(min(max(delay, 0), maxdelay) * scale,
+                                lookahead)
+                            for delay in delays]
+        intdelays = [int(math.ceil(delay)) for delay in sampledelays]
+        fracs = list(map(operator.sub, intdelays, sampledelays))
+
+        if self.interpolation == 'linear':
+            first = 0
+            taps = 2
+        elif self.interpolation == 'allpass':
+            first = 1
+            taps = 2
+        else:
+            first = 1 - lookahead
+            taps = 2 * lookahead
+
+        history = max(map(operator.sub, intdelays, range(0, size))) - first
+        history = min(max(history, 0), self.length)
+        delayed = self._read((self.writepos - history) & self.mask, history)
+        delayed += input_signal[0:size]
+        delayed += [0.0] * taps
+        positions = list(map(operator.sub,
+                             range(history + first, history + first + size),
+                             intdelays))
+
+        if self.interpolation == 'linear':
+            output = [(1.0 - frac) * delayed[pos] + frac * delayed[pos + 1]
+                      for (pos, frac) in zip(positions, fracs)]
+        elif self.interpolation == 'allpass':
+            table = self._table
+            resolution = DelayLine._resolution
+            output = [0] * size
+            x1 = self._allpass_x1
+            y1 = self._allpass_y1
+            for i in range(0, size):
+                (offset, coeff) = table[int(fracs[i] * resolution + 0.5)]
+                curr = delayed[positions[i] + offset - 1]
+                y1 = coeff * curr + x1 - coeff * y1
+                x1 = curr
+                output[i] = y1
+            self._allpass_x1 = x1
+            self._allpass_y1 = y1
+        else:
+            resolution = DelayLine._resolution
+            coeffs = [self._table[int(frac * resolution + 0.5)]
+                      for frac in fracs]
+            output = [0.0] * size
+            for k in range(0, taps):
+                output = [out + coeff[k] * delayed[pos + k]
+                          for (out, coeff, pos)
+                          in zip(output, coeffs, positions)]
+
+        self._write(input_signal)
+        self.set_delay(delays[size - 1])
+        yodel.buffer.assign(output, output_signal)
+
+    def _read(self, start, count):
+        """
+        Read consecutive samples from the delayline, wrapping around its end.
+
+        :param start: position of the first sample
+        :param count: number of samples
+        :return: list of samples
+        """
+        end = start + count
+        if end <= self.length:
+            return self.delayline[start:end].tolist()
+        return (self.delayline[start:self.length].tolist() +
+                self.delayline[0:end - self.length].tolist())
+
+    def _write(self, input_signal):
+        """
+        Write consecutive samples in the delayline, wrapping around its end.
+
+        :param input_signal: samples to be written
+        """
         size = len(input_signal)
-        for i in range(0, size):
-            output_signal[i] = self.process_sample(input_signal[i])
+        if size > self.length:
+            self.writepos = (self.writepos + size - self.length) & self.mask
+            input_signal = input_signal[size - self.length:size]
+            size = self.length
+        if getattr(input_signal, 'typecode', None) != self.typecode:
+            input_signal = array.array(self.typecode, input_signal)
+        start = self.writepos
+        end = start + size
+        if end <= self.length:
+            self.delayline[start:end] = input_signal[0:size]
+        else:
+            split = self.length - start
+            self.delayline[start:self.length] = input_signal[0:split]
+            self.delayline[0:end - self.length] = input_signal[split:size]
+        self.writepos = end & self.mask
 
     def set_delay(self, delay):
         """
@@ -77,7 +352,233 @@ class DelayLine:
         else:
             self.delay = delay
 
-        self.sampledelay = self.delay * self.samplerate / 1000.0
-        frac = self.sampledelay - int(self.sampledelay)
-        self.readpos = ((self.writepos + self.length - int(self.sampledelay))
-                        & self.mask) + frac
+        self.sampledelay = max(self.delay * self.samplerate / 1000.0,
+                               self._lookahead)
+        self.readpos = self._readpos(self.sampledelay)
+
+    def _readpos(self, sampledelay):
+        """
+        Get the read position of a delay: the delayed sample lies
+        ``sampledelay`` samples before the write position, between the
+        samples at the integer part of the read position and the next one.
+
+        :param sampledelay: delay in samples
+        :return: read position
+        """
+        intdelay = int(math.ceil(sampledelay))
+        return ((self.writepos - intdelay) & self.mask) + (intdelay -
+                                                           sampledelay)
+
+    def set_interpolation(self, interpolation):
+        """
+        Select the interpolation method of fractional delays: 'linear',
+        'hermite', 'lagrange', 'allpass' or 'sinc'.
+
+        :param interpolation: interpolation method
+        """
+        if interpolation not in ('linear', 'hermite', 'lagrange', 'allpass',
+                                 'sinc'):
+            raise ValueError('unknown interpolation: %s' % interpolation)
+
+        self.interpolation = interpolation
+        if interpolation == 'linear':
+            self._lookahead = 0
+        elif interpolation == 'sinc':
+            self._lookahead = 4
+        else:
+            self._lookahead = 2
+        if interpolation != 'linear':
+            if interpolation not in DelayLine._tables:
+                DelayLine._tables[interpolation] = self._make_table()
+            self._table = DelayLine._tables[interpolation]
+        self._allpass_x1 = 0.0
+        self._allpass_y1 = 0.0
+        self.set_delay(self.delay)
+
+    def _coefficients(self, frac):
+        """
+        Get the interpolation coefficients of a fractional position.
+
+        :param frac: fractional position, between 0 and 1
+        :return: interpolation coefficients
+        """
+        return self._table[int(frac * DelayLine._resolution + 0.5)]
+
+    def _make_table(self):
+        """
+        Precompute the interpolation coefficients of the current method for
+        every quantized fractional position.
+
+        :return: list of coefficients, indexed by quantized fraction
+        """
+        table = []
+        for q in range(0, DelayLine._resolution + 1):
+            f = float(q) / DelayLine._resolution
+            if self.interpolation == 'hermite':
+                f2 = f * f
+                f3 = f2 * f
+                table.append([0.5 * (- f3 + 2.0 * f2 - f),
+                              0.5 * (3.0 * f3 - 5.0 * f2 + 2.0),
+                              0.5 * (- 3.0 * f3 + 4.0 * f2 + f),
+                              0.5 * (f3 - f2)])
+            elif self.interpolation == 'lagrange':
+                table.append([- f * (f - 1.0) * (f - 2.0) / 6.0,
+                              (f + 1.0) * (f - 1.0) * (f - 2.0) / 2.0,
+                              - (f + 1.0) * f * (f - 2.0) / 2.0,
+                              (f + 1.0) * f * (f - 1.0) / 6.0])
+            elif self.interpolation == 'allpass':
+                if f <= 0.5:
+                    (offset, delay) = (1, 1.0 - f)
+                else:
+                    (offset, delay) = (2, 2.0 - f)
+                table.append((offset, (1.0 - delay) / (1.0 + delay)))
+            else:
+                half = self._lookahead
+                coeffs = []
+                for k in range(0, 2 * half):
+                    t = (k - half + 1) - f
+                    if t == 0:
+                        sinc = 1.0
+                    else:
+                        sinc = math.sin(math.pi * t) / (math.pi * t)
+                    win = (0.42 + 0.5 * math.cos(math.pi * t / half) +
+                           0.08 * math.cos(2.0 * math.pi * t / half))
+                    coeffs.append(sinc * win)
+                norm = sum(coeffs)
+                table.append([c / norm for c in coeffs])
+        return table
+
+
+class MultiTapDelay:
+    """
+    A multi-tap delay reads a signal at several delays (taps) from a single
+    :py:class:`DelayLine`. Every tap has its own delay, interpolated for
+    fractional values like the delay of the delayline, and its own gain.
+    """
+
+    def __init__(self, samplerate, maxdelay=1000, interpolation='linear',
+                 typecode='d'):
+        """
+        Create a multi-tap delay without any tap.
+
+        :param samplerate: sample-rate in Hz
+        :param maxdelay: maximum allowed delay in ms
+        :param interpolation: interpolation method of fractional delays
+                              (see :py:class:`DelayLine`)
+        :param typecode: type of the stored samples, 'd' or 'f' (see
+                         :py:mod:`yodel.buffer`)
+        """
+        self.samplerate = samplerate
+        self.maxdelay = maxdelay
+        self.delayline = DelayLine(samplerate, maxdelay, 0, interpolation,
+                                   typecode)
+        self.delays = []
+        self.gains = []
+        self._sampledelays = []
+        self._states = []
+
+    def clear(self):
+        """
+        Clear the current samples in the delayline with zeros.
+        The taps are kept.
+        """
+        self.delayline.clear()
+        for state in self._states:
+            state[0:2] = [0.0, 0.0]
+
+    def set_interpolation(self, interpolation):
+        """
+        Select the interpolation method of fractional delays (see
+        :py:meth:`DelayLine.set_interpolation`).
+
+        :param interpolation: interpolation method
+        """
+        self.delayline.set_interpolation(interpolation)
+        for index in range(0, len(self.delays)):
+            self._states[index] = [0.0, 0.0]
+            self.set_tap(index, self.delays[index], self.gains[index])
+
+    def add_tap(self, delay, gain=1.0):
+        """
+        Add a new tap.
+
+        :param delay: delay of the tap in ms
+        :param gain: gain of the tap
+        :return: index of the new tap
+        """
+        self.delays.append(0)
+        self.gains.append(0)
+        self._sampledelays.append(0)
+        self._states.append([0.0, 0.0])
+        index = len(self.delays) - 1
+        self.set_tap(index, delay, gain)
+        return index
+
+    def set_tap(self, index, delay, gain=1.0):
+        """
+        Change the delay and the gain of an existing tap. As for the
+        delayline, the delay cannot be shorter than the minimum delay of the
+        interpolation method.
+
+        :param index: index of the tap
+        :param delay: delay of the tap in ms
+        :param gain: gain of the tap
+        """
+        delay = min(max(delay, 0), self.maxdelay)
+        sampledelay = max(delay * self.samplerate / 1000.0,
+                          self.delayline._lookahead)
+        self.delays[index] = delay
+        self.gains[index] = gain
+        self._sampledelays[index] = sampledelay
+
+    def remove_tap(self, index):
+        """
+        Remove an existing tap. The indices of the following taps are
+        shifted.
+
+        :param index: index of the tap
+        """
+        del self.delays[index]
+        del self.gains[index]
+        del self._sampledelays[index]
+        del self._states[index]
+
+    def process_sample(self, input_sample):
+        """
+        Delay an input sample by every tap.
+
+        :param input_sample: sample to be delayed
+        :return: sum of the delayed samples, weighted by the tap gains
+        """
+        output_signal = [0.0]
+        self.process([input_sample], output_signal)
+        return output_signal[0]
+
+    def process(self, input_signal, output_signal, tap_signals=None):
+        """
+        Delay an input signal by every tap, in a single pass per tap.
+
+        :param input_signal: signal to be delayed
+        :param output_signal: sum of the delayed signals, weighted by the
+                              tap gains
+        :param tap_signals: optional list of signals (one per tap) receiving
+                            the weighted delayed signal of each tap
+        """
+        input_signal = yodel.buffer.to_list(input_signal)
+        size = len(input_signal)
+        line = self.delayline
+        output = [0.0] * size
+
+        for tap in range(0, len(self._sampledelays)):
+            gain = self.gains[tap]
+            readpos = line._readpos(self._sampledelays[tap])
+            delayed = line._interpolate(input_signal, size, readpos,
+                                        self._states[tap])
+            tapped = [gain * sample for sample in delayed]
+
+            output = [acc + t for (acc, t) in zip(output, tapped)]
+            if tap_signals is not None:
+                yodel.buffer.assign(tapped, tap_signals[tap])
+
+        line._write(input_signal)
+        yodel.buffer.assign(output, output_signal)
@@ -2,7 +2,12 @@
 This module provides classes for audio signal filtering.
 """
 
+import array
 import math
+import fractions
+import itertools
+import operator
+import yodel.buffer
 import yodel.delay
 import yodel.analysis
 import yodel.conversion
@@ -78,9 +83,19 @@ class SinglePole:
         :param x: input buffer
         :param y: output buffer
         """
-        num_samples = len(x)
-        for n in range(0, num_samples):
-            y[n] = self.process_sample(x[n])
+        a0 = self._a0
+        a1 = self._a1
+        b1 = self._b1
+        x1 = self._x1
+        y1 = self._y1
+        output = []
+        for curr in yodel.buffer.to_list(x):
+            y1 = a0 * curr + a1 * x1 + b1 * y1
+            x1 = curr
+            output.append(y1)
+        self._x1 = x1
+        self._y1 = y1
+        yodel.buffer.assign(output, y)
 
 
 class Biquad:
@@ -322,9 +337,28 @@ class Biquad:
         :param x: input buffer
         :param y: output buffer
         """
-        num_samples = len(x)
-        for n in range(0, num_samples):
-            y[n] = self.process_sample(x[n])
+        b0 = self._b_coeffs[0]
+        b1 = self._b_coeffs[1]
+        b2 = self._b_coeffs[2]
+        a1 = self._a_coeffs[1]
+        a2 = self._a_coeffs[2]
+        x1 = self._x1
+        x2 = self._x2
+        y1 = self._y1
+        y2 = self._y2
+        output = []
+        for curr in yodel.buffer.to_list(x):
+            out = b0 * curr + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            x2 = x1
+            x1 = curr
+            y2 = y1
+            y1 = out
+            output.append(out)
+        self._x1 = x1
+        self._x2 = x2
+        self._y1 = y1
+        self._y2 = y2
+        yodel.buffer.assign(output, y)
 
     def _compute_constants(self, fs, fc, q, dbgain=0):
         """
@@ -342,6 +376,227 @@ class Biquad:
         self._sqrtAlpha = 2.0 * math.sqrt(self._a) * self._alpha
 
 
+def _bilinear(b, a, omega):
+    """
+    Digitize an analog section of normalized cut-off frequency with the
+    bilinear transform.
+
+    :param b: analog numerator coefficients (s^0, s^1, s^2)
+    :param a: analog denominator coefficients (s^0, s^1, s^2)
+    :param omega: pre-warped cut-off frequency
+    :rtype: tuple (a0, a1, a2, b0, b1, b2) suited for :py:meth:`Biquad.custom`
+    """
+    coeffs = []
+    for c in (a, b):
+        if a[2] == 0:
+            coeffs.append((c[0] * omega + c[1],
+                           c[0] * omega - c[1],
+                           0.0))
+        else:
+            w2 = omega * omega
+            coeffs.append((c[0] * w2 + c[1] * omega + c[2],
+                           2.0 * (c[0] * w2 - c[2]),
+                           c[0] * w2 - c[1] * omega + c[2]))
+    return coeffs[0] + coeffs[1]
+
+
+def _digitize(samplerate, cutoff, sections, kind):
+    """
+    Transform normalized analog low-pass sections into digital sections.
+
+    :param samplerate: sample-rate in Hz
+    :param cutoff: cut-off frequency in Hz
+    :param sections: list of analog sections (b, a)
+    :param kind: 'low_pass' or 'high_pass'
+    :rtype: list of digital sections
+    """
+    if kind not in ('low_pass', 'high_pass'):
+        raise ValueError("kind must be either 'low_pass' or 'high_pass'")
+
+    omega = math.tan(math.pi * cutoff / samplerate)
+    digital = []
+    for (b, a) in sections:
+        if kind == 'high_pass':
+            if a[2] == 0:
+                b = (b[1], b[0], 0.0)
+                a = (a[1], a[0], 0.0)
+            else:
+                b = (b[2], b[1], b[0])
+                a = (a[2], a[1], a[0])
+        digital.append(_bilinear(b, a, omega))
+    return digital
+
+
+def butterworth(samplerate, cutoff, order, kind='low_pass'):
+    """
+    Design a Butterworth filter (maximally flat pass-band) of any order.
+    Signal attenuation is at a rate of (6 * order) dB per octave.
+
+    :param samplerate: sample-rate in Hz
+    :param cutoff: cut-off frequency (-3 dB) in Hz
+    :param order: order of the filter
+    :param kind: 'low_pass' or 'high_pass'
+    :rtype: list of second-order sections (a0, a1, a2, b0, b1, b2) suited
+            for :py:class:`BiquadCascade`
+    """
+    sections = []
+    for k in range(0, int(order / 2)):
+        theta = (2 * k + 1) * math.pi / (2.0 * order)
+        sections.append(((1.0, 0.0, 0.0), (1.0, 2.0 * math.sin(theta), 1.0)))
+    if order % 2 == 1:
+        sections.append(((1.0, 0.0, 0.0), (1.0, 1.0, 0.0)))
+    return _digitize(samplerate, cutoff, sections, kind)
+
+
+def chebyshev1(samplerate, cutoff, order, ripple, kind='low_pass'):
+    """
+    Design a Chebyshev type I filter (equiripple pass-band) of any order.
+    The roll-off is steeper than a :py:func:`butterworth` filter of the same
+    order.
+
+    :param samplerate: sample-rate in Hz
+    :param cutoff: pass-band edge frequency in Hz
+    :param order: order of the filter
+    :param ripple: pass-band ripple in dB
+    :param kind: 'low_pass' or 'high_pass'
+    :rtype: list of second-order sections (a0, a1, a2, b0, b1, b2) suited
+            for :py:class:`BiquadCascade`
+    """
+    eps = math.sqrt(math.pow(10, ripple / 10.0) - 1.0)
+    mu = math.asinh(1.0 / eps) / order
+    sections = []
+    for k in range(0, int(order / 2)):
+        theta = (2 * k + 1) * math.pi / (2.0 * order)
+        sigma = - math.sinh(mu) * math.sin(theta)
+        omega = math.cosh(mu) * math.cos(theta)
+        norm = sigma * sigma + omega * omega
+        sections.append(((norm, 0.0, 0.0), (norm, -2.0 * sigma, 1.0)))
+    if order % 2 == 1:
+        sigma = math.sinh(mu)
+        sections.append(((sigma, 0.0, 0.0), (sigma, 1.0, 0.0)))
+    else:
+        gain = math.pow(10, - ripple / 20.0)
+        (b, a) = sections[0]
+        sections[0] = ((gain * b[0], 0.0, 0.0), a)
+    return _digitize(samplerate, cutoff, sections, kind)
+
+
+def chebyshev2(samplerate, cutoff, order, attenuation, kind='low_pass'):
+    """
+    Design a Chebyshev type II filter (flat pass-band, equiripple stop-band)
+    of any order.
+
+    :param samplerate: sample-rate in Hz
+    :param cutoff: stop-band edge frequency in Hz
+    :param order: order of the filter
+    :param attenuation: minimum stop-band attenuation in dB
+    :param kind: 'low_pass' or 'high_pass'
+    :rtype: list of second-order sections (a0, a1, a2, b0, b1, b2) suited
+            for :py:class:`BiquadCascade`
+    """
+    eps = 1.0 / math.sqrt(math.pow(10, attenuation / 10.0) - 1.0)
+    mu = math.asinh(1.0 / eps) / order
+    sections = []
+    for k in range(0, int(order / 2)):
+        theta = (2 * k + 1) * math.pi / (2.0 * order)
+        sigma = - math.sinh(mu) * math.sin(theta)
+        omega = math.cosh(mu) * math.cos(theta)
+        norm = 1.0 / (sigma * sigma + omega * omega)
+        zero = math.cos(theta) * math.cos(theta)
+        sections.append(((norm, 0.0, norm * zero),
+                         (norm, -2.0 * sigma * norm, 1.0)))
+    if order % 2 == 1:
+        sigma = 1.0 / math.sinh(mu)
+        sections.append(((sigma, 0.0, 0.0), (sigma, 1.0, 0.0)))
+    return _digitize(samplerate, cutoff, sections, kind)
+
+
+def linkwitz_riley(samplerate, cutoff, order, kind='low_pass'):
+    """
+    Design a Linkwitz-Riley crossover filter of even order, made of two
+    cascaded :py:func:`butterworth` filters of half the order. The low-pass
+    and high-pass outputs are both at -6 dB at the cut-off frequency.
+
+    :param samplerate: sample-rate in Hz
+    :param cutoff: crossover frequency in Hz
+    :param order: even order of the filter
+    :param kind: 'low_pass' or 'high_pass'
+    :rtype: list of second-order sections (a0, a1, a2, b0, b1, b2) suited
+            for :py:class:`BiquadCascade`
+    """
+    if order < 2 or order % 2 != 0:
+        raise ValueError('the order of a Linkwitz-Riley filter must be even')
+    return 2 * butterworth(samplerate, cutoff, int(order / 2), kind)
+
+
+class BiquadCascade:
+    """
+    A biquad cascade performs high-order IIR filtering with a series of
+    :py:class:`Biquad` filters (second-order sections), as designed by
+    :py:func:`butterworth`, :py:func:`chebyshev1`, :py:func:`chebyshev2` or
+    :py:func:`linkwitz_riley`.
+    """
+
+    def __init__(self, sections=None):
+        """
+        Create a biquad cascade. Without any section, the frequency response
+        is flat.
+
+        :param sections: list of second-order sections (a0, a1, a2, b0, b1,
+                         b2)
+        """
+        self.filters = []
+        self.set_sections(sections or [])
+
+    def reset(self):
+        """
+        Clear the state of every section.
+        """
+        for flt in self.filters:
+            flt._x1 = 0.0
+            flt._x2 = 0.0
+            flt._y1 = 0.0
+            flt._y2 = 0.0
+
+    def set_sections(self, sections):
+        """
+        Change the second-order sections of the cascade. The state of the
+        existing sections is kept, allowing smooth parameter changes.
+
+        :param sections: list of second-order sections (a0, a1, a2, b0, b1,
+                         b2)
+        """
+        while len(self.filters) > len(sections):
+            self.filters.pop()
+        while len(self.filters) < len(sections):
+            self.filters.append(Biquad())
+        for (flt, section) in zip(self.filters, sections):
+            flt.custom(*section)
+
+    def process_sample(self, x):
+        """
+        Filter a single sample and return the filtered sample.
+
+        :param x: input sample
+        :rtype: filtered sample
+        """
+        for flt in self.filters:
+            x = flt.process_sample(x)
+        return x
+
+    def process(self, x, y):
+        """
+        Filter an input signal. Can be used for in-place filtering.
+
+        :param x: input buffer
+        :param y: output buffer
+        """
+        output = list(yodel.buffer.to_list(x))
+        for flt in self.filters:
+            flt.process(output, output)
+        yodel.buffer.assign(output, y)
+
+
 class StateVariable:
     """
     A state variable filter provides simultaneously low-pass, high-pass,
@@ -403,13 +658,30 @@ class StateVariable:
         :param lp: low-pass filtered output
         :param br: band-reject filtered output
         """
-        num_samples = len(x)
-        for n in range(0, num_samples):
-            (hps, bps, lps, brs) = self.process_sample(x[n])
-            hp[n] = hps
-            bp[n] = bps
-            lp[n] = lps
-            br[n] = brs
+        f = self._f
+        q = self._q
+        x1 = self._x1
+        x2 = self._x2
+        hp_out = []
+        bp_out = []
+        lp_out = []
+        br_out = []
+        for curr in yodel.buffer.to_list(x):
+            hps = curr - (q * x1) - x2
+            bps = hps * f + x1
+            lps = x1 * f + x2
+            x1 = bps
+            x2 = lps
+            hp_out.append(hps)
+            bp_out.append(bps)
+            lp_out.append(lps)
+            br_out.append(hps + lps)
+        self._x1 = x1
+        self._x2 = x2
+        yodel.buffer.assign(hp_out, hp)
+        yodel.buffer.assign(bp_out, bp)
+        yodel.buffer.assign(lp_out, lp)
+        yodel.buffer.assign(br_out, br)
 
 
 class ParametricEQ:
@@ -464,9 +736,10 @@ class ParametricEQ:
         :param input_signal: input buffer
         :param output_signal: filtered buffer
         """
-        self.filters[0].process(input_signal, output_signal)
-        for i in range(1, self.num_bands):
-            self.filters[i].process(output_signal, output_signal)
+        output = list(yodel.buffer.to_list(input_signal))
+        for flt in self.filters:
+            flt.process(output, output)
+        yodel.buffer.assign(output, output_signal)
 
 
 class Comb:
@@ -603,14 +876,51 @@ class Comb:
         """
         Filter an input signal.
 
+        The feedback comb filter only depends on samples older than its
+        delay, hence it is computed by blocks of up to this length.
+
         :param input_signal: input signal
         :param output_signal: filtered signal
         """
+        input_signal = yodel.buffer.to_list(input_signal)
         size = len(input_signal)
-        for i in range(0, size):
-            output_signal[i] = self.process_sample(input_signal[i])
-            self.x1 = input_signal[i]
-            self.y1 = output_signal[i]
+        if size == 0:
+            return
+
+        gain = self.gain
+        if self.__combfunc == self.__feedforward:
+            delayed = [0] * size
+            self.delayline.process(input_signal, delayed)
+            output = [x + gain * d for (x, d) in zip(input_signal, delayed)]
+        elif self.__combfunc == self.__feedback:
+            step = self.delayline.max_read_size()
+            output = []
+            if step == 0:
+                for x in input_signal:
+                    self.y1 = self.process_sample(x)
+                    output.append(self.y1)
+            else:
+                for start in range(0, size, step):
+                    block = input_signal[start:start + step]
+                    delayed = [0] * len(block)
+                    self.delayline.read(delayed)
+                    block = [x + gain * d for (x, d) in zip(block, delayed)]
+                    self.delayline.write([self.y1] + block[0:-1])
+                    self.y1 = block[-1]
+                    output += block
+        else:
+            output = [0] * size
+            x1 = self.x1
+            y1 = self.y1
+            for i in range(0, size):
+                x = input_signal[i]
+                y1 = gain * x - gain * y1 + x1
+                x1 = x
+                output[i] = y1
+
+        self.x1 = input_signal[size - 1]
+        self.y1 = output[size - 1]
+        yodel.buffer.assign(output, output_signal)
 
 
 class Convolution:
@@ -628,20 +938,23 @@ class Convolution:
         scientists", Steven W. Smith
     """
 
-    def __init__(self, framesize, impulse_response):
+    def __init__(self, framesize, impulse_response, typecode='d'):
         """
         Create a convolution filter.
 
         :param framesize: framesize of input buffers to be filtered
         :param impulse_response: the impulse response signal to used
+        :param typecode: type of the stored samples, 'd' or 'f' (see
+                         :py:mod:`yodel.buffer`)
         """
         self.framesize = framesize
         self.impulse_response = impulse_response
         self.irsize = len(impulse_response)
         self.convsize = self.framesize + self.irsize - 1
         self.olapsize = self.convsize - self.framesize
-        self.conv = [0] * self.convsize
-        self.olap = [0] * self.olapsize
+        self.typecode = typecode
+        self.conv = yodel.buffer.zeros(self.convsize, self.typecode)
+        self.olap = yodel.buffer.zeros(self.olapsize, self.typecode)
 
     def process(self, input_signal, output_signal):
         """
@@ -659,31 +972,29 @@ class Convolution:
         :param input_signal: input signal to be filtered
         :param output_signal: filtered signal
         """
-        for i in range(0, self.convsize):
-            self.conv[i] = 0
-
-        for i in range(0, self.framesize):
-            for j in range(0, self.irsize):
-                self.conv[i + j] += input_signal[i] * self.impulse_response[j]
-
-        if self.olapsize <= self.framesize:
-            for i in range(0, self.olapsize):
-                output_signal[i] = self.conv[i] + self.olap[i]
-
-            for i in range(self.olapsize, self.framesize):
-                output_signal[i] = self.conv[i]
-
-            for i in range(self.framesize, self.convsize):
-                self.olap[i - self.framesize] = self.conv[i]
+        framesize = self.framesize
+        olapsize = self.olapsize
+        input_signal = yodel.buffer.to_list(input_signal)[0:framesize]
+        conv = [0.0] * self.convsize
+        for j in range(0, self.irsize):
+            coeff = self.impulse_response[j]
+            conv[j:j + framesize] = map(operator.add, conv[j:j + framesize],
+                                        [coeff * x for x in input_signal])
+
+        olap = self.olap.tolist()
+        if olapsize <= framesize:
+            output = (list(map(operator.add, conv[0:olapsize], olap)) +
+                      conv[olapsize:framesize])
+            olap = conv[framesize:self.convsize]
         else:
-            for i in range(0, self.framesize):
-                output_signal[i] = self.conv[i] + self.olap[i]
+            output = list(map(operator.add, conv[0:framesize], olap))
+            olap = (list(map(operator.add, olap[framesize:olapsize],
+                             conv[framesize:olapsize])) +
+                    conv[olapsize:self.convsize])
 
-            for i in range(self.framesize, self.olapsize):
-                self.olap[i - self.framesize] = self.olap[i] + self.conv[i]
-
-            for i in range(self.olapsize, self.convsize):
-                self.olap[i - self.framesize] = self.conv[i]
+        self.conv[0:self.convsize] = array.array(self.typecode, conv)
+        self.olap[0:olapsize] = array.array(self.typecode, olap)
+        yodel.buffer.assign(output, output_signal)
 
 
 class FastConvolution:
@@ -699,31 +1010,77 @@ class FastConvolution:
         scientists", Steven W. Smith
     """
 
-    def __init__(self, framesize, impulse_response):
+    def __init__(self, framesize, impulse_response, typecode='d'):
         """
         Create a fast convolution filter.
 
         :param framesize: framesize of input buffers to be filtered
         :param impulse_response: the impulse response signal to used
+        :param typecode: type of the stored samples, 'd' or 'f' (see
+                         :py:mod:`yodel.buffer`)
         """
         self.framesize = framesize
-        self.irsize = len(impulse_response)
-        self.convsize = self.framesize + self.irsize - 1
-        self.fftsize = 1 << int(math.ceil(math.log(self.convsize, 2)))
-        self.olapsize = self.convsize - self.framesize
+        self.fftsize = 0
+        self.olapsize = 0
+        self.typecode = typecode
+        self.olap = yodel.buffer.zeros(0, self.typecode)
+        self.set_impulse_response(impulse_response)
 
-        self.ir = [0] * self.fftsize
-        self.ir_real = [0] * self.fftsize
-        self.ir_imag = [0] * self.fftsize
-        self.signal = [0] * self.fftsize
-        self.signal_real = [0] * self.fftsize
-        self.signal_imag = [0] * self.fftsize
-        self.olap = [0] * self.olapsize
+    def set_impulse_response(self, impulse_response, crossfade=False):
+        """
+        Change the impulse response without interrupting the filtering: the
+        'tail' of the previous convolutions is kept. The FFT and the internal
+        buffers are only reallocated when the FFT size changes.
 
-        for i in range(0, self.irsize):
-            self.ir[i] = impulse_response[i]
+        When crossfading, the next filtered signal fades linearly from the
+        previous impulse response to the new one (the FFT size is then kept
+        large enough for both impulse responses).
+
+        :param impulse_response: the new impulse response signal
+        :param crossfade: True to crossfade with the previous impulse response
+        """
+        self.irsize = len(impulse_response)
+        self.convsize = self.framesize + self.irsize - 1
+        fftsize = 1 << int(math.ceil(math.log(self.convsize, 2)))
+
+        fade = crossfade and self.fftsize > 0
+        if fade:
+            fftsize = max(fftsize, self.fftsize)
+        self._fade = None
+
+        if fftsize != self.fftsize:
+            self.fftsize = fftsize
+            self.fft = yodel.analysis.FFT(self.fftsize)
+            zeros = yodel.buffer.zeros(self.fftsize, self.typecode)
+            self.signal = yodel.buffer.zeros(self.fftsize, 'd')
+            self.signal_real = yodel.buffer.zeros(self.fftsize, 'd')
+            self.signal_imag = yodel.buffer.zeros(self.fftsize, 'd')
+            self._fade_real = yodel.buffer.zeros(self.fftsize, 'd')
+            self._fade_imag = yodel.buffer.zeros(self.fftsize, 'd')
+            self._fade_signal = yodel.buffer.zeros(self.fftsize, 'd')
+            self._padding = yodel.buffer.zeros(self.fftsize - self.framesize,
+                                               'd')
+            self._spectra = [(array.array(self.typecode, zeros),
+                              array.array(self.typecode, zeros))
+                             for i in range(0, 2)]
+            self._spectrum = 0
+            if fade:
+                old_ir = self.ir + zeros[len(self.ir):]
+                self._fade = self._spectra[1]
+                self.fft.forward(old_ir, self._fade[0], self._fade[1])
+            self.ir = array.array(self.typecode, zeros)
+        elif fade:
+            self._fade = self._spectra[self._spectrum]
+            self._spectrum = 1 - self._spectrum
+        (self.ir_real, self.ir_imag) = self._spectra[self._spectrum]
+
+        impulse_response = yodel.buffer.to_list(impulse_response)
+        self.ir[0:self.fftsize] = (array.array(self.typecode,
+                                               impulse_response) +
+                                   yodel.buffer.zeros(
+                                       self.fftsize - self.irsize,
+                                       self.typecode))
 
-        self.fft = yodel.analysis.FFT(self.fftsize)
         self.fft.forward(self.ir, self.ir_real, self.ir_imag)
 
     def process(self, input_signal, output_signal):
@@ -742,41 +1099,64 @@ class FastConvolution:
         :param input_signal: input signal to be filtered
         :param output_signal: filtered signal
         """
-        for i in range(0, self.framesize):
-            self.signal[i] = input_signal[i]
-
-        for i in range(self.framesize, self.fftsize):
-            self.signal[i] = 0
-
-        self.fft.forward(self.signal, self.signal_real, self.signal_imag)
-
-        for i in range(0, int((self.fftsize/2)+1)):
-            temp = (self.signal_real[i] * self.ir_real[i] -
-                    self.signal_imag[i] * self.ir_imag[i])
-            self.signal_imag[i] = (self.signal_real[i] * self.ir_imag[i] +
-                                   self.signal_imag[i] * self.ir_real[i])
-            self.signal_real[i] = temp
-
-        self.fft.inverse(self.signal_real, self.signal_imag, self.signal)
-
-        if self.olapsize <= self.framesize:
-            for i in range(0, self.olapsize):
-                output_signal[i] = self.signal[i] + self.olap[i]
-
-            for i in range(self.olapsize, self.framesize):
-                output_signal[i] = self.signal[i]
-
-            for i in range(self.framesize, self.convsize):
-                self.olap[i - self.framesize] = self.signal[i]
+        framesize = self.framesize
+        half = int(self.fftsize / 2) + 1
+        signal = self.signal
+        signal_real = self.signal_real
+        signal_imag = self.signal_imag
+        signal[0:framesize] = array.array(
+            'd', yodel.buffer.to_list(input_signal)[0:framesize])
+        signal[framesize:self.fftsize] = self._padding
+        self.fft.forward(signal, signal_real, signal_imag)
+
+        sig_real = signal_real[0:half].tolist()
+        sig_imag = signal_imag[0:half].tolist()
+
+        if self._fade is not None:
+            (old_real, old_imag) = self._fade
+            self._fade_real[0:half] = array.array('d', [
+                sr * orr - si * oi for (sr, si, orr, oi)
+                in zip(sig_real, sig_imag, old_real, old_imag)])
+            self._fade_imag[0:half] = array.array('d', [
+                sr * oi + si * orr for (sr, si, orr, oi)
+                in zip(sig_real, sig_imag, old_real, old_imag)])
+            self.fft.inverse(self._fade_real, self._fade_imag,
+                             self._fade_signal)
+
+        ir_real = self.ir_real
+        ir_imag = self.ir_imag
+        signal_real[0:half] = array.array('d', [
+            sr * ir - si * ii for (sr, si, ir, ii)
+            in zip(sig_real, sig_imag, ir_real, ir_imag)])
+        signal_imag[0:half] = array.array('d', [
+            sr * ii + si * ir for (sr, si, ir, ii)
+            in zip(sig_real, sig_imag, ir_real, ir_imag)])
+        self.fft.inverse(signal_real, signal_imag, signal)
+
+        if self._fade is not None:
+            signal[0:framesize] = array.array('d', [
+                fade + ((i + 1.0) / framesize) * (curr - fade)
+                for (i, (curr, fade)) in enumerate(zip(
+                    itertools.islice(signal, framesize), self._fade_signal))])
+            self._fade = None
+
+        olap = self.olap.tolist()
+        olapsize = min(self.olapsize, framesize)
+        output = (list(map(operator.add, itertools.islice(signal, olapsize),
+                           olap)) +
+                  signal[olapsize:framesize].tolist())
+
+        tail = signal[framesize:self.convsize].tolist()
+        olap = olap[framesize:]
+        if len(olap) < len(tail):
+            olap += [0.0] * (len(tail) - len(olap))
+        olap[0:len(tail)] = map(operator.add, olap[0:len(tail)], tail)
+        if len(olap) == len(self.olap):
+            self.olap[0:len(olap)] = array.array(self.typecode, olap)
         else:
-            for i in range(0, self.framesize):
-                output_signal[i] = self.signal[i] + self.olap[i]
-
-            for i in range(self.framesize, self.olapsize):
-                self.olap[i - self.framesize] = self.olap[i] + self.signal[i]
-
-            for i in range(self.olapsize, self.convsize):
-                self.olap[i - self.framesize] = self.signal[i]
+            self.olap = array.array(self.typecode, olap)
+        self.olapsize = len(olap)
+        yodel.buffer.assign(output, output_signal)
 
 
 class WindowedSinc:
@@ -792,12 +1172,14 @@ class WindowedSinc:
         scientists", Steven W. Smith
     """
 
-    def __init__(self, samplerate, framesize):
+    def __init__(self, samplerate, framesize, typecode='d'):
         """
         Create a windowed sinc filter with a flat frequency response.
 
         :param samplerate: sample-rate in Hz
         :param framesize: framesize of input buffers to be filtered
+        :param typecode: type of the stored samples of the convolution, 'd'
+                         or 'f' (see :py:mod:`yodel.buffer`)
         """
         self.samplerate = samplerate
         self.framesize = framesize
@@ -805,11 +1187,12 @@ class WindowedSinc:
         self.kernelsize = 3
         self.kernel = [0] * self.kernelsize
         self.kernel[0] = 1
+        self._lowpass = [0] * self.kernelsize
         self.win = yodel.analysis.Window(self.kernelsize)
         self.win.blackman(self.kernelsize)
-        self.conv = FastConvolution(self.framesize, self.kernel)
+        self.conv = FastConvolution(self.framesize, self.kernel, typecode)
 
-    def low_pass(self, cutoff, bandwidth):
+    def low_pass(self, cutoff, bandwidth, crossfade=False):
         """
         Make a low-pass filter with given cutoff frequency and bandwidth.
         Lowering the bandwidth will increase the size of the kernel filter,
@@ -817,13 +1200,78 @@ class WindowedSinc:
 
         :param cutoff: cut-off frequency in Hz
         :param bandwidth: frequency band width in Hz
+        :param crossfade: True to crossfade with the previous kernel
+        """
+        self._low_pass(cutoff, bandwidth)
+        self.conv.set_impulse_response(self.kernel, crossfade)
+
+    def high_pass(self, cutoff, bandwidth, crossfade=False):
+        """
+        Make a high-pass filter with given cutoff frequency and bandwidth.
+        Lowering the bandwidth will increase the size of the kernel filter,
+        thus increasing the roll-off rate but also the computation cost.
+
+        :param cutoff: cut-off frequency in Hz
+        :param bandwidth: frequency band width in Hz
+        :param crossfade: True to crossfade with the previous kernel
+        """
+        self._high_pass(cutoff, bandwidth)
+        self.conv.set_impulse_response(self.kernel, crossfade)
+
+    def band_reject(self, center, bandwidth, crossfade=False):
+        """
+        Make a band-reject filter with given center frequency and bandwidth.
+        Lowering the bandwidth will increase the size of the kernel filter,
+        thus increasing the roll-off rate but also the computation cost.
+
+        :param center: center frequency in Hz
+        :param bandwidth: frequency band width in Hz
+        :param crossfade: True to crossfade with the previous kernel
+        """
+        self._band_reject(center, bandwidth)
+        self.conv.set_impulse_response(self.kernel, crossfade)
+
+    def band_pass(self, center, bandwidth, crossfade=False):
+        """
+        Make a band-pass filter with given center frequency and bandwidth.
+        Lowering the bandwidth will increase the size of the kernel filter,
+        thus increasing the roll-off rate but also the computation cost.
+
+        :param center: center frequency in Hz
+        :param bandwidth: frequency band width in Hz
+        :param crossfade: True to crossfade with the previous kernel
+        """
+        self._band_reject(center, bandwidth)
+
+        for i in range(0, self.kernelsize):
+            self.kernel[i] *= -1
+        self.kernel[int((self.kernelsize-1)/2)] += 1
+
+        self.conv.set_impulse_response(self.kernel, crossfade)
+
+    def process(self, input_signal, output_signal):
+        """
+        Filter an input signal with the current kernel.
+        The length of the input signal must be the one defined at filter
+        creation.
+
+        :param input_signal: input signal to be filtered
+        :param output_signal: filtered signal
+        """
+        self.conv.process(input_signal, output_signal)
+
+    def _low_pass(self, cutoff, bandwidth):
+        """
+        Compute a low-pass kernel.
         """
         self.cutoff = cutoff
         normcutoff = cutoff / self.samplerate
         self.kernelsize = int(4.0 * self.samplerate / bandwidth)
         if (self.kernelsize % 2) == 0:
             self.kernelsize += 1
-        self.kernel = [0] * self.kernelsize
+        if len(self.kernel) != self.kernelsize:
+            self.kernel = [0] * self.kernelsize
+            self._lowpass = [0] * self.kernelsize
         kernelsizeon2 = int((self.kernelsize-1)/2)
 
         for i in range(0, self.kernelsize):
@@ -834,7 +1282,8 @@ class WindowedSinc:
                 self.kernel[i] = (math.sin(2.0 * math.pi * normcutoff * tmp)
                                   / tmp)
 
-        self.win.blackman(self.kernelsize)
+        if self.win.size != self.kernelsize:
+            self.win.blackman(self.kernelsize)
         self.win.process(self.kernel, self.kernel)
 
         norm = 0
@@ -844,64 +1293,31 @@ class WindowedSinc:
         for i in range(0, self.kernelsize):
             self.kernel[i] /= norm
 
-        self.conv = FastConvolution(self.framesize, self.kernel)
-
-    def high_pass(self, cutoff, bandwidth):
+    def _high_pass(self, cutoff, bandwidth):
         """
-        Make a high-pass filter with given cutoff frequency and bandwidth.
-        Lowering the bandwidth will increase the size of the kernel filter,
-        thus increasing the roll-off rate but also the computation cost.
-
-        :param cutoff: cut-off frequency in Hz
-        :param bandwidth: frequency band width in Hz
+        Compute a high-pass kernel, by spectral inversion of a low-pass one.
         """
-        self.low_pass(cutoff, bandwidth)
+        self._low_pass(cutoff, bandwidth)
 
         for i in range(0, self.kernelsize):
             self.kernel[i] *= -1
         self.kernel[int((self.kernelsize-1)/2)] += 1
 
-        self.conv = FastConvolution(self.framesize, self.kernel)
-
-    def band_reject(self, center, bandwidth):
+    def _band_reject(self, center, bandwidth):
         """
-        Make a band-reject filter with given center frequency and bandwidth.
-        Lowering the bandwidth will increase the size of the kernel filter,
-        thus increasing the roll-off rate but also the computation cost.
-
-        :param center: center frequency in Hz
-        :param bandwidth: frequency band width in Hz
+        Compute a band-reject kernel, by adding a low-pass and a high-pass.
         """
-        self.low_pass(center - bandwidth/2.0, bandwidth/2.0)
+        self._low_pass(center - bandwidth/2.0, bandwidth/2.0)
 
-        lowpass = [0] * self.kernelsize
+        lowpass = self._lowpass
         for i in range(0, self.kernelsize):
             lowpass[i] = self.kernel[i]
 
-        self.high_pass(center + bandwidth/2.0, bandwidth/2.0)
+        self._high_pass(center + bandwidth/2.0, bandwidth/2.0)
 
         for i in range(0, self.kernelsize):
             self.kernel[i] += lowpass[i]
 
-        self.conv = FastConvolution(self.framesize, self.kernel)
-
-    def band_pass(self, center, bandwidth):
-        """
-        Make a band-pass filter with given center frequency and bandwidth.
-        Lowering the bandwidth will increase the size of the kernel filter,
-        thus increasing the roll-off rate but also the computation cost.
-
-        :param center: center frequency in Hz
-        :param bandwidth: frequency band width in Hz
-        """
-        self.band_reject(center, bandwidth)
-
-        for i in range(0, self.kernelsize):
-            self.kernel[i] *= -1
-        self.kernel[int((self.kernelsize-1)/2)] += 1
-
-        self.conv = FastConvolution(self.framesize, self.kernel)
-
 
 class Custom:
     """
@@ -914,59 +1330,138 @@ class Custom:
         scientists", Steven W. Smith
     """
 
-    def __init__(self, samplerate, framesize):
+    def __init__(self, samplerate, framesize, typecode='d'):
         """
         Create a custom filter with a flat frequency response.
         By default, the filter has a latency of (framesize/2) samples.
 
         :param samplerate: sample-rate in Hz
         :param framesize: framesize of input buffers to be filtered
+        :param typecode: type of the stored samples of the convolution, 'd'
+                         or 'f' (see :py:mod:`yodel.buffer`)
         """
         self.samplerate = samplerate
         self.framesize = framesize
+        self.typecode = typecode
         flatresp = [1] * int((framesize/2)+1)
         self.design(flatresp, False)
 
-    def design(self, freqresponse, db=True):
+    def design(self, freqresponse, db=True, phase='linear', crossfade=False):
         """
         Create the filter impulse response from the specified frequency
         response.
 
         The response must represent the desired spectrum, and of
-        size (Nfft/2+1). The latency of the filter will be of (Nfft/2) samples.
+        size (Nfft/2+1). With a linear phase, the latency of the filter will
+        be of (Nfft/2) samples. With a minimum phase, the filter has no
+        latency and its impulse response is truncated to the length holding
+        all but a negligible part (-60 dB) of its energy, making it cheaper
+        to convolve.
 
         The values of the frequency bands can either be specified in linear
         scale (1 being flat) or in dB scale (0 being flat).
 
+        A redesign keeps the 'tail' of the previous filtering and reuses the
+        FFT, the window and the convolution buffers whenever the size of the
+        response is unchanged. It can also crossfade over the next filtered
+        signal from the previous impulse response to the new one.
+
         :param freqresponse: desired frequency response
         :param db: True if the frequency response is specified in dB
+        :param phase: phase of the filter, either 'linear' or 'minimum'
+        :param crossfade: True to crossfade with the previous impulse response
         """
+        if phase not in ('linear', 'minimum'):
+            raise ValueError("phase must be either 'linear' or 'minimum'")
+
+        self.phase = phase
         self.frsize = len(freqresponse)
         self.fftsize = int((self.frsize-1) * 2)
-        self.latency = int(self.fftsize / 2)
-        self.fr_real = [0] * self.fftsize
-        self.fr_imag = [0] * self.fftsize
-        self.ir = [0] * self.fftsize
-        self.shifted_ir = [0] * self.fftsize
+
+        if not hasattr(self, 'fft') or self.fft.size != self.fftsize:
+            self.fft = yodel.analysis.FFT(self.fftsize)
+            self.fr_real = [0] * self.fftsize
+            self.fr_imag = [0] * self.fftsize
+            self.shifted_ir = [0] * self.fftsize
+            self._ir = [0] * self.fftsize
+            self._cepstrum = [0] * self.fftsize
 
         for i in range(0, self.frsize):
             if db:
                 self.fr_real[i] = yodel.conversion.db2lin(freqresponse[i])
             else:
                 self.fr_real[i] = freqresponse[i]
+            self.fr_imag[i] = 0
+
+        if phase == 'minimum':
+            self.latency = 0
+            self._minimum_phase()
+        else:
+            self.latency = int(self.fftsize / 2)
+            self.fft.inverse(self.fr_real, self.fr_imag, self._ir)
 
-        self.fft = yodel.analysis.FFT(self.fftsize)
-        self.fft.inverse(self.fr_real, self.fr_imag, self.ir)
+            for i in range(0, self.fftsize):
+                index = int(i + self.frsize) % self.fftsize
+                self.shifted_ir[index] = self._ir[i]
 
-        for i in range(0, self.fftsize):
-            index = int(i + self.frsize) % self.fftsize
-            self.shifted_ir[index] = self.ir[i]
+            if not hasattr(self, 'win') or self.win.size != self.fftsize:
+                self.win = yodel.analysis.Window(self.fftsize)
+                self.win.blackman(self.fftsize)
+            self.win.process(self.shifted_ir, self._ir)
+            self.ir = self._ir
 
-        self.win = yodel.analysis.Window(self.fftsize)
-        self.win.blackman(self.fftsize)
-        self.win.process(self.shifted_ir, self.ir)
+        if hasattr(self, 'fir'):
+            self.fir.set_impulse_response(self.ir, crossfade)
+        else:
+            self.fir = FastConvolution(self.framesize, self.ir,
+                                       self.typecode)
+
+    def _minimum_phase(self):
+        """
+        Compute a minimum phase impulse response from the magnitude response
+        using the real cepstrum, then truncate it to its energy-significant
+        length.
 
-        self.fir = FastConvolution(self.framesize, self.ir)
+        *Reference:*
+            "Spectral Audio Signal Processing", Julius O. Smith
+            (https://ccrma.stanford.edu/~jos/sasp/)
+        """
+        size = self.fftsize
+        half = int(size / 2)
+        cepstrum = self._cepstrum
+        for i in range(0, self.frsize):
+            self.fr_real[i] = math.log(max(abs(self.fr_real[i]), 1e-5))
+            self.fr_imag[i] = 0
+        self.fft.inverse(self.fr_real, self.fr_imag, cepstrum)
+
+        for i in range(1, half):
+            cepstrum[i] *= 2.0
+        for i in range(half + 1, size):
+            cepstrum[i] = 0
+
+        self.fft.forward(cepstrum, self.fr_real, self.fr_imag)
+        for i in range(0, self.frsize):
+            mag = math.exp(self.fr_real[i])
+            self.fr_real[i] = mag * math.cos(self.fr_imag[i])
+            self.fr_imag[i] = mag * math.sin(self.fr_imag[i])
+        ir = self._ir
+        self.fft.inverse(self.fr_real, self.fr_imag, ir)
+
+        energy = sum([h * h for h in ir])
+        threshold = 0.999999 * energy
+        length = size
+        while length > 1:
+            tail = ir[length - 1] * ir[length - 1]
+            if energy - tail < threshold:
+                break
+            energy -= tail
+            length -= 1
+        if length == size:
+            self.ir = ir
+        elif not hasattr(self, 'ir') or len(self.ir) != length:
+            self.ir = ir[0:length]
+        else:
+            self.ir[0:length] = ir[0:length]
 
     def process(self, input_signal, output_signal):
         """
@@ -985,3 +1480,417 @@ class Custom:
         :param output_signal: filtered signal
         """
         self.fir.process(input_signal, output_signal)
+
+
+class Resampler:
+    """
+    A resampler converts a signal from one sample-rate to another. The
+    anti-aliasing filter is a low-pass prototype designed with
+    :py:class:`WindowedSinc`, decomposed into polyphase branches so that only
+    the needed output samples are computed.
+
+    Rational ratios (such as 44.1 kHz to 48 kHz) use one branch per phase of
+    the upsampling factor. Other ratios use a fixed number of branches, and
+    the output is linearly interpolated between two neighbouring branches.
+
+    Branch tables are computed once per ratio and quality, and shared between
+    resamplers.
+
+    *Reference:*
+        "Digital Audio Resampling Home Page",
+        Julius O. Smith
+        (https://ccrma.stanford.edu/~jos/resample/)
+    """
+
+    _tables = {}
+
+    def __init__(self, in_rate, out_rate, quality=32):
+        """
+        Create a resampler.
+
+        :param in_rate: sample-rate of the input signal in Hz
+        :param out_rate: sample-rate of the output signal in Hz
+        :param quality: number of filter taps per output sample (at least 4)
+        """
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.quality = max(4, int(quality))
+
+        ratio = fractions.Fraction(out_rate) / fractions.Fraction(in_rate)
+        approx = ratio.limit_denominator(1000)
+        if approx == ratio and approx.numerator <= 1000:
+            self.rational = True
+            self.up = approx.numerator
+            self.down = approx.denominator
+            self.phases = self.up
+        else:
+            self.rational = False
+            self.up = 0
+            self.down = 0
+            self.phases = 256
+            self._step = float(in_rate) / float(out_rate)
+
+        key = (ratio, self.quality)
+        if key not in Resampler._tables:
+            Resampler._tables[key] = self._design()
+        (self.branches, self.latency) = Resampler._tables[key]
+        self.taps = len(self.branches[0])
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the input history and the current phase.
+        """
+        self._history = [0.0] * (self.taps - 1)
+        self._index = 0
+        self._phase = 0
+        self._pos = 0.0
+
+    def max_output_size(self, input_size):
+        """
+        Give the maximum number of samples produced for a given input size.
+
+        :param input_size: number of input samples
+        :rtype: maximum number of output samples
+        """
+        return int(math.ceil(input_size * float(self.out_rate) /
+                             float(self.in_rate))) + 1
+
+    def process(self, input_signal, output_signal):
+        """
+        Resample an input signal. Blocks of any size can be processed, the
+        state being kept between consecutive calls.
+
+        The output signal must be able to hold at least
+        :py:meth:`max_output_size` samples.
+
+        :param input_signal: input signal at the input sample-rate
+        :param output_signal: resampled signal at the output sample-rate
+        :rtype: number of samples written in the output signal
+        """
+        size = len(input_signal)
+        buf = self._history + yodel.buffer.to_list(input_signal)
+        branches = self.branches
+        taps = self.taps
+        output = []
+
+        if self.rational:
+            n = self._index
+            phase = self._phase
+            up = self.up
+            down = self.down
+            while n < size:
+                output.append(sum(map(operator.mul, branches[phase],
+                                      buf[n:n + taps])))
+                phase += down
+                n += phase // up
+                phase %= up
+            self._index = n - size
+            self._phase = phase
+        else:
+            pos = self._pos
+            step = self._step
+            phases = self.phases
+            while pos < size:
+                n = int(pos)
+                frac = (pos - n) * phases
+                phase = int(frac)
+                alpha = frac - phase
+                window = buf[n:n + taps]
+                out0 = sum(map(operator.mul, branches[phase], window))
+                out1 = sum(map(operator.mul, branches[phase + 1], window))
+                output.append(out0 + alpha * (out1 - out0))
+                pos += step
+            self._pos = pos - size
+
+        if taps > 1:
+            self._history = buf[-(taps - 1):]
+        yodel.buffer.assign(output, output_signal)
+        return len(output)
+
+    def _design(self):
+        """
+        Design the prototype low-pass filter and split it into polyphase
+        branches.
+
+        :rtype: tuple (branches, latency in output samples)
+        """
+        phases = self.phases
+        minrate = float(min(self.in_rate, self.out_rate))
+        protorate = float(self.in_rate) * phases
+        bandwidth = 4.0 * minrate / self.quality
+        cutoff = minrate / 2.0 - bandwidth / 2.0
+
+        proto = WindowedSinc(protorate, 1)
+        proto.low_pass(cutoff, bandwidth)
+        kernel = [float(phases) * h for h in proto.kernel]
+
+        taps = int(math.ceil(float(len(kernel)) / phases))
+        kernel += [0.0] * (taps * phases + 1 - len(kernel))
+
+        branches = []
+        for p in range(0, phases + 1):
+            branch = [kernel[p + k * phases] for k in range(0, taps)]
+            branch.reverse()
+            branches.append(branch)
+
+        latency = ((len(proto.kernel) - 1) / 2.0 / phases *
+                   float(self.out_rate) / float(self.in_rate))
+        return (branches, latency)
+
+
+def _multirate_kernels(factor):
+    """
+    Design the anti-aliasing kernels of a multistage decimation (or
+    interpolation) by an integer factor. Factors of 2 are handled with
+    half-band stages, the remaining factor with a single final stage.
+
+    :param factor: overall integer factor
+    :rtype: list of tuples (stage factor, kernel), from the highest rate
+    """
+    remaining = factor
+    halfbands = 0
+    while remaining % 2 == 0 and remaining > 1:
+        remaining //= 2
+        halfbands += 1
+
+    stages = []
+    proto = WindowedSinc(1.0, 1)
+    for i in range(0, halfbands):
+        ratio = factor // (2 << i)
+        proto.low_pass(0.25, 0.5 - 0.4 / ratio)
+        kernel = proto.kernel
+        center = int((proto.kernelsize - 1) / 2)
+        for j in range(center % 2, proto.kernelsize, 2):
+            if j != center:
+                kernel[j] = 0.0
+        stages.append((2, kernel))
+    if remaining > 1:
+        proto.low_pass(0.45 / remaining, 0.1 / remaining)
+        stages.append((remaining, proto.kernel))
+    return stages
+
+
+def _polyphase_branches(kernel, stride):
+    """
+    Split a time-reversed kernel into polyphase branches, discarding the
+    leading and trailing zeros of every branch (half-band kernels reduce
+    one branch to a single coefficient).
+
+    :param kernel: time-reversed filter kernel
+    :param stride: number of branches
+    :rtype: list of tuples (first position, coefficients)
+    """
+    branches = []
+    for r in range(0, stride):
+        coeffs = kernel[r::stride]
+        first = 0
+        while first < len(coeffs) and coeffs[first] == 0:
+            first += 1
+        last = len(coeffs)
+        while last > first and coeffs[last - 1] == 0:
+            last -= 1
+        if last > first:
+            branches.append((r + first * stride, coeffs[first:last]))
+    return branches
+
+
+class Decimator:
+    """
+    A decimator reduces the sample-rate of a signal by an integer factor.
+    The anti-aliasing FIR filter is evaluated in polyphase form, so that only
+    the retained output samples are computed.
+
+    When no filter kernel is provided, a factor containing powers of 2 is
+    realized as a cascade of half-band stages followed by a final stage,
+    which is cheaper than a single sharp filter at the full sample-rate.
+    """
+
+    def __init__(self, factor, taps=None):
+        """
+        Create a decimator.
+
+        :param factor: integer decimation factor
+        :param taps: impulse response of the anti-aliasing filter (designed
+                     automatically if not provided)
+        """
+        self.factor = int(factor)
+        self.stages = []
+        if taps is not None:
+            self.taps = list(taps)
+        elif self.factor <= 2 or self.factor % 2 != 0:
+            kernels = _multirate_kernels(self.factor)
+            self.taps = kernels[0][1] if kernels else [1.0]
+        else:
+            self.taps = None
+            for (factor, kernel) in _multirate_kernels(self.factor):
+                self.stages.append(Decimator(factor, kernel))
+
+        if self.taps is not None:
+            self._length = len(self.taps)
+            self._branches = _polyphase_branches(self.taps[::-1],
+                                                 self.factor)
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the decimator state.
+        """
+        for stage in self.stages:
+            stage.reset()
+        if self.taps is not None:
+            self._history = [0.0] * (self._length - 1)
+        self._index = 0
+
+    def max_output_size(self, input_size):
+        """
+        Give the maximum number of samples produced for a given input size.
+
+        :param input_size: number of input samples
+        :rtype: maximum number of output samples
+        """
+        return int(math.ceil(float(input_size) / self.factor))
+
+    def process(self, input_signal, output_signal):
+        """
+        Decimate an input signal. Blocks of any size can be processed, the
+        state being kept between consecutive calls.
+
+        The output signal must be able to hold at least
+        :py:meth:`max_output_size` samples.
+
+        :param input_signal: input signal
+        :param output_signal: decimated signal
+        :rtype: number of samples written in the output signal
+        """
+        if self.stages:
+            signal = input_signal
+            for stage in self.stages:
+                stagesignal = [0] * stage.max_output_size(len(signal))
+                count = stage.process(signal, stagesignal)
+                signal = stagesignal[0:count]
+            yodel.buffer.assign(signal, output_signal)
+            return count
+
+        size = len(input_signal)
+        buf = self._history + yodel.buffer.to_list(input_signal)
+        branches = self._branches
+        factor = self.factor
+        output = []
+        n = self._index
+        while n < size:
+            acc = 0.0
+            for (first, coeffs) in branches:
+                start = n + first
+                acc += sum(map(operator.mul, coeffs,
+                               buf[start:start + len(coeffs) * factor:
+                                   factor]))
+            output.append(acc)
+            n += factor
+        self._index = n - size
+
+        if self._length > 1:
+            self._history = buf[-(self._length - 1):]
+        yodel.buffer.assign(output, output_signal)
+        return len(output)
+
+
+class Interpolator:
+    """
+    An interpolator increases the sample-rate of a signal by an integer
+    factor. The anti-imaging FIR filter is evaluated in polyphase form, so
+    that the zero-stuffed input samples are never multiplied.
+
+    When no filter kernel is provided, a factor containing powers of 2 is
+    realized as a first stage followed by a cascade of half-band stages,
+    which is cheaper than a single sharp filter at the full sample-rate.
+    """
+
+    def __init__(self, factor, taps=None):
+        """
+        Create an interpolator.
+
+        :param factor: integer interpolation factor
+        :param taps: impulse response of the anti-imaging filter, at the
+                     output sample-rate and with a unity DC gain (designed
+                     automatically if not provided)
+        """
+        self.factor = int(factor)
+        self.stages = []
+        if taps is not None:
+            self.taps = list(taps)
+        elif self.factor <= 2 or self.factor % 2 != 0:
+            kernels = _multirate_kernels(self.factor)
+            self.taps = kernels[0][1] if kernels else [1.0]
+        else:
+            self.taps = None
+            for (factor, kernel) in reversed(_multirate_kernels(self.factor)):
+                self.stages.append(Interpolator(factor, kernel))
+
+        if self.taps is not None:
+            self._length = int(math.ceil(float(len(self.taps)) /
+                                         self.factor))
+            kernel = ([self.factor * h for h in self.taps] +
+                      [0.0] * (self._length * self.factor - len(self.taps)))
+            self._branches = []
+            for p in range(0, self.factor):
+                branches = _polyphase_branches(kernel[p::self.factor][::-1],
+                                               1)
+                self._branches.append(branches)
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the interpolator state.
+        """
+        for stage in self.stages:
+            stage.reset()
+        if self.taps is not None:
+            self._history = [0.0] * (self._length - 1)
+
+    def max_output_size(self, input_size):
+        """
+        Give the number of samples produced for a given input size.
+
+        :param input_size: number of input samples
+        :rtype: number of output samples
+        """
+        return input_size * self.factor
+
+    def process(self, input_signal, output_signal):
+        """
+        Interpolate an input signal. Blocks of any size can be processed, the
+        state being kept between consecutive calls.
+
+        The output signal must be able to hold at least
+        :py:meth:`max_output_size` samples.
+
+        :param input_signal: input signal
+        :param output_signal: interpolated signal
+        :rtype: number of samples written in the output signal
+        """
+        if self.stages:
+            signal = input_signal
+            for stage in self.stages:
+                stagesignal = [0] * stage.max_output_size(len(signal))
+                count = stage.process(signal, stagesignal)
+                signal = stagesignal[0:count]
+            yodel.buffer.assign(signal, output_signal)
+            return count
+
+        size = len(input_signal)
+        buf = self._history + yodel.buffer.to_list(input_signal)
+        output = []
+        for n in range(0, size):
+            for branches in self._branches:
+                acc = 0.0
+                for (first, coeffs) in branches:
+                    start = n + first
+                    acc += sum(map(operator.mul, coeffs,
+                                   buf[start:start + len(coeffs)]))
+                output.append(acc)
+
+        if self._length > 1:
+            self._history = buf[-(self._length - 1):]
+        yodel.buffer.assign(output, output_signal)
+        return len(output)
@@ -0,0 +1,173 @@
+"""
+This module provides classes for connecting processors into processing
+graphs.
+"""
+
+import operator
+import yodel.buffer
+
+
+class Pipeline:
+    """
+    A pipeline connects processors into a graph and processes a whole signal
+    block through it with a single call. A stage can feed several stages
+    (fan-out) and a stage with several inputs receives the sum of their
+    outputs (fan-in).
+
+    A processor is any object with a ``process(input_signal, output_signal)``
+    method, or a function with the same signature, producing as many
+    samples as it receives.
+
+    The intermediate buffers are allocated once: a buffer is reused as soon
+    as the stage writing it has no remaining consumer, and a stage processes
+    in place the buffer of its input when it is the last one to read it. A
+    chain of stages hence runs in a single buffer, and the number of buffers
+    only depends on the width of the graph.
+    """
+
+    INPUT = -1
+
+    def __init__(self):
+        """
+        Create an empty pipeline, which copies its input to its output.
+        """
+        self.stages = []
+        self.output = None
+        self.num_buffers = 0
+        self._plan = None
+        self._plan_output = None
+        self._buffers = []
+
+    def add(self, processor, inputs=None, in_place=True):
+        """
+        Add a stage at the end of the pipeline.
+
+        :param processor: processor of the stage, or None to only sum its
+                          inputs
+        :param inputs: indices of the stages feeding this stage, or
+                       :py:attr:`INPUT` for the pipeline input (default:
+                       previous stage)
+        :param in_place: False if the processor cannot write its output into
+                         its input signal
+        :return: index of the new stage
+        """
+        index = len(self.stages)
+        if inputs is None:
+            inputs = [index - 1] if index > 0 else [Pipeline.INPUT]
+        if len(inputs) == 0:
+            raise ValueError('a stage needs at least one input')
+        for source in inputs:
+            if source < Pipeline.INPUT or source >= index:
+                raise ValueError('unknown input stage: %d' % source)
+
+        self.stages.append((processor, list(inputs), in_place))
+        self._plan = None
+        return index
+
+    def set_output(self, index):
+        """
+        Select the stage whose output is the pipeline output (default: last
+        stage).
+
+        :param index: index of the output stage
+        """
+        if index < 0 or index >= len(self.stages):
+            raise ValueError('unknown output stage: %d' % index)
+        self.output = index
+        self._plan = None
+
+    def compile(self):
+        """
+        Assign a buffer to every stage. This is done automatically before
+        processing the first signal after the graph has changed.
+        """
+        last_use = {}
+        for (index, (processor, inputs, in_place)) in enumerate(self.stages):
+            for source in inputs:
+                last_use[source] = index
+        output = self._output_stage()
+        last_use[output] = len(self.stages)
+
+        slots = {Pipeline.INPUT: None}
+        free = []
+        self.num_buffers = 0
+        self._plan = []
+
+        def allocate():
+            if free:
+                return free.pop()
+            self.num_buffers += 1
+            return self.num_buffers - 1
+
+        for (index, (processor, inputs, in_place)) in enumerate(self.stages):
+            dying = [slots[source] for source in set(inputs)
+                     if source != Pipeline.INPUT and last_use[source] == index]
+            if in_place and dying:
+                target = dying[0]
+            else:
+                target = allocate()
+
+            mix = None
+            if len(inputs) > 1:
+                if in_place or processor is None:
+                    mix = target
+                else:
+                    mix = allocate()
+                    free.append(mix)
+
+            self._plan.append((processor, [slots[source] for source in inputs],
+                               mix, target))
+            slots[index] = target
+            for slot in dying:
+                if slot != target:
+                    free.append(slot)
+            if index not in last_use:
+                free.append(target)
+
+        self._plan_output = slots[output] if self.stages else None
+
+    def process(self, input_signal, output_signal):
+        """
+        Process a signal through the whole pipeline.
+
+        :param input_signal: input signal
+        :param output_signal: output signal of the output stage
+        """
+        if self._plan is None:
+            self.compile()
+        signal = yodel.buffer.to_list(input_signal)
+        size = len(signal)
+        if (len(self._buffers) != self.num_buffers or
+                (self._buffers and len(self._buffers[0]) != size)):
+            self._buffers = [[0.0] * size for i in range(0, self.num_buffers)]
+        buffers = self._buffers
+
+        for (processor, sources, mix, target) in self._plan:
+            sources = [signal if slot is None else buffers[slot]
+                       for slot in sources]
+            if mix is not None:
+                mixed = sources[0]
+                for source in sources[1:]:
+                    mixed = list(map(operator.add, mixed, source))
+                buffers[mix][0:size] = mixed
+                source = buffers[mix]
+            else:
+                source = sources[0]
+            if processor is not None:
+                getattr(processor, 'process', processor)(source,
+                                                         buffers[target])
+            elif source is not buffers[target]:
+                buffers[target][0:size] = source
+
+        if self._plan_output is None:
+            yodel.buffer.assign(list(signal), output_signal)
+        else:
+            yodel.buffer.assign(buffers[self._plan_output], output_signal)
+
+    def _output_stage(self):
+        """
+        Get the index of the output stage.
+        """
+        if self.output is not None:
+            return self.output
+        return len(self.stages) - 1
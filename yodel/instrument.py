@@ -0,0 +1,209 @@
+"""
+This module measures where the processing time goes, without an external
+profiler. Once enabled, every call to the ``process`` method of the
+processors of yodel is recorded::
+
+    with yodel.instrument.profiling():
+        pipeline.process(input_signal, output_signal)
+    print(yodel.instrument.stats())
+
+The measurement wraps the ``process`` methods of the processor classes
+while enabled and restores them when disabled, so that it costs nothing
+otherwise.
+"""
+
+import contextlib
+import functools
+import threading
+import time
+import tracemalloc
+import weakref
+import yodel.analysis
+import yodel.delay
+import yodel.filter
+import yodel.graph
+import yodel.reverb
+
+_MODULES = [yodel.analysis, yodel.delay, yodel.filter, yodel.graph,
+            yodel.reverb]
+
+_originals = {}
+_labels = weakref.WeakKeyDictionary()
+_stats = {}
+_lock = threading.Lock()
+_local = threading.local()
+_tracing = False
+_started = False
+
+
+def _processor_classes():
+    """
+    Get the classes of yodel defining a ``process`` method.
+    """
+    for module in _MODULES:
+        for value in vars(module).values():
+            if (isinstance(value, type) and
+                    value.__module__ == module.__name__ and
+                    'process' in vars(value)):
+                yield value
+
+
+def _record(label, samples, elapsed, memory):
+    """
+    Add a call to the statistics of a label.
+    """
+    with _lock:
+        entry = _stats.get(label)
+        if entry is None:
+            entry = {'calls': 0, 'samples': 0, 'total_time': 0.0,
+                     'max_time': 0.0}
+            _stats[label] = entry
+        entry['calls'] += 1
+        entry['samples'] += samples
+        entry['total_time'] += elapsed
+        if elapsed > entry['max_time']:
+            entry['max_time'] = elapsed
+        if memory is not None and memory > entry.get('max_memory', 0):
+            entry['max_memory'] = memory
+
+
+def _memory_stack():
+    """
+    Get the memory measurements of the calls in progress in the current
+    thread, innermost last.
+    """
+    stack = getattr(_local, 'memory', None)
+    if stack is None:
+        stack = []
+        _local.memory = stack
+    return stack
+
+
+def _wrap(cls, process):
+    """
+    Create the measuring version of a ``process`` method.
+    """
+    name = cls.__name__
+
+    @functools.wraps(process)
+    def measured(self, input_signal, *args, **kwargs):
+        memory = None
+        stack = None
+        if _tracing:
+            stack = _memory_stack()
+            (current, peak) = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            stack.append([current, current])
+        start = time.perf_counter()
+        try:
+            return process(self, input_signal, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if stack:
+                (start_memory, peak) = stack.pop()
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                memory = max(peak - start_memory, 0)
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+            _record(_labels.get(self, name), len(input_signal), elapsed,
+                    memory)
+    return measured
+
+
+def enable(memory=False):
+    """
+    Start recording the calls to the ``process`` methods.
+
+    :param memory: also record the peak memory allocated during the calls,
+                   with :py:mod:`tracemalloc` (much slower; the allocations
+                   of concurrent threads are counted together)
+    """
+    global _tracing, _started
+    if not _originals:
+        for cls in _processor_classes():
+            process = vars(cls)['process']
+            _originals[cls] = process
+            cls.process = _wrap(cls, process)
+    if memory and not _tracing:
+        _tracing = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started = True
+
+
+def disable():
+    """
+    Stop recording and restore the original ``process`` methods. The
+    statistics are kept until :py:func:`reset`.
+    """
+    global _tracing, _started
+    for (cls, process) in _originals.items():
+        cls.process = process
+    _originals.clear()
+    if _started:
+        tracemalloc.stop()
+    _tracing = False
+    _started = False
+
+
+def is_enabled():
+    """
+    Check whether the calls are being recorded.
+
+    :rtype: bool
+    """
+    return bool(_originals)
+
+
+def reset():
+    """
+    Clear the statistics.
+    """
+    with _lock:
+        _stats.clear()
+
+
+def label(processor, name):
+    """
+    Record the calls of a processor under its own name instead of the name
+    of its class, to tell apart several processors of the same class.
+
+    :param processor: processor
+    :param name: name of the processor in the statistics
+    """
+    _labels[processor] = name
+
+
+def stats():
+    """
+    Get a snapshot of the statistics: for every processor name, the number
+    of calls, the number of processed samples, the total and maximum time
+    of a call in s and, when recording memory, the maximum memory allocated
+    during a call in bytes. The time of a processor includes the time of
+    the processors it calls, such as the stages of a pipeline.
+
+    :return: dictionary of statistics by processor name
+    """
+    snapshot = {}
+    with _lock:
+        for (name, entry) in _stats.items():
+            entry = dict(entry)
+            entry['mean_time'] = entry['total_time'] / entry['calls']
+            snapshot[name] = entry
+    return snapshot
+
+
+@contextlib.contextmanager
+def profiling(memory=False):
+    """
+    Record the calls within a ``with`` block.
+
+    :param memory: also record the peak memory allocated during the calls
+    """
+    enable(memory)
+    try:
+        yield
+    finally:
+        disable()
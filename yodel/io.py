@@ -0,0 +1,287 @@
+"""
+This module provides classes for streaming signals from and to WAV files,
+one block at a time, so that files of any length are processed with a
+constant amount of memory.
+"""
+
+import array
+import mmap
+import struct
+import sys
+import yodel.buffer
+
+_PCM = 1
+_FLOAT = 3
+_EXTENSIBLE = 0xFFFE
+
+_FORMATS = {
+    'pcm16': (_PCM, 16),
+    'pcm24': (_PCM, 24),
+    'pcm32': (_PCM, 32),
+    'float32': (_FLOAT, 32),
+}
+
+
+def _decode(data, sample_format):
+    """
+    Decode little-endian interleaved samples to floats in [-1, 1).
+    """
+    if sample_format == 'pcm24':
+        data = bytes(data)
+        widened = bytearray(len(data) // 3 * 4)
+        widened[1::4] = data[0::3]
+        widened[2::4] = data[1::3]
+        widened[3::4] = data[2::3]
+        data = widened
+        sample_format = 'pcm32'
+    typecode = {'pcm16': 'h', 'pcm32': 'i', 'float32': 'f'}[sample_format]
+    if sys.byteorder == 'little':
+        samples = memoryview(data).cast(typecode).tolist()
+    else:
+        samples = array.array(typecode, bytes(data))
+        samples.byteswap()
+        samples = samples.tolist()
+    if sample_format == 'pcm16':
+        scale = 1.0 / 32768.0
+    elif sample_format == 'pcm32':
+        scale = 1.0 / 2147483648.0
+    else:
+        return samples
+    return [sample * scale for sample in samples]
+
+
+def _encode(samples, sample_format):
+    """
+    Encode floats in [-1, 1] to little-endian interleaved samples.
+    """
+    if sample_format == 'float32':
+        data = array.array('f', samples)
+    else:
+        if sample_format == 'pcm16':
+            (typecode, scale) = ('h', 32768.0)
+        else:
+            (typecode, scale) = ('i', 2147483648.0)
+        high = scale - 1.0
+        data = array.array(typecode, [
+            int(round(min(max(sample * scale, -scale), high)))
+            for sample in samples])
+    if sys.byteorder != 'little':
+        data.byteswap()
+    data = data.tobytes()
+    if sample_format == 'pcm24':
+        packed = bytearray(len(data) // 4 * 3)
+        packed[0::3] = data[1::4]
+        packed[1::3] = data[2::4]
+        packed[2::3] = data[3::4]
+        data = bytes(packed)
+    return data
+
+
+class WaveReader:
+    """
+    A wave reader decodes a WAV file block after block. The file is mapped
+    in memory instead of being loaded, so only the samples of the current
+    block are decoded.
+
+    Supported sample formats are 16, 24 and 32 bits integer PCM ('pcm16',
+    'pcm24' and 'pcm32') and 32 bits floating point ('float32').
+    """
+
+    def __init__(self, filename):
+        """
+        Open a WAV file for reading.
+
+        :param filename: path of the WAV file
+        """
+        self._file = open(filename, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+        self.position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _parse(self):
+        """
+        Parse the RIFF chunks of the file.
+        """
+        if self._map[0:4] != b'RIFF' or self._map[8:12] != b'WAVE':
+            raise ValueError('not a WAV file')
+        fmt = None
+        offset = 12
+        while offset + 8 <= len(self._map):
+            (chunk, size) = struct.unpack('<4sI',
+                                          self._map[offset:offset + 8])
+            offset += 8
+            if chunk == b'fmt ':
+                fmt = self._map[offset:offset + size]
+            elif chunk == b'data':
+                if fmt is None:
+                    raise ValueError('missing fmt chunk')
+                self._data = offset
+                size = min(size, len(self._map) - offset)
+                break
+            offset += size + (size & 1)
+        else:
+            raise ValueError('missing data chunk')
+
+        (tag, self.channels, self.samplerate) = struct.unpack('<HHI',
+                                                              fmt[0:8])
+        (self._frame_size, bits) = struct.unpack('<HH', fmt[12:16])
+        if tag == _EXTENSIBLE:
+            tag = struct.unpack('<H', fmt[24:26])[0]
+        for (name, (format_tag, format_bits)) in _FORMATS.items():
+            if tag == format_tag and bits == format_bits:
+                self.sample_format = name
+                break
+        else:
+            raise ValueError('unsupported sample format: %d bits, tag %d' %
+                             (bits, tag))
+        self.frames = size // self._frame_size
+
+    def seek(self, frame):
+        """
+        Move to a frame of the file.
+
+        :param frame: index of the next frame to read
+        """
+        if frame < 0 or frame > self.frames:
+            raise ValueError('frame out of range: %d' % frame)
+        self.position = frame
+
+    def read(self, output_signals):
+        """
+        Decode the next block of the file. The block is as long as the
+        output signals, or shorter at the end of the file, in which case the
+        remaining samples of the output signals are left unchanged.
+
+        :param output_signals: output signal of every channel
+        :return: number of decoded frames
+        """
+        frames = min(len(output_signals[0]), self.frames - self.position)
+        start = self._data + self.position * self._frame_size
+        with memoryview(self._map) as view:
+            samples = _decode(view[start:start + frames * self._frame_size],
+                              self.sample_format)
+        for channel in range(0, self.channels):
+            yodel.buffer.assign(samples[channel::self.channels],
+                                output_signals[channel])
+        self.position += frames
+        return frames
+
+    def blocks(self, blocksize):
+        """
+        Iterate over the remaining blocks of the file.
+
+        :param blocksize: number of frames of a block
+        :return: iterator over lists of signals, one for every channel
+        """
+        while self.position < self.frames:
+            signals = [[0.0] * min(blocksize, self.frames - self.position)
+                       for channel in range(0, self.channels)]
+            self.read(signals)
+            yield signals
+
+    def close(self):
+        """
+        Close the file.
+        """
+        self._map.close()
+        self._file.close()
+
+
+class WaveWriter:
+    """
+    A wave writer encodes a WAV file block after block. The sizes in the
+    header are written when the file is closed.
+    """
+
+    def __init__(self, filename, samplerate, channels, sample_format='pcm16'):
+        """
+        Create a WAV file for writing.
+
+        :param filename: path of the WAV file
+        :param samplerate: sample-rate in Hz
+        :param channels: number of channels
+        :param sample_format: 'pcm16', 'pcm24', 'pcm32' or 'float32'
+        """
+        if sample_format not in _FORMATS:
+            raise ValueError('unsupported sample format: %s' % sample_format)
+        self.samplerate = samplerate
+        self.channels = channels
+        self.sample_format = sample_format
+        self.frames = 0
+        (self._tag, bits) = _FORMATS[sample_format]
+        self._frame_size = channels * bits // 8
+        self._file = open(filename, 'wb')
+        self._write_header(bits)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_header(self, bits):
+        """
+        Write the header, with sizes to be updated on close.
+        """
+        fmt = struct.pack('<HHIIHH', self._tag, self.channels,
+                          self.samplerate,
+                          self.samplerate * self._frame_size,
+                          self._frame_size, bits)
+        if self._tag == _FLOAT:
+            fmt += struct.pack('<H', 0)
+        self._file.write(b'RIFF' + struct.pack('<I', 0) + b'WAVE')
+        self._file.write(b'fmt ' + struct.pack('<I', len(fmt)) + fmt)
+        self._fact = None
+        if self._tag == _FLOAT:
+            self._fact = self._file.tell() + 8
+            self._file.write(b'fact' + struct.pack('<II', 4, 0))
+        self._file.write(b'data' + struct.pack('<I', 0))
+        self._data = self._file.tell()
+
+    def write(self, input_signals):
+        """
+        Encode a block at the end of the file. Samples are clipped to
+        [-1, 1] for integer formats.
+
+        :param input_signals: input signal of every channel
+        """
+        signals = [yodel.buffer.to_list(signal) for signal in input_signals]
+        frames = len(signals[0])
+        samples = [0.0] * (frames * self.channels)
+        for channel in range(0, self.channels):
+            samples[channel::self.channels] = signals[channel][0:frames]
+        self._file.write(_encode(samples, self.sample_format))
+        self.frames += frames
+
+    def close(self):
+        """
+        Update the header and close the file.
+        """
+        if self._file.closed:
+            return
+        size = self.frames * self._frame_size
+        if size & 1:
+            self._file.write(b'\0')
+        self._file.seek(4)
+        self._file.write(struct.pack('<I', self._data - 8 + size + (size & 1)))
+        if self._fact is not None:
+            self._file.seek(self._fact)
+            self._file.write(struct.pack('<I', self.frames))
+        self._file.seek(self._data - 4)
+        self._file.write(struct.pack('<I', size))
+        self._file.close()
@@ -0,0 +1,117 @@
+"""
+This module provides a monitor checking that processors keep up with
+real-time processing, such as in a live audio callback.
+"""
+
+import collections
+import time
+
+
+class DeadlineMonitor:
+    """
+    A deadline monitor wraps a processor (or a pipeline) and times every
+    processed block against the time the block lasts: a block of
+    ``framesize`` samples must be processed within ``framesize /
+    samplerate`` seconds, otherwise the audio output drops out (overrun).
+
+    The ratio of the processing time to the block duration is the CPU load
+    of the block. The monitor keeps the rolling average and the maximum of
+    the load, counts the overruns and builds a histogram of the loads. An
+    overrun callback lets the application react, for instance by lowering
+    the processing quality.
+    """
+
+    def __init__(self, processor, samplerate, framesize, window=100,
+                 budget=1.0, bin_width=0.1, num_bins=20, on_overrun=None):
+        """
+        Create a deadline monitor.
+
+        :param processor: monitored processor, or function with the same
+                          signature as its ``process`` method
+        :param samplerate: sample-rate in Hz
+        :param framesize: number of samples of a block
+        :param window: number of blocks of the rolling average load
+        :param budget: fraction of the block duration available to the
+                       processing before an overrun
+        :param bin_width: width of the histogram bins, as a load
+        :param num_bins: number of histogram bins, the last one counting
+                         all the higher loads
+        :param on_overrun: function called after an overrun with the
+                           monitor, the processing time and the deadline in s
+        """
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        if budget <= 0.0:
+            raise ValueError('budget must be positive')
+        self.processor = processor
+        self.samplerate = samplerate
+        self.framesize = framesize
+        self.deadline = float(framesize) / samplerate
+        self.budget = budget
+        self.bin_width = bin_width
+        self.on_overrun = on_overrun
+        self.histogram = [0] * num_bins
+        self._loads = collections.deque(maxlen=window)
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the measurements.
+        """
+        self.blocks = 0
+        self.overruns = 0
+        self.load = 0.0
+        self.max_load = 0.0
+        self.histogram[0:len(self.histogram)] = [0] * len(self.histogram)
+        self._loads.clear()
+        self._sum = 0.0
+
+    def process(self, input_signal, *args):
+        """
+        Process a block with the monitored processor and time it. Blocks of
+        another length than the framesize are given a proportional deadline.
+
+        :param input_signal: input signal
+        :param args: other signals of the monitored processor
+        :return: result of the monitored processor, such as the number of
+                 samples written by a resampler
+        """
+        process = getattr(self.processor, 'process', self.processor)
+        start = time.perf_counter()
+        result = process(input_signal, *args)
+        elapsed = time.perf_counter() - start
+
+        size = len(input_signal)
+        if size == self.framesize:
+            deadline = self.deadline
+        else:
+            deadline = float(size) / self.samplerate
+        load = elapsed / deadline if deadline > 0.0 else 0.0
+
+        if len(self._loads) == self._loads.maxlen:
+            self._sum -= self._loads[0]
+        self._loads.append(load)
+        self._sum += load
+        self.blocks += 1
+        self.load = load
+        if load > self.max_load:
+            self.max_load = load
+        index = int(load / self.bin_width)
+        self.histogram[min(index, len(self.histogram) - 1)] += 1
+
+        if load > self.budget:
+            self.overruns += 1
+            if self.on_overrun is not None:
+                self.on_overrun(self, elapsed, deadline * self.budget)
+        return result
+
+    def cpu_load(self):
+        """
+        Get the average CPU load of the last blocks, in percent of the block
+        duration.
+
+        :rtype: float
+        """
+        if not self._loads:
+            return 0.0
+        return 100.0 * self._sum / len(self._loads)
@@ -0,0 +1,198 @@
+"""
+This module provides classes for processing independent signals in
+parallel.
+"""
+
+import array
+import concurrent.futures
+import multiprocessing
+import multiprocessing.shared_memory
+import yodel.buffer
+
+
+def _worker(processors, channels, blocksize, input_name, output_name,
+            control, barrier):
+    """
+    Process a subset of the channels of a :py:class:`ProcessExecutor` block
+    after block, until the executor is closed.
+    """
+    input_memory = multiprocessing.shared_memory.SharedMemory(input_name)
+    output_memory = multiprocessing.shared_memory.SharedMemory(output_name)
+    inputs = input_memory.buf.cast('d')
+    outputs = output_memory.buf.cast('d')
+    try:
+        while True:
+            barrier.wait()
+            size = control[0]
+            if size < 0:
+                break
+            for (processor, channel) in zip(processors, channels):
+                start = channel * blocksize
+                output = [0.0] * size
+                processor.process(inputs[start:start + size], output)
+                outputs[start:start + size] = array.array('d', output)
+            barrier.wait()
+    except Exception:
+        barrier.abort()
+        raise
+    finally:
+        inputs.release()
+        outputs.release()
+        input_memory.close()
+        output_memory.close()
+
+
+class ProcessExecutor:
+    """
+    A process executor processes independent channels, each with its own
+    processor (for instance a :py:class:`yodel.graph.Pipeline`), on a pool of
+    worker processes.
+
+    The processors are moved to the workers once, where their state then
+    stays. The signal blocks are exchanged through shared memory and every
+    block is synchronized by a barrier, so that all the channels stay
+    sample-aligned.
+    """
+
+    def __init__(self, processors, blocksize, workers=None):
+        """
+        Create a process executor and start its workers.
+
+        :param processors: one processor per channel
+        :param blocksize: maximum length of the processed blocks
+        :param workers: number of worker processes (default: number of CPUs,
+                        at most one per channel)
+        """
+        self.channels = len(processors)
+        self.blocksize = blocksize
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        self.workers = max(min(workers, self.channels), 1)
+
+        nbytes = max(self.channels * blocksize, 1) * 8
+        self._input_memory = multiprocessing.shared_memory.SharedMemory(
+            create=True, size=nbytes)
+        self._output_memory = multiprocessing.shared_memory.SharedMemory(
+            create=True, size=nbytes)
+        self._inputs = self._input_memory.buf.cast('d')
+        self._outputs = self._output_memory.buf.cast('d')
+        self._control = multiprocessing.RawArray('l', 1)
+        self._barrier = multiprocessing.Barrier(self.workers + 1)
+
+        self._processes = []
+        for worker in range(0, self.workers):
+            channels = list(range(worker, self.channels, self.workers))
+            process = multiprocessing.Process(
+                target=_worker,
+                args=([processors[channel] for channel in channels], channels,
+                      blocksize, self._input_memory.name,
+                      self._output_memory.name, self._control, self._barrier))
+            process.daemon = True
+            process.start()
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def process(self, input_signals, output_signals):
+        """
+        Process one block of every channel.
+
+        :param input_signals: input signal of every channel
+        :param output_signals: output signal of every channel
+        """
+        size = len(input_signals[0])
+        if size > self.blocksize:
+            raise ValueError('block longer than %d samples' % self.blocksize)
+
+        for channel in range(0, self.channels):
+            start = channel * self.blocksize
+            self._inputs[start:start + size] = array.array(
+                'd', yodel.buffer.to_list(input_signals[channel])[0:size])
+        self._control[0] = size
+        self._barrier.wait()
+        self._barrier.wait()
+
+        for channel in range(0, self.channels):
+            start = channel * self.blocksize
+            yodel.buffer.assign(self._outputs[start:start + size].tolist(),
+                                output_signals[channel])
+
+    def close(self):
+        """
+        Stop the workers and release the shared memory.
+        """
+        if not self._processes:
+            return
+        self._control[0] = -1
+        try:
+            self._barrier.wait()
+        except Exception:
+            pass
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        self._inputs.release()
+        self._outputs.release()
+        self._input_memory.close()
+        self._output_memory.close()
+        self._input_memory.unlink()
+        self._output_memory.unlink()
+
+
+class ThreadedPipeline:
+    """
+    A threaded pipeline processes independent channels, each with its own
+    processor, on a pool of threads.
+
+    Threads share the processors and the signals without any copy, but they
+    only run concurrently while a processor does not hold the global
+    interpreter lock. Processors written in pure Python hold it, so this is
+    only faster than a serial loop for processors calling native kernels
+    that release it; otherwise see :py:class:`ProcessExecutor`.
+    """
+
+    def __init__(self, processors, workers=None):
+        """
+        Create a threaded pipeline and start its threads.
+
+        :param processors: one processor per channel
+        :param workers: number of threads (default: number of CPUs, at most
+                        one per channel)
+        """
+        self.processors = processors
+        self.channels = len(processors)
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        self.workers = max(min(workers, self.channels), 1)
+        self._executor = concurrent.futures.ThreadPoolExecutor(self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def process(self, input_signals, output_signals):
+        """
+        Process one block of every channel.
+
+        :param input_signals: input signal of every channel
+        :param output_signals: output signal of every channel
+        """
+        futures = [self._executor.submit(getattr(processor, 'process',
+                                                 processor),
+                                         input_signal, output_signal)
+                   for (processor, input_signal, output_signal)
+                   in zip(self.processors, input_signals, output_signals)]
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """
+        Stop the threads.
+        """
+        self._executor.shutdown()
@@ -0,0 +1,251 @@
+"""
+This module renders WAV files through a processing chain described in JSON,
+processing several files in parallel. It can be run from the command line::
+
+    python -m yodel.render chain.json 'input/*.wav' -o output
+
+A chain specification lists the stages applied in order to every channel::
+
+    {
+        "blocksize": 1024,
+        "sample_format": "pcm24",
+        "chain": [
+            {"type": "single_pole", "mode": "high_pass", "frequency": 20},
+            {"type": "parametric_eq", "bands": [
+                {"frequency": 100, "q": 0.7, "gain": 3.0},
+                {"frequency": 1000, "q": 1.0, "gain": -2.0},
+                {"frequency": 8000, "q": 0.7, "gain": 1.5}]},
+            {"type": "biquad", "mode": "low_pass", "frequency": 18000,
+             "q": 0.707},
+            {"type": "fast_convolution", "impulse_response": "room.wav"},
+            {"type": "delay", "delay": 5.0},
+            {"type": "gain", "gain": -3.0}
+        ]
+    }
+
+Biquad modes taking a gain ('peak', 'low_shelf' and 'high_shelf') also read
+a "gain" in dB. Impulse responses are either lists of samples or WAV files,
+of which the first channel is used. The output files keep the sample format
+of the input files unless "sample_format" is given.
+
+The output files are longer than the input files by the tail of the chain,
+so that convolutions and delays are not cut off: the length of the impulse
+responses and the delays are rendered after the end of the input. An extra
+"tail" in seconds can be given for the decay of recursive filters.
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+import yodel.conversion
+import yodel.delay
+import yodel.filter
+import yodel.graph
+import yodel.io
+
+
+def _impulse_response(value):
+    """
+    Load an impulse response given as a list of samples or a WAV file.
+    """
+    if not isinstance(value, str):
+        return value
+    with yodel.io.WaveReader(value) as reader:
+        signal = [0.0] * reader.frames
+        reader.read([signal] + [[0.0] * reader.frames] * (reader.channels - 1))
+    return signal
+
+
+def _gain(dbgain):
+    """
+    Create a processor applying a gain in dB.
+    """
+    gain = yodel.conversion.db2lin(dbgain)
+
+    def process(input_signal, output_signal):
+        output_signal[0:len(input_signal)] = [gain * sample
+                                              for sample in input_signal]
+    return process
+
+
+def _stage(stage, samplerate, blocksize):
+    """
+    Create the processor of a stage specification.
+    """
+    kind = stage.get('type')
+    if kind == 'single_pole':
+        flt = yodel.filter.SinglePole()
+        getattr(flt, stage.get('mode', 'low_pass'))(samplerate,
+                                                    stage['frequency'])
+    elif kind == 'biquad':
+        flt = yodel.filter.Biquad()
+        mode = stage.get('mode', 'low_pass')
+        args = [samplerate, stage['frequency'], stage.get('q', 0.707)]
+        if mode in ('peak', 'low_shelf', 'high_shelf'):
+            args.append(stage.get('gain', 0.0))
+        getattr(flt, mode)(*args)
+    elif kind == 'parametric_eq':
+        bands = stage['bands']
+        flt = yodel.filter.ParametricEQ(samplerate, len(bands))
+        for (index, band) in enumerate(bands):
+            flt.set_band(index, band['frequency'], band.get('q', 0.707),
+                         band.get('gain', 0.0))
+    elif kind == 'fast_convolution':
+        flt = yodel.filter.FastConvolution(
+            blocksize, _impulse_response(stage['impulse_response']))
+    elif kind == 'delay':
+        flt = yodel.delay.DelayLine(samplerate, stage['delay'],
+                                    stage['delay'])
+    elif kind == 'gain':
+        flt = _gain(stage['gain'])
+    else:
+        raise ValueError('unknown stage type: %s' % kind)
+    return flt
+
+
+def build_chain(spec, samplerate):
+    """
+    Create the processing chain of one channel.
+
+    :param spec: chain specification
+    :param samplerate: sample-rate in Hz
+    :rtype: :py:class:`yodel.graph.Pipeline`
+    """
+    blocksize = spec.get('blocksize', 1024)
+    pipeline = yodel.graph.Pipeline()
+    for stage in spec.get('chain', []):
+        pipeline.add(_stage(stage, samplerate, blocksize))
+    return pipeline
+
+
+def chain_tail(spec, pipeline, samplerate):
+    """
+    Get the number of samples a processing chain keeps producing after the
+    end of its input.
+
+    :param spec: chain specification
+    :param pipeline: processing chain of the specification
+    :param samplerate: sample-rate in Hz
+    :return: number of samples
+    """
+    tail = int(math.ceil(spec.get('tail', 0.0) * samplerate))
+    for (processor, inputs, in_place) in pipeline.stages:
+        if isinstance(processor, yodel.filter.FastConvolution):
+            tail += processor.irsize - 1
+        elif isinstance(processor, yodel.delay.DelayLine):
+            tail += int(math.ceil(processor.sampledelay))
+    return tail
+
+
+def render_file(spec, input_filename, output_filename):
+    """
+    Stream a WAV file through the processing chain, one block at a time,
+    followed by the tail of the chain.
+
+    :param spec: chain specification
+    :param input_filename: path of the input WAV file
+    :param output_filename: path of the output WAV file
+    :return: number of written frames, sample-rate in Hz and processing
+             time in s
+    """
+    if os.path.abspath(input_filename) == os.path.abspath(output_filename):
+        raise ValueError('output would overwrite input: %s' % input_filename)
+    blocksize = spec.get('blocksize', 1024)
+    start = time.perf_counter()
+    with yodel.io.WaveReader(input_filename) as reader:
+        chains = [build_chain(spec, reader.samplerate)
+                  for channel in range(0, reader.channels)]
+        sample_format = spec.get('sample_format', reader.sample_format)
+        with yodel.io.WaveWriter(output_filename, reader.samplerate,
+                                 reader.channels, sample_format) as writer:
+            signals = [[0.0] * blocksize
+                       for channel in range(0, reader.channels)]
+            total = reader.frames + chain_tail(spec, chains[0],
+                                               reader.samplerate)
+            written = 0
+            while written < total:
+                for signal in signals:
+                    signal[0:blocksize] = [0.0] * blocksize
+                reader.read(signals)
+                frames = min(blocksize, total - written)
+                for (chain, signal) in zip(chains, signals):
+                    chain.process(signal, signal)
+                writer.write([signal[0:frames] for signal in signals])
+                written += frames
+    return (written, reader.samplerate, time.perf_counter() - start)
+
+
+def main(argv=None):
+    """
+    Run the command line renderer.
+
+    :param argv: command line arguments (default: :py:data:`sys.argv`)
+    :return: exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m yodel.render',
+        description='Render WAV files through a yodel processing chain.')
+    parser.add_argument('spec', help='JSON chain specification')
+    parser.add_argument('inputs', nargs='+', help='input WAV files or globs')
+    parser.add_argument('-o', '--output', required=True,
+                        help='output directory, receiving the rendered files '
+                             'under the names of the inputs')
+    parser.add_argument('-j', '--jobs', type=int,
+                        default=multiprocessing.cpu_count(),
+                        help='number of worker processes (default: CPUs)')
+    args = parser.parse_args(argv)
+
+    with open(args.spec) as spec_file:
+        spec = json.load(spec_file)
+    filenames = []
+    paths = set()
+    for pattern in args.inputs:
+        for filename in sorted(glob.glob(pattern)) or [pattern]:
+            path = os.path.abspath(filename)
+            if path not in paths:
+                paths.add(path)
+                filenames.append(filename)
+    outputs = {}
+    for filename in filenames:
+        output = os.path.join(args.output, os.path.basename(filename))
+        if output in outputs:
+            parser.error('%s and %s would both be rendered to %s' % (
+                outputs[output], filename, output))
+        outputs[output] = filename
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
+
+    status = 0
+    duration = 0.0
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max(args.jobs, 1)) as pool:
+        futures = {}
+        for (output, filename) in outputs.items():
+            futures[pool.submit(render_file, spec, filename, output)] = \
+                filename
+        for future in concurrent.futures.as_completed(futures):
+            filename = futures[future]
+            try:
+                (frames, samplerate, elapsed) = future.result()
+            except Exception as error:
+                sys.stderr.write('%s: error: %s\n' % (filename, error))
+                status = 1
+                continue
+            seconds = float(frames) / samplerate
+            duration += seconds
+            print('%s: %.2f s rendered in %.2f s (%.1fx realtime)' % (
+                filename, seconds, elapsed, seconds / max(elapsed, 1e-9)))
+    elapsed = time.perf_counter() - start
+    print('total: %d files, %.2f s rendered in %.2f s (%.1fx realtime)' % (
+        len(filenames), duration, elapsed, duration / max(elapsed, 1e-9)))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
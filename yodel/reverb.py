@@ -0,0 +1,229 @@
+"""
+This module provides classes for artificial reverberation.
+"""
+
+import array
+import math
+import operator
+import yodel.buffer
+
+
+def _next_prime(number):
+    """
+    Find the smallest prime number greater than or equal to a given number.
+    """
+    number = max(int(number), 2)
+    while True:
+        divisor = 2
+        while divisor * divisor <= number:
+            if number % divisor == 0:
+                break
+            divisor += 1
+        else:
+            return number
+        number += 1
+
+
+class FDN:
+    """
+    A feedback delay network (FDN) reverberator is made of several delay
+    lines whose outputs are mixed by an orthogonal feedback matrix and fed
+    back to their inputs. Every delay line is attenuated so that the
+    reverberation decays by 60 dB after the given reverberation time.
+
+    The following feedback matrices are available:
+
+    * 'householder': reflection matrix I - 2/N (default)
+    * 'hadamard': normalized Hadamard matrix (number of lines must be a
+      power of two)
+
+    The matrices are never built: the Householder matrix is applied with a
+    single sum and the Hadamard matrix with a fast Walsh-Hadamard transform.
+
+    All the delay lines are stored in one contiguous buffer. Since no sample
+    comes back to the inputs before the shortest delay, blocks of up to this
+    length are processed at once.
+
+    *References:*
+        "Digital Delay Networks for Designing Artificial Reverberators",
+        J.-M. Jot and A. Chaigne, 90th AES Convention, 1991
+
+        "Physical Audio Signal Processing",
+        Julius O. Smith
+        (https://ccrma.stanford.edu/~jos/pasp/Feedback_Delay_Networks_FDN.html)
+    """
+
+    def __init__(self, samplerate, num_lines=8, delays=None, rt60=2.0,
+                 matrix='householder', typecode='d'):
+        """
+        Create a feedback delay network.
+
+        :param samplerate: sample-rate in Hz
+        :param num_lines: number of delay lines
+        :param delays: delay of each line in ms (default: prime number of
+                       samples between 30 and 50 ms)
+        :param rt60: reverberation time in seconds
+        :param matrix: feedback matrix ('householder' or 'hadamard')
+        :param typecode: type of the stored samples, 'd' or 'f' (see
+                         :py:mod:`yodel.buffer`)
+        """
+        self.samplerate = samplerate
+        self.num_lines = num_lines
+        self.rt60 = rt60
+        self.typecode = typecode
+        self.set_matrix(matrix)
+        self.set_delays(delays)
+
+    def reset(self):
+        """
+        Clear the delay lines with zeros.
+        """
+        self.buffer[0:len(self.buffer)] = yodel.buffer.zeros(len(self.buffer),
+                                                             self.typecode)
+        self._positions = [0] * self.num_lines
+
+    def set_matrix(self, matrix):
+        """
+        Change the feedback matrix.
+
+        :param matrix: feedback matrix ('householder' or 'hadamard')
+        """
+        if matrix == 'hadamard':
+            if self.num_lines & (self.num_lines - 1):
+                raise ValueError("hadamard matrix needs a power of two lines")
+        elif matrix != 'householder':
+            raise ValueError("unknown feedback matrix: %s" % matrix)
+        self.matrix = matrix
+
+    def set_delays(self, delays=None):
+        """
+        Change the delay of each line. The delays are rounded to an integer
+        number of samples and the delay lines are cleared.
+
+        :param delays: delay of each line in ms (default: prime number of
+                       samples between 30 and 50 ms)
+        """
+        if delays is None:
+            delays = []
+            for k in range(0, self.num_lines):
+                ratio = 5.0 / 3.0
+                if self.num_lines > 1:
+                    ratio **= float(k) / (self.num_lines - 1)
+                samples = _next_prime(0.03 * ratio * self.samplerate)
+                delays.append(samples * 1000.0 / self.samplerate)
+        if len(delays) != self.num_lines:
+            raise ValueError("expected %d delays" % self.num_lines)
+
+        self.delays = list(delays)
+        self._sampledelays = [
+            max(int(round(delay * self.samplerate / 1000.0)), 1)
+            for delay in self.delays]
+        self._offsets = [0] * self.num_lines
+        for k in range(1, self.num_lines):
+            self._offsets[k] = (self._offsets[k - 1] +
+                                self._sampledelays[k - 1])
+        self.min_delay = min(self._sampledelays)
+        self.buffer = yodel.buffer.zeros(sum(self._sampledelays),
+                                         self.typecode)
+        self._positions = [0] * self.num_lines
+        self.set_rt60(self.rt60)
+
+    def set_rt60(self, rt60):
+        """
+        Change the reverberation time.
+
+        :param rt60: time in seconds for the reverberation to decay by 60 dB
+        """
+        self.rt60 = rt60
+        self.gains = [math.pow(10.0, -3.0 * delay / (rt60 * self.samplerate))
+                      for delay in self._sampledelays]
+
+    def process_sample(self, input_sample):
+        """
+        Reverberate an input sample.
+
+        :param input_sample: input sample
+        :return: reverberated sample
+        """
+        return self._process_block([input_sample])[0]
+
+    def process(self, input_signal, output_signal):
+        """
+        Reverberate an input signal.
+
+        :param input_signal: input signal
+        :param output_signal: reverberated signal
+        """
+        input_signal = yodel.buffer.to_list(input_signal)
+        output = []
+        for start in range(0, len(input_signal), self.min_delay):
+            output += self._process_block(
+                input_signal[start:start + self.min_delay])
+        yodel.buffer.assign(output, output_signal)
+
+    def _process_block(self, input_signal):
+        """
+        Process a block no longer than the shortest delay line.
+        """
+        size = len(input_signal)
+        buf = self.buffer
+        num_lines = self.num_lines
+
+        lines = []
+        for k in range(0, num_lines):
+            offset = self._offsets[k]
+            length = self._sampledelays[k]
+            pos = self._positions[k]
+            end = pos + size
+            if end <= length:
+                line = buf[offset + pos:offset + end].tolist()
+            else:
+                line = (buf[offset + pos:offset + length].tolist() +
+                        buf[offset:offset + end - length].tolist())
+            lines.append(line)
+
+        output = lines[0]
+        for k in range(1, num_lines):
+            if k & 1:
+                output = list(map(operator.sub, output, lines[k]))
+            else:
+                output = list(map(operator.add, output, lines[k]))
+        norm = 1.0 / math.sqrt(num_lines)
+        output = [norm * out for out in output]
+
+        if self.matrix == 'householder':
+            feedback = [[gain * out for out in line]
+                        for (gain, line) in zip(self.gains, lines)]
+            scale = 2.0 / num_lines
+            total = [scale * sum(outs) for outs in zip(*feedback)]
+            feedback = [list(map(operator.sub, line, total))
+                        for line in feedback]
+        else:
+            feedback = [[gain * norm * out for out in line]
+                        for (gain, line) in zip(self.gains, lines)]
+            half = 1
+            while half < num_lines:
+                for i in range(0, num_lines, 2 * half):
+                    for j in range(i, i + half):
+                        first = feedback[j]
+                        second = feedback[j + half]
+                        feedback[j] = list(map(operator.add, first, second))
+                        feedback[j + half] = list(map(operator.sub, first,
+                                                      second))
+                half *= 2
+
+        for k in range(0, num_lines):
+            line = array.array(self.typecode, map(operator.add, input_signal,
+                                                  feedback[k]))
+            offset = self._offsets[k]
+            length = self._sampledelays[k]
+            pos = self._positions[k]
+            end = pos + size
+            if end <= length:
+                buf[offset + pos:offset + end] = line
+            else:
+                buf[offset + pos:offset + length] = line[0:length - pos]
+                buf[offset:offset + end - length] = line[length - pos:]
+            self._positions[k] = end % length
+
+        return output
@@ -0,0 +1,95 @@
+"""
+This module provides adapters for using processors from asyncio code, such
+as network services receiving audio blocks from many connections.
+"""
+
+import asyncio
+import functools
+
+_END = object()
+
+
+class AsyncProcessor:
+    """
+    An async processor processes the blocks of one stream with a processor,
+    without blocking the event loop: the processing runs in an executor
+    while the event loop serves other streams.
+
+    The processor keeps its state between blocks, which are processed one at
+    a time and in order, even when several coroutines submit blocks.
+    """
+
+    def __init__(self, processor, executor=None, queue_size=4):
+        """
+        Create an async processor.
+
+        :param processor: processor, or function with the same signature as
+                          its ``process`` method
+        :param executor: executor running the processing (default: the
+                         default executor of the event loop), or False to
+                         process in the event loop, for light processors
+        :param queue_size: maximum number of blocks read ahead from a stream
+        """
+        if queue_size < 1:
+            raise ValueError('queue size must be at least 1')
+        self.processor = processor
+        self.executor = executor
+        self.queue_size = queue_size
+        self._lock = None
+
+    def _process(self, input_signal):
+        """
+        Process a block into a new signal.
+        """
+        output_signal = [0.0] * len(input_signal)
+        process = getattr(self.processor, 'process', self.processor)
+        process(input_signal, output_signal)
+        return output_signal
+
+    async def process(self, input_signal):
+        """
+        Process one block.
+
+        :param input_signal: input signal
+        :return: processed signal
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.executor is False:
+                return self._process(input_signal)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, functools.partial(self._process, input_signal))
+
+    async def stream(self, blocks):
+        """
+        Process a stream of blocks. The next blocks are read while the
+        current one is processed, up to the queue size: a slow processing
+        stops reading the input stream instead of buffering it.
+
+        :param blocks: async iterator of input signals
+        :return: async iterator of processed signals
+        """
+        queue = asyncio.Queue(self.queue_size)
+
+        async def read():
+            try:
+                async for block in blocks:
+                    await queue.put(block)
+            except Exception as error:
+                await queue.put(error)
+            else:
+                await queue.put(_END)
+
+        reader = asyncio.ensure_future(read())
+        try:
+            while True:
+                block = await queue.get()
+                if block is _END:
+                    break
+                if isinstance(block, Exception):
+                    raise block
+                yield await self.process(block)
+        finally:
+            reader.cancel()